@@ -0,0 +1,315 @@
+"""
+Benchmark fixtures: a players dump, projections, league, rosters, users, drafts and a full
+12-team auction pick log, stored as one JSON file per endpoint.
+
+- synthetic(n_players, seed) builds a deterministic, Sleeper-shaped set without any network
+  access; the generator deliberately uses nothing from the package, so a fixture doesn't
+  change when the code under test does
+- record(...) pulls a real league (and its draft) from the API and anonymizes it
+- save/load read and write a fixture directory; ROUTES maps each file to the request path
+  the fetchers use, which is what the stub server in run.py serves
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+
+LEAGUE_ID = "100000000000000001"
+DRAFT_ID = "200000000000000001"
+SEASON = "2025"
+SEASON_TYPE = "regular"
+SPORT = "nfl"
+BUDGET = 200
+TEAMS = 12
+ROSTER_POSITIONS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"] + ["BN"] * 6
+
+FILES = ("players", "projections", "league", "rosters", "users", "drafts", "draft", "picks")
+
+NFL_TEAMS = ["ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB", "HOU", "IND",
+             "JAX", "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF",
+             "TB", "TEN", "WAS"]
+# share of the dump at each position; most of a real dump never sees a fantasy roster
+POSITION_MIX = [("QB", 0.06), ("RB", 0.10), ("WR", 0.15), ("TE", 0.08), ("K", 0.03),
+                ("OL", 0.18), ("DL", 0.14), ("LB", 0.12), ("DB", 0.14)]
+# per-position projection: (season points for the best player, decay per rank, stat keys)
+PROJECTION_SHAPE = {
+    "QB": (380.0, 0.035, ["pass_yd", "pass_td", "pass_int", "pass_att", "pass_cmp", "rush_yd", "rush_td", "fum_lost"]),
+    "RB": (300.0, 0.030, ["rush_yd", "rush_td", "rush_att", "rec", "rec_yd", "rec_td", "rec_tgt", "fum_lost"]),
+    "WR": (310.0, 0.025, ["rec", "rec_yd", "rec_td", "rec_tgt", "rush_yd", "fum_lost"]),
+    "TE": (240.0, 0.045, ["rec", "rec_yd", "rec_td", "rec_tgt", "fum_lost"]),
+    "K": (150.0, 0.020, ["fgm", "fgm_30_39", "fgm_40_49", "fgm_50p", "xpm", "fgmiss"]),
+    "DEF": (140.0, 0.030, ["def_int", "def_sack", "def_td", "def_fum_rec", "pts_allow_14_20", "def_st_td"]),
+}
+SCORING_SETTINGS = {
+    "pass_yd": 0.04, "pass_td": 4.0, "pass_int": -1.0, "rush_yd": 0.1, "rush_td": 6.0, "rec": 1.0, "rec_yd": 0.1,
+    "rec_td": 6.0, "fum_lost": -2.0, "fgm": 3.0, "fgm_40_49": 1.0, "fgm_50p": 2.0, "xpm": 1.0, "fgmiss": -1.0,
+    "def_int": 2.0, "def_sack": 1.0, "def_td": 6.0, "def_fum_rec": 2.0, "pts_allow_14_20": 1.0, "def_st_td": 6.0,
+}
+# flex slots the pick log generator fills; mirrors the roster above, not the package
+FILLS = {"QB": ["QB", "BN"], "RB": ["RB", "FLEX", "BN"], "WR": ["WR", "FLEX", "BN"], "TE": ["TE", "FLEX", "BN"],
+         "K": ["K", "BN"], "DEF": ["DEF", "BN"]}
+
+ROUTES = {
+    "players": f"/players/{SPORT}",
+    "projections": f"/projections/{SPORT}/{SEASON}?season_type={SEASON_TYPE}&order_by=pts_std",
+    "league": f"/league/{LEAGUE_ID}",
+    "rosters": f"/league/{LEAGUE_ID}/rosters",
+    "users": f"/league/{LEAGUE_ID}/users",
+    "drafts": f"/league/{LEAGUE_ID}/drafts",
+    "draft": f"/draft/{DRAFT_ID}",
+    "picks": f"/draft/{DRAFT_ID}/picks",
+}
+
+
+def _name(rng):
+    syllables = ["ka", "ro", "mi", "den", "tor", "lan", "vi", "sha", "bel", "quin", "jo", "mar", "tay", "rus"]
+    return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 3))).title()
+
+
+def _players(n_players, rng):
+    players = {}
+    positions = [pos for pos, _ in POSITION_MIX]
+    weights = [share for _, share in POSITION_MIX]
+    for i in range(n_players - len(NFL_TEAMS)):
+        pid = str(1000 + i)
+        position = rng.choices(positions, weights)[0]
+        first, last = _name(rng), _name(rng)
+        active = rng.random() > 0.3
+        players[pid] = {
+            "player_id": pid, "first_name": first, "last_name": last,
+            "search_first_name": first.lower(), "search_last_name": last.lower(),
+            "search_full_name": (first + last).lower(), "hashtag": f"#{first}{last}-NFL-{position}-{i}",
+            "number": rng.randint(1, 99), "position": position, "fantasy_positions": [position],
+            "depth_chart_position": position, "depth_chart_order": rng.randint(1, 4),
+            "status": "Active" if active else "Inactive", "active": active, "injury_status": None,
+            "injury_start_date": None, "practice_participation": None, "sport": SPORT,
+            "team": rng.choice(NFL_TEAMS) if active else None, "college": f"{_name(rng)} State",
+            "height": str(rng.randint(68, 78)), "weight": str(rng.randint(180, 320)), "age": rng.randint(21, 37),
+            "years_exp": rng.randint(0, 15), "fantasy_data_id": rng.randint(10000, 99999),
+            "rotoworld_id": rng.randint(1000, 9999), "rotowire_id": rng.randint(1000, 9999),
+            "espn_id": rng.randint(10000, 4999999), "yahoo_id": rng.randint(10000, 39999),
+            "sportradar_id": hashlib.md5(pid.encode()).hexdigest(), "stats_id": rng.randint(10000, 99999),
+            "birth_country": None, "search_rank": rng.randint(1, 9999999),
+            "metadata": {"channel_id": str(rng.getrandbits(60)), "rookie_year": str(2025 - rng.randint(0, 15))},
+            "news_updated": 1700000000000 + rng.randint(0, 10 ** 9), "competitions": [],
+        }
+    for team in NFL_TEAMS:
+        players[team] = {"player_id": team, "first_name": team, "last_name": "Defense", "position": "DEF",
+                         "fantasy_positions": ["DEF"], "team": team, "active": True, "status": "Active",
+                         "sport": SPORT, "search_full_name": team.lower()}
+    return players
+
+
+def _projections(players, rng):
+    by_position = {}
+    for pid, data in players.items():
+        if data.get("position") in PROJECTION_SHAPE and data.get("active"):
+            by_position.setdefault(data["position"], []).append(pid)
+    projections = []
+    stamp = 1754000000000
+    for position, pids in by_position.items():
+        top, decay, keys = PROJECTION_SHAPE[position]
+        rng.shuffle(pids)
+        for rank, pid in enumerate(pids):
+            points = top * (1 - decay) ** rank * rng.uniform(0.9, 1.1)
+            share = [rng.random() for _ in keys]
+            stats = {key: round(points * part / sum(share) * 3, 1) for key, part in zip(keys, share)}
+            stats.update(pts_ppr=round(points, 1), pts_std=round(points * 0.85, 1), pts_half_ppr=round(points * 0.92, 1),
+                         gp=17.0, adp_ppr=float(rank * 4 + 1))
+            data = players[pid]
+            projections.append({
+                "player_id": pid, "stats": stats, "category": "proj", "company": "rotowire", "sport": SPORT,
+                "season": SEASON, "season_type": SEASON_TYPE, "week": None, "team": data.get("team"),
+                "last_modified": stamp + len(projections), "updated_at": stamp + len(projections),
+                "player": {"first_name": data.get("first_name"), "last_name": data.get("last_name"),
+                           "position": position, "team": data.get("team"), "fantasy_positions": [position],
+                           "injury_status": None, "news_updated": data.get("news_updated")},
+            })
+    projections.sort(key=lambda item: -item["stats"]["pts_std"])
+    return projections
+
+
+def _league():
+    users = [{"user_id": f"3{i:017d}", "username": f"user{i}", "display_name": f"Team {i}", "avatar": None,
+              "metadata": {"team_name": f"Team {i}"}, "is_owner": i == 1, "league_id": LEAGUE_ID}
+             for i in range(1, TEAMS + 1)]
+    rosters = [{"roster_id": i, "owner_id": users[i - 1]["user_id"], "league_id": LEAGUE_ID, "players": [],
+                "starters": [], "reserve": None, "taxi": None, "settings": {"wins": 0, "losses": 0, "fpts": 0}}
+               for i in range(1, TEAMS + 1)]
+    league = {"league_id": LEAGUE_ID, "draft_id": DRAFT_ID, "previous_league_id": None, "name": "Benchmark League",
+              "status": "pre_draft", "sport": SPORT, "season": SEASON, "season_type": SEASON_TYPE,
+              "total_rosters": TEAMS, "roster_positions": ROSTER_POSITIONS, "scoring_settings": SCORING_SETTINGS,
+              "settings": {"num_teams": TEAMS, "type": 0}, "avatar": None}
+    draft = {"draft_id": DRAFT_ID, "league_id": LEAGUE_ID, "type": "auction", "status": "complete",
+             "sport": SPORT, "season": SEASON, "season_type": SEASON_TYPE, "start_time": 1755000000000,
+             "settings": {"budget": BUDGET, "rounds": len(ROSTER_POSITIONS), "teams": TEAMS, "slots_flex": 1},
+             "metadata": {"name": "Benchmark League", "scoring_type": "ppr"},
+             "draft_order": {user["user_id"]: i for i, user in enumerate(users, 1)},
+             "slot_to_roster_id": {str(i): i for i in range(1, TEAMS + 1)},
+             "creators": [users[0]["user_id"]], "created": 1754000000000, "last_picked": None,
+             "last_message_time": None, "last_message_id": None}
+    return league, rosters, users, draft
+
+
+def _picks(players, projections, users, rng):
+    # best projected available player that fits an open slot, priced from surplus over
+    # a rough replacement level with some noise; budgets and rosters stay legal throughout
+    points = {item["player_id"]: item["stats"]["pts_ppr"] for item in projections}
+    by_position = {}
+    for pid in points:
+        by_position.setdefault(players[pid]["position"], []).append(pid)
+    starters = {pos: ROSTER_POSITIONS.count(pos) * TEAMS for pos in FILLS}
+    surplus = {}
+    for pos, pids in by_position.items():
+        pids.sort(key=lambda pid: -points[pid])
+        line = points[pids[min(len(pids) - 1, int(starters[pos] * 1.4))]]
+        for pid in pids:
+            surplus[pid] = max(0.0, points[pid] - line)
+    total_surplus = sum(surplus.values()) or 1.0
+    spare = TEAMS * (BUDGET - len(ROSTER_POSITIONS))
+    board = sorted(points, key=lambda pid: -(surplus[pid] * 10 + points[pid] / 100))
+    slots = {team: list(ROSTER_POSITIONS) for team in range(1, TEAMS + 1)}
+    money = {team: BUDGET for team in range(1, TEAMS + 1)}
+    picks = []
+    for pick_no in range(1, TEAMS * len(ROSTER_POSITIONS) + 1):
+        team = (pick_no - 1) % TEAMS + 1
+        fits = []
+        for pid in board:
+            if any(slot in slots[team] for slot in FILLS[players[pid]["position"]]):
+                fits.append(pid)
+                if len(fits) == 3:
+                    break
+        pid = rng.choice(fits) if fits else board[0]
+        board.remove(pid)
+        position = players[pid]["position"]
+        slot = next((s for s in FILLS[position] if s in slots[team]), slots[team][0])
+        slots[team].remove(slot)
+        max_bid = money[team] - len(slots[team])
+        amount = int(max(1, min(max_bid, round(1 + surplus[pid] / total_surplus * spare * rng.uniform(0.75, 1.25)))))
+        money[team] -= amount
+        picks.append({
+            "player_id": pid, "picked_by": users[team - 1]["user_id"], "roster_id": team,
+            "round": (pick_no - 1) // TEAMS + 1, "draft_slot": team, "pick_no": pick_no, "is_keeper": None,
+            "draft_id": DRAFT_ID, "reactions": None,
+            "metadata": {"amount": str(amount), "position": position, "team": players[pid].get("team") or "",
+                         "first_name": players[pid].get("first_name"), "last_name": players[pid].get("last_name"),
+                         "player_id": pid, "status": "", "sport": SPORT, "slot": str(team)},
+        })
+    return picks
+
+
+def synthetic(n_players=11000, seed=2025):
+    """
+    Deterministic Sleeper-shaped fixture with n_players in the dump.
+    """
+    rng = random.Random(seed)
+    players = _players(n_players, rng)
+    projections = _projections(players, rng)
+    league, rosters, users, draft = _league()
+    picks = _picks(players, projections, users, rng)
+    return {"players": players, "projections": projections, "league": league, "rosters": rosters,
+            "users": users, "drafts": [draft], "draft": draft, "picks": picks}
+
+
+def _anon(value, prefix, length=12):
+    return prefix + hashlib.sha256(str(value).encode("utf-8")).hexdigest()[:length]
+
+
+def anonymize(fixture):
+    """
+    Strip names and account ids from a recorded fixture and move it onto the fixed
+    LEAGUE_ID / DRAFT_ID, keeping every value the pipeline actually computes with.
+    """
+    user_ids = {user["user_id"]: f"3{i:017d}" for i, user in enumerate(fixture["users"], 1)}
+    for i, user in enumerate(fixture["users"], 1):
+        user.update(user_id=user_ids[user["user_id"]], username=f"user{i}", display_name=f"Team {i}", avatar=None,
+                    metadata={}, league_id=LEAGUE_ID)
+    for roster in fixture["rosters"]:
+        roster.update(owner_id=user_ids.get(roster.get("owner_id")), league_id=LEAGUE_ID, co_owners=None)
+    for pid, data in fixture["players"].items():
+        if data.get("position") == "DEF":
+            continue
+        first, last = _anon(pid, "F", 6).title(), _anon(pid, "L", 8).title()
+        data.update(first_name=first, last_name=last, search_first_name=first.lower(), search_last_name=last.lower(),
+                    search_full_name=(first + last).lower(), hashtag=None, college=None, metadata=None,
+                    birth_country=None, rotoworld_id=None, rotowire_id=None, espn_id=None, yahoo_id=None,
+                    sportradar_id=None, stats_id=None, fantasy_data_id=None, gsis_id=None, swish_id=None,
+                    oddsjam_id=None, opta_id=None, pandascore_id=None, kalshi_id=None)
+    for item in fixture["projections"]:
+        item.get("player", {}).update(first_name=None, last_name=None)
+    for pick in fixture["picks"]:
+        pick.update(picked_by=user_ids.get(pick.get("picked_by"), ""), draft_id=DRAFT_ID, reactions=None)
+        pick.get("metadata", {}).update(first_name=None, last_name=None)
+    fixture["league"].update(league_id=LEAGUE_ID, draft_id=DRAFT_ID, previous_league_id=None,
+                             name="Benchmark League", avatar=None)
+    for draft in fixture["drafts"] + [fixture["draft"]]:
+        draft.update(draft_id=DRAFT_ID, league_id=LEAGUE_ID, creators=None, metadata={},
+                     draft_order={user_ids.get(uid, uid): slot for uid, slot in (draft.get("draft_order") or {}).items()})
+    return fixture
+
+
+def record(league_id, draft_id, api_endpoint="https://api.sleeper.app/v1", stats_endpoint="https://api.sleeper.com",
+           season=SEASON, season_type=SEASON_TYPE):
+    """
+    Pull a real league, its auction and the players dump from the API, anonymized.
+    """
+    import requests
+
+    def get(url):
+        response = requests.get(url, timeout=30)
+        if response.status_code != 200:
+            raise Exception(f"Error fetching {url}: {response.status_code}")
+        return response.json()
+
+    api_endpoint, stats_endpoint = api_endpoint.rstrip("/"), stats_endpoint.rstrip("/")
+    fixture = {
+        "players": get(f"{api_endpoint}/players/{SPORT}"),
+        "projections": get(f"{stats_endpoint}/projections/{SPORT}/{season}?season_type={season_type}&order_by=pts_std"),
+        "league": get(f"{api_endpoint}/league/{league_id}"),
+        "rosters": get(f"{api_endpoint}/league/{league_id}/rosters"),
+        "users": get(f"{api_endpoint}/league/{league_id}/users"),
+        "drafts": get(f"{api_endpoint}/league/{league_id}/drafts"),
+        "draft": get(f"{api_endpoint}/draft/{draft_id}"),
+        "picks": get(f"{api_endpoint}/draft/{draft_id}/picks"),
+    }
+    return anonymize(fixture)
+
+
+def save(fixture, directory):
+    os.makedirs(directory, exist_ok=True)
+    for name in FILES:
+        with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as f:
+            json.dump(fixture[name], f, separators=(",", ":"))
+
+
+def load(directory):
+    fixture = {}
+    for name in FILES:
+        with open(os.path.join(directory, f"{name}.json"), "rb") as f:
+            fixture[name] = f.read()
+    return fixture
+
+
+def bodies(fixture):
+    # request path -> response body bytes, for the stub server
+    return {ROUTES[name]: body if isinstance(body, bytes) else json.dumps(body, separators=(",", ":")).encode("utf-8")
+            for name, body in fixture.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write benchmark fixtures")
+    parser.add_argument("out", help="fixture directory to write")
+    parser.add_argument("--players", type=int, default=11000, help="players in a synthetic dump")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--record", nargs=2, metavar=("LEAGUE_ID", "DRAFT_ID"),
+                        help="record and anonymize a real league and auction instead")
+    args = parser.parse_args(argv)
+    fixture = record(*args.record) if args.record else synthetic(args.players, args.seed)
+    save(fixture, args.out)
+    print(f"Wrote {len(fixture['players'])} players, {len(fixture['projections'])} projections and "
+          f"{len(fixture['picks'])} picks to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Time the load -> score -> value pipeline, a live auction replay and search-as-you-type
+over the players dump against recorded fixtures, and write a JSON report that can be compared across commits.
+
+    python -m benchmarks.run --sizes 2000,5000,11000 --out report.json
+    python -m benchmarks.run --fixtures benchmarks/fixtures/my-league --compare report.json
+
+Fixtures are served by a local HTTP server, so every stage runs the real fetchers,
+client and parsers. Each stage reports its best wall time over --repeat runs and its
+peak traced memory (one extra run under tracemalloc).
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if __name__ == "__main__":
+    # run as python -m benchmarks.run: the package modules import each other flat (import
+    # models); importers such as the tests put the directory on the path themselves
+    sys.path.insert(0, os.path.join(ROOT, "src", "sleeper_draft_tool"))
+
+import client  # noqa: E402
+import fetchers  # noqa: E402
+import jsoncodec  # noqa: E402
+import models  # noqa: E402
+import schemas  # noqa: E402
+import utils  # noqa: E402
+from draft_state import DraftState  # noqa: E402
+from live_value import LiveValueEngine  # noqa: E402
+from search import NameIndex  # noqa: E402
+
+from benchmarks import fixtures  # noqa: E402
+
+REPORT_VERSION = 1
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    bodies = {}
+
+    def do_GET(self):
+        body = self.bodies.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve(fixture):
+    handler = type("Handler", (_FixtureHandler,), {"bodies": fixtures.bodies(fixture)})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextlib.contextmanager
+def quiet():
+    # keep anything that still prints (e.g. with INSTRUMENT_ECHO) out of the timings and the output
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        yield
+
+
+def measure(fn, setup=None, repeat=3):
+    """
+    Best wall time of fn(setup()) over repeat runs, plus peak traced memory of one more run.
+    Returns (stats, result of the last timed run).
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        with quiet():
+            start = time.perf_counter()
+            result = fn(arg)
+            best = min(best, time.perf_counter() - start)
+    arg = setup() if setup is not None else None
+    tracemalloc.start()
+    try:
+        with quiet():
+            fn(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": round(best, 6), "peak_bytes": peak}, result
+
+
+def bench_pipeline(base, repeat=3):
+    """
+    Stage timings for fetchers.fetch_relevant_players_with_projections and the utils
+    valuation chain, in the order the app runs them, plus the whole thing end to end.
+    """
+    stages = {}
+    budget = fixtures.BUDGET
+    season, season_type, sport = fixtures.SEASON, fixtures.SEASON_TYPE, fixtures.SPORT
+    projections_url = f"{base}{fixtures.ROUTES['projections']}"
+    players_file = os.path.abspath("players.json")
+    with client.SleeperClient(timeout=30) as http:
+        stages["fetch_league"], league = measure(
+            lambda _: fetchers.fetch_league(base, fixtures.LEAGUE_ID, http), repeat=repeat)
+        stages["http_projections"], response = measure(lambda _: http.get(projections_url), repeat=repeat)
+        stages["parse_projections"], projections = measure(
+            lambda _: models.AllStats.from_sleeper_json(jsoncodec.response_json(response)), repeat=repeat)
+        stages["download_players"], _ = measure(
+            lambda _: fetchers.update_player_json(base, sport, players_file, http), repeat=repeat)
+        predicate = utils.relevant_player_predicate(league)
+        load = lambda _: fetchers.fetch_all_players(base, sport, filename=players_file, predicate=predicate,
+                                                    max_age=None)
+        stages["load_players"], _ = measure(load, repeat=repeat)
+
+        def loaded(_=None):
+            with quiet():
+                return load(None)
+
+        def scored(_=None):
+            return fetchers.apply_projections(loaded(), projections, league.scoring_settings)
+
+        def cleaned(_=None):
+            with quiet():
+                return utils.clean_player_data(scored(), league)
+
+        stages["score"], _ = measure(lambda players: fetchers.apply_projections(players, projections,
+                                                                                 league.scoring_settings),
+                                     setup=loaded, repeat=repeat)
+        stages["clean"], _ = measure(lambda players: utils.clean_player_data(players, league), setup=scored,
+                                     repeat=repeat)
+        stages["position_stats"], _ = measure(lambda players: utils.PositionStats.from_players(players, league),
+                                              setup=cleaned, repeat=repeat)
+        stages["values"], valued = measure(lambda players: utils.calculate_values(players, league, budget),
+                                           setup=cleaned, repeat=repeat)
+        stages["end_to_end"], _ = measure(
+            lambda _: fetchers.fetch_relevant_players_with_projections(
+                base, base, fixtures.LEAGUE_ID, season, season_type, sport, budget, client=http), repeat=repeat)
+    return stages, league, valued
+
+
+def bench_replay(base, league, valued):
+    """
+    Replay the auction the way the draft watcher sees it: each poll returns the pick log so
+    far, which is merged by pick_no and applied to a DraftState driving the live values.
+    """
+    with client.SleeperClient(timeout=30) as http:
+        teams = fetchers.fetch_all_teams(base, fixtures.LEAGUE_ID, http)
+        payload = http.get_json(f"{base}{fixtures.ROUTES['picks']}", "draft picks")
+    state = DraftState.from_league(league, fixtures.BUDGET, all_teams=teams, players=valued)
+    setup_start = time.perf_counter()
+    engine = LiveValueEngine(valued.to_table(), league, state)
+    setup = time.perf_counter() - setup_start
+    known = models.AllDraftPicks()
+    latencies = []
+    for count in range(1, len(payload) + 1):
+        start = time.perf_counter()
+        state.apply_picks(known.merge(payload[:count]))
+        latencies.append(time.perf_counter() - start)
+    ordered = sorted(latencies)
+    return {
+        "picks": len(latencies),
+        "pool": len(valued),
+        "engine_setup_seconds": round(setup, 6),
+        "total_seconds": round(sum(latencies), 6),
+        "mean_ms": round(1000 * sum(latencies) / max(1, len(latencies)), 4),
+        "p95_ms": round(1000 * ordered[int(0.95 * (len(ordered) - 1))], 4) if ordered else 0.0,
+        "max_ms": round(1000 * ordered[-1], 4) if ordered else 0.0,
+        "money_left": state.money_left,
+        "open_slots": state.open_slot_count,
+        "top_value": round(float(engine.adjusted_value.max()), 2) if len(engine.adjusted_value) else 0.0,
+    }
+
+
+def bench_search(fixture):
+    """
+    Type a player's full name into a NameIndex over the whole players dump one keystroke
+    at a time, as the GUI search box does, timing each fuzzy query.
+    """
+    players = models.AllPlayers.from_sleeper_json(fixture["players"])
+    start = time.perf_counter()
+    index = NameIndex(players)
+    build = time.perf_counter() - start
+    named = [p for p in players if p.first_name and p.last_name]
+    target = named[len(named) // 2] if named else None
+    latencies = []
+    query = ""
+    for ch in f"{target.first_name} {target.last_name}" if target is not None else "":
+        query += ch
+        start = time.perf_counter()
+        index.search(query, fuzzy=True)
+        latencies.append(time.perf_counter() - start)
+    return {
+        "players": len(players),
+        "keystrokes": len(latencies),
+        "build_seconds": round(build, 6),
+        "mean_ms": round(1000 * sum(latencies) / max(1, len(latencies)), 4),
+        "max_ms": round(1000 * max(latencies), 4) if latencies else 0.0,
+    }
+
+
+def run_fixture(fixture, repeat=3):
+    workdir = tempfile.mkdtemp(prefix="sleeper-bench-")
+    cwd = os.getcwd()
+    os.chdir(workdir)  # fetch_relevant_players_with_projections writes players.json to the cwd
+    try:
+        with serve(fixture) as base:
+            stages, league, valued = bench_pipeline(base, repeat)
+            replay = bench_replay(base, league, valued)
+        search = bench_search(fixture)
+    finally:
+        os.chdir(cwd)
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+    return {"stages": stages, "valued_players": len(valued), "replay": replay, "search": search}
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(sizes=(2000, 5000, 11000), repeat=3, fixture_dir=None, seed=2025):
+    """
+    Benchmark synthetic fixtures at each pool size, or a recorded fixture directory.
+    """
+    report = {
+        "version": REPORT_VERSION,
+        "meta": {
+            "commit": _commit(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json_backend": jsoncodec.BACKEND,
+            "schema_decoding": schemas.enabled(),
+            "repeat": repeat,
+        },
+        "results": {},
+    }
+    if fixture_dir:
+        report["results"][os.path.basename(os.path.normpath(fixture_dir))] = run_fixture(fixtures.load(fixture_dir), repeat)
+    for size in ([] if fixture_dir else sizes):
+        report["results"][str(size)] = run_fixture(fixtures.synthetic(size, seed), repeat)
+    return report
+
+
+def _rows(report):
+    # (label, metric, value) for everything that should only go down
+    for key, result in report["results"].items():
+        for stage, stats in result["stages"].items():
+            yield f"{key}/{stage}", "seconds", stats["seconds"]
+            yield f"{key}/{stage}", "peak_bytes", stats["peak_bytes"]
+        yield f"{key}/replay", "p95_ms", result["replay"]["p95_ms"]
+        yield f"{key}/replay", "max_ms", result["replay"]["max_ms"]
+        if "search" in result:  # reports from before search was benchmarked
+            yield f"{key}/search", "max_ms", result["search"]["max_ms"]
+
+
+def compare(report, baseline, threshold=0.25, min_seconds=0.002):
+    """
+    Lines describing every metric that got more than threshold worse than baseline;
+    timings under min_seconds are too noisy to flag.
+    """
+    old = {(label, metric): value for label, metric, value in _rows(baseline)}
+    regressions = []
+    for label, metric, value in _rows(report):
+        before = old.get((label, metric))
+        if not before:
+            continue
+        if metric == "seconds" and max(value, before) < min_seconds:
+            continue
+        change = value / before - 1
+        if change > threshold:
+            regressions.append(f"{label} {metric}: {before} -> {value} (+{change:.0%})")
+    return regressions
+
+
+def summary(report):
+    lines = []
+    for key, result in report["results"].items():
+        lines.append(f"pool {key} ({result['valued_players']} valued players)")
+        for stage, stats in result["stages"].items():
+            lines.append(f"  {stage:<18} {stats['seconds'] * 1000:9.1f} ms  {stats['peak_bytes'] / 2 ** 20:8.1f} MiB")
+        replay = result["replay"]
+        lines.append(f"  {'replay':<18} {replay['picks']} picks, mean {replay['mean_ms']:.2f} ms, "
+                     f"p95 {replay['p95_ms']:.2f} ms, max {replay['max_ms']:.2f} ms")
+        search = result.get("search")
+        if search:
+            lines.append(f"  {'search':<18} {search['keystrokes']} keystrokes over {search['players']} players, "
+                         f"mean {search['mean_ms']:.2f} ms, max {search['max_ms']:.2f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the load -> score -> value pipeline")
+    parser.add_argument("--sizes", default="2000,5000,11000", help="comma separated synthetic pool sizes")
+    parser.add_argument("--fixtures", help="recorded fixture directory (see benchmarks.fixtures) instead of synthetic")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--out", help="write the JSON report here")
+    parser.add_argument("--compare", help="baseline report; exit 1 if anything regressed past --threshold")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = run(sizes, args.repeat, args.fixtures, args.seed)
+    print(summary(report))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.out}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
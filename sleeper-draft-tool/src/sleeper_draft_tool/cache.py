@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import fields
+from datetime import date
+
+import instrument
+import models
+
+CACHE_VERSION = 1
+# every Player field except the raw JSON, which is never worth persisting
+PLAYER_COLUMNS = [f.name for f in fields(models.Player) if f.name != "raw"]
+
+
+def projections_last_modified(all_projections):
+    """
+    Return the newest last_modified/updated_at stamp found in a projections payload (or None).
+    """
+    if getattr(all_projections, "last_modified", None) is not None:
+        # already collected by the AllStats fast path
+        return all_projections.last_modified
+    latest = None
+    for profile in all_projections.profiles.values():
+        stamps = [profile.raw.get("last_modified"), profile.raw.get("updated_at")] if isinstance(profile.raw, dict) else []
+        for entry in profile.entries.values():
+            stamps.extend((entry.last_modified, entry.updated_at))
+        for stamp in stamps:
+            if isinstance(stamp, (int, float)) and (latest is None or stamp > latest):
+                latest = stamp
+    return latest
+
+
+def player_cache_key(league, season, season_type, draft_amount, last_modified):
+    """
+    Build the invalidation key for a processed player table.
+    Anything that changes scoring or valuation has to be part of it. Without a
+    last_modified stamp from the projections the key carries today's date instead, so
+    such an entry is rebuilt once a day rather than trusted forever.
+    """
+    settings = json.dumps(
+        {
+            "scoring_settings": league.scoring_settings,
+            "roster_positions": league.roster_positions,
+            "total_rosters": league.total_rosters,
+        },
+        sort_keys=True,
+    )
+    return {
+        "version": CACHE_VERSION,
+        "league_id": str(league.league_id),
+        "season": str(season),
+        "season_type": season_type,
+        "draft_amount": draft_amount,
+        "settings_hash": hashlib.sha256(settings.encode("utf-8")).hexdigest(),
+        "last_modified": last_modified if last_modified is not None else f"day:{date.today().isoformat()}",
+    }
+
+
+def _cache_path(cache_dir, key):
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"players_{key['league_id']}_{key['season']}_{key['season_type']}_{digest}.pkl")
+
+
+def save_players_cache(cache_dir, key, players):
+    """
+    Store the scored/valued players column-wise (one list per Player field) in a pickle.
+    The write goes through a temp file so a crash never leaves a half-written cache.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    with instrument.span("cache.save") as span:
+        rows = list(players.players.values())
+        payload = {
+            "key": key,
+            "columns": {col: [getattr(p, col) for p in rows] for col in PLAYER_COLUMNS},
+        }
+        path = _cache_path(cache_dir, key)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        span.set(rows=len(rows), bytes=os.path.getsize(path))
+    return path
+
+
+def load_players_cache(cache_dir, key):
+    """
+    Return the cached AllPlayers for key, or None on a miss or unreadable/stale file.
+    """
+    path = _cache_path(cache_dir, key)
+    with instrument.span("cache.load") as span:
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("key") != key:
+                span.set(hit=False)
+                return None
+            columns = payload["columns"]
+            names = [col for col in PLAYER_COLUMNS if col in columns]
+            players = {}
+            for values in zip(*(columns[col] for col in names)):
+                player = models.Player(**dict(zip(names, values)))
+                players[player.player_id] = player
+        except Exception:
+            # anything a bad or older file can raise (pickle errors, renamed classes, a
+            # payload of the wrong shape) is a miss; the table is rebuilt and saved again
+            span.set(hit=False)
+            return None
+        span.set(hit=True, rows=len(players))
+    return models.AllPlayers(players=players)
@@ -0,0 +1,265 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import instrument
+import jsoncodec
+
+# (url pattern, seconds a cached body is served without asking the server); first match wins
+DEFAULT_TTLS = (
+    (r"/players/", 24 * 60 * 60),
+    # live draft state is always revalidated; an unchanged draft answers 304
+    (r"/draft/[^/]+/picks", 0),
+    (r"/draft/", 0),
+    (r"/projections/", 60 * 60),
+    (r"/league/", 60 * 60),
+)
+
+
+class ResponseCache:
+    """
+    On-disk cache of Sleeper GET responses.
+    Each URL gets a <hash>.meta.json (ETag, Last-Modified, fetch time) and a <hash>.body,
+    unless the body lives in a file of its own (see SleeperClient.download).
+    Within its TTL an entry is served without touching the network; after that it is
+    revalidated with If-None-Match / If-Modified-Since and a 304 just refreshes the timestamp.
+    """
+
+    def __init__(self, cache_dir, ttls=DEFAULT_TTLS, default_ttl=60):
+        self.cache_dir = cache_dir
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls]
+        self.default_ttl = default_ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def ttl_for(self, url) -> float:
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def _path(self, url, suffix) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+        return os.path.join(self.cache_dir, digest + suffix)
+
+    def lookup(self, url) -> Optional[Dict[str, Any]]:
+        try:
+            meta = jsoncodec.load(self._path(url, ".meta.json"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or not os.path.exists(self.body_path(url, meta)):
+            return None
+        return meta
+
+    def body_path(self, url, meta) -> str:
+        return meta.get("body_path") or self._path(url, ".body")
+
+    def is_fresh(self, url, meta) -> bool:
+        return time.time() - meta.get("fetched_at", 0) < self.ttl_for(url)
+
+    def validators(self, meta) -> Dict[str, str]:
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def read(self, url, meta) -> bytes:
+        with open(self.body_path(url, meta), "rb") as f:
+            return f.read()
+
+    def store(self, url, headers, body=None, body_path=None) -> Dict[str, Any]:
+        """
+        Record a 200 response. Either pass the body bytes, or body_path if the caller
+        already wrote the body somewhere else.
+        """
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content_type": headers.get("Content-Type"),
+            "fetched_at": time.time(),
+        }
+        if body_path is not None:
+            meta["body_path"] = os.path.abspath(body_path)
+        else:
+            self._write(self._path(url, ".body"), body)
+        self._write(self._path(url, ".meta.json"), jsoncodec.dumps(meta))
+        return meta
+
+    def touch(self, url, meta, headers) -> None:
+        # 304 Not Modified: keep the body, restart the TTL and pick up any new validators
+        meta = dict(meta, fetched_at=time.time())
+        meta["etag"] = headers.get("ETag") or meta.get("etag")
+        meta["last_modified"] = headers.get("Last-Modified") or meta.get("last_modified")
+        self._write(self._path(url, ".meta.json"), jsoncodec.dumps(meta))
+
+    def response(self, url, meta) -> requests.Response:
+        # rebuild a 200 Response from the cached body so callers can't tell the difference
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = self.read(url, meta)
+        if meta.get("content_type"):
+            response.headers["Content-Type"] = meta["content_type"]
+        response.encoding = "utf-8"
+        return response
+
+    @staticmethod
+    def _write(path, data) -> None:
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class SleeperClient:
+    """
+    Shared HTTP client for the Sleeper endpoints.
+    - one pooled requests.Session, so connections are kept alive between calls
+    - a default timeout on every request
+    - bounded retries with exponential backoff on connection errors and 429/5xx
+    - fetch_many() to issue independent GETs concurrently on a thread pool
+    - an optional ResponseCache with per-endpoint TTLs and conditional revalidation
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, timeout=10.0, retries=3, backoff_factor=0.3, pool_size=10, max_workers=6, cache=None):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_stats = {"hits": 0, "revalidated": 0, "misses": 0, "bytes": 0}
+        self._stats_lock = threading.Lock()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _count(self, key, nbytes=0) -> None:
+        with self._stats_lock:
+            self.cache_stats[key] += 1
+            self.cache_stats["bytes"] += nbytes
+        instrument.count(f"http.cache.{key}")
+        span = instrument.RECORDER.current()
+        if span is not None:
+            span.set(cache=key)
+
+    def get(self, url, **kwargs) -> requests.Response:
+        with instrument.span("http.get", url=url) as span:
+            response = self._get(url, **kwargs)
+            span.set(status=response.status_code)
+            if not kwargs.get("stream"):
+                span.add("bytes", len(response.content or b""))
+                instrument.count("http.bytes", len(response.content or b""))
+            return response
+
+    def _get(self, url, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        if self.cache is None or "headers" in kwargs or kwargs.get("stream"):
+            return self.session.get(url, **kwargs)
+        meta = self.cache.lookup(url)
+        if meta is not None and self.cache.is_fresh(url, meta):
+            self._count("hits")
+            return self.cache.response(url, meta)
+        response = self.session.get(url, headers=self.cache.validators(meta), **kwargs)
+        if response.status_code == 304 and meta is not None:
+            self.cache.touch(url, meta, response.headers)
+            self._count("revalidated")
+            return self.cache.response(url, meta)
+        if response.status_code == 200:
+            self.cache.store(url, response.headers, body=response.content)
+        self._count("misses", len(response.content or b""))
+        return response
+
+    def download(self, url, filename, chunk_size=1 << 16) -> bool:
+        """
+        Keep filename in sync with url, streaming the body straight to disk.
+        With a cache, a fresh entry costs nothing and a stale one a conditional GET.
+        Returns True if a new body was written.
+        """
+        with instrument.span("http.download", url=url):
+            return self._download(url, filename, chunk_size)
+
+    def _download(self, url, filename, chunk_size) -> bool:
+        meta = self.cache.lookup(url) if self.cache is not None else None
+        if meta is not None and os.path.abspath(filename) != self.cache.body_path(url, meta):
+            meta = None
+        if meta is not None and self.cache.is_fresh(url, meta):
+            self._count("hits")
+            return False
+        headers = self.cache.validators(meta) if self.cache is not None else {}
+        response = self.session.get(url, headers=headers, stream=True, timeout=self.timeout)
+        try:
+            if response.status_code == 304 and meta is not None:
+                self.cache.touch(url, meta, response.headers)
+                self._count("revalidated")
+                return False
+            if response.status_code != 200:
+                raise Exception(f"Error fetching {url}: {response.status_code}")
+            written = 0
+            # per-thread name, so concurrent downloads of the same file never share a temp file
+            tmp_path = f"{filename}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+                        written += len(chunk)
+                os.replace(tmp_path, filename)
+            except BaseException:
+                # a failed or interrupted download leaves the old file as it was and no temp behind
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+        finally:
+            response.close()
+        if self.cache is not None:
+            self.cache.store(url, response.headers, body_path=filename)
+        self._count("misses", written)
+        instrument.RECORDER.current().add("bytes", written)
+        instrument.count("http.bytes", written)
+        return True
+
+    def get_json(self, url, what="data") -> Any:
+        response = self.get(url)
+        if response.status_code == 200:
+            return jsoncodec.response_json(response)
+        raise Exception(f"Error fetching {what}: {response.status_code}")
+
+    def fetch_many(self, urls: Dict[str, str]) -> Dict[str, Any]:
+        """
+        GET every url in {name: url} concurrently and return {name: parsed JSON}.
+        All requests run to completion; the first failure (in input order) is then raised.
+        """
+        if not urls:
+            return {}
+        workers = min(self.max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {name: pool.submit(self.get_json, url, name) for name, url in urls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "SleeperClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -9,3 +9,15 @@ class Config:
     SEASON = 2025  # current season
     SEASON_TYPE = "regular"  # regular or playoff
     DRAFT_AMOUNT = 200 # number of dollars each team has to draft with
+    CACHE_DIR = ".cache"  # where processed player tables are cached between runs
+    DRAFT_ID = None  # set to the league's draft id to fetch draft + picks with the league
+    DRAFT_POLL_INTERVAL = 1.0  # seconds between live draft polls (each one a conditional GET)
+    HTTP_TIMEOUT = 10.0  # seconds per request
+    HTTP_CACHE_DIR = ".cache/http"  # ETag/Last-Modified aware response cache
+    VIRTUAL_TABLES = True  # only materialize the visible rows of each player table (False: full tables kept in step by row_sync)
+    FUZZY_SEARCH = True  # also list near-miss spellings after exact search matches
+    JSON_BACKEND = None  # "orjson", "msgspec" or "json"; None uses the fastest one installed
+    SCHEMA_DECODING = True  # typed msgspec decoding of Sleeper payloads when msgspec is installed
+    PLOT_MODE = "kde"  # position plots: "kde" or "hist" of the projections, or "normal" from mean/std_dev
+    INSTRUMENT_ECHO = False  # also print progress messages that are recorded as events
+    INSTRUMENT_LOG = "instrument.jsonl"  # where the Stats panel exports spans/counters as JSON lines
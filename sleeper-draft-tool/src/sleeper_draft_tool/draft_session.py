@@ -0,0 +1,99 @@
+import draft_state as ds
+import draft_watcher
+import live_value
+import optimizer
+
+
+def roster_for(username, users, teams):
+    """
+    Roster id of the user's team in the league, or None when the user or their roster isn't found.
+    """
+    for user in users.by_username(username) if username else ():
+        for team in teams.by_owner(user.user_id):
+            if team.roster_id is not None:
+                return str(team.roster_id)
+    return None
+
+
+class DraftSession:
+    """
+    The live draft behind the GUI: a DraftState for the league with every valued player on
+    the board, LiveValueEngine adjusted values that follow the picks and, given my_team, the
+    RosterOptimizer's marginal value of each player to that roster.
+
+    Nothing here touches Tk. poll() only fetches new picks (through a DraftWatcher) and can
+    run on a worker; apply_picks is called wherever picks are handled (the Tk thread in the
+    GUI) and returns the ids of the players whose row has to be redrawn: the ones drafted
+    and the ones whose adjusted value changed.
+    """
+
+    def __init__(self, players, league, budget, teams=None, picks=None, my_team=None):
+        self.league = league
+        self.table = players.to_table()
+        self.state = ds.DraftState.from_league(league, budget or 0, all_teams=teams, players=players)
+        self.engine = live_value.LiveValueEngine(self.table, league, self.state)
+        self.optimizer = optimizer.RosterOptimizer(players, self.state, my_team) if my_team is not None else None
+        self.marginals = {}
+        self.drafted = set()
+        self.watcher = None
+        self._changed = set()
+        # the engine subscribed first, so its values are current when these run
+        self.state.subscribe(self._on_drafted)
+        self.engine.subscribe(self._changed.update)
+        if picks:
+            self.state.apply_picks(picks)
+        self._changed.clear()
+        self._refresh_marginals()
+
+    def watch(self, api_endpoint, draft_id, sleeper_client, interval=1.0, picks=None):
+        """
+        Set up the DraftWatcher that poll() uses; picks already applied are not fetched again.
+        """
+        self.watcher = draft_watcher.DraftWatcher(api_endpoint, draft_id, sleeper_client, interval=interval, picks=picks)
+        return self.watcher
+
+    def poll(self):
+        """
+        One watcher poll; network only, so it can run on a worker. Returns the new DraftPicks
+        for apply_picks.
+        """
+        return self.watcher.poll() if self.watcher is not None else []
+
+    def _on_drafted(self, player_ids):
+        self.drafted.update(player_ids)
+        self._changed.update(player_ids)
+
+    def apply_picks(self, picks):
+        """
+        Apply DraftPicks (replays are ignored) and return the set of player ids that changed.
+        """
+        self._changed.clear()
+        self.state.apply_picks(picks)
+        if self._changed:
+            self._refresh_marginals()
+        changed = set(self._changed)
+        self._changed.clear()
+        return changed
+
+    def _refresh_marginals(self):
+        # the optimizer keeps its tables warm across picks; rows whose marginal moved are redrawn
+        if self.optimizer is None:
+            return
+        marginals = self.optimizer.marginal_values()
+        self._changed.update(pid for pid in marginals.keys() | self.marginals.keys()
+                             if marginals.get(pid) != self.marginals.get(pid))
+        self.marginals = marginals
+
+    def is_drafted(self, player_id):
+        return player_id in self.drafted
+
+    def adjusted_value(self, player_id):
+        return self.engine.value_of(player_id)
+
+    def marginal_value(self, player_id):
+        # None for players no open starting slot of my roster can take
+        return self.marginals.get(player_id)
+
+    def live_values(self, player_id):
+        # values for worker.LIVE_FIELDS
+        return self.adjusted_value(player_id), self.marginal_value(player_id)
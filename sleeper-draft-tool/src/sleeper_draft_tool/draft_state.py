@@ -1,26 +1,252 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# flex roster slot -> positions that may fill it; any other slot only takes its own position
+SLOT_ELIGIBILITY = {
+    "WRRB_FLEX": {"WR", "RB"},
+    "REC_FLEX": {"WR", "TE"},
+    "FLEX": {"RB", "WR", "TE"},
+    "SUPER_FLEX": {"QB", "RB", "WR", "TE"},
+    "IDP_FLEX": {"DL", "LB", "DB"},
+}
+BENCH_SLOT = "BN"
+# slots that never hold a drafted starter
+NON_DRAFT_SLOTS = {"IR", "TAXI"}
+
+
+@lru_cache(maxsize=None)
+def slot_order(position):
+    # slots a player at `position` may take, best fit first: own slot, narrowest flex, bench
+    flexes = sorted((slot for slot, eligible in SLOT_ELIGIBILITY.items() if position in eligible),
+                    key=lambda slot: len(SLOT_ELIGIBILITY[slot]))
+    return tuple([position] + flexes + [BENCH_SLOT])
+
+
+@dataclass
+class TeamState:
+    """
+    Budget and roster bookkeeping for one team in an auction.
+    - open_slots: roster slot -> number still unfilled
+    - open_count: total unfilled slots (kept alongside so max_bid is O(1))
+    """
+    team: str
+    budget: int = 0
+    spent: int = 0
+    open_slots: Dict[str, int] = field(default_factory=dict)
+    open_count: int = 0
+    players: List[str] = field(default_factory=list)
+
+    @property
+    def remaining(self) -> int:
+        return self.budget - self.spent
+
+    @property
+    def max_bid(self) -> int:
+        # every other open slot still needs at least $1
+        if self.open_count <= 0:
+            return 0
+        return max(self.remaining - (self.open_count - 1), 0)
+
+
 class DraftState:
-    def __init__(self):
-        self.available_players = []
-        self.drafted_players = []
-        self.team_budgets = {}
-    
+    """
+    Live auction state indexed for O(1) pick handling.
+    - available players keyed by player_id, plus a per-position set of ids
+    - drafted players keyed by player_id (in pick order)
+    - per-team budget, spent dollars, open slots by roster_positions and max bid
+    - league-wide money left and open slots, kept up to date per pick
+    """
+
+    def __init__(self, roster_positions=None, budget=None):
+        self.roster_positions = [slot for slot in (roster_positions or []) if slot not in NON_DRAFT_SLOTS]
+        self.default_budget = budget
+        self._available = {}              # player_id -> player
+        self._available_by_position = {}  # position -> set of player_ids
+        self._drafted = {}                # player_id -> player
+        self._pick_nos = set()
+        self.team_budgets = {}            # team -> remaining budget
+        self.teams = {}                   # team -> TeamState
+        self.money_left = 0
+        self.open_slots = {}              # roster slot -> unfilled count across the league
+        self.open_slot_count = 0
+        self._listeners = []
+
+    @classmethod
+    def from_league(cls, league, budget, all_teams=None, players=None):
+        """
+        Set up a fresh auction: one team per roster (from all_teams, else 1..total_rosters)
+        and, optionally, every player in an AllPlayers as available.
+        """
+        state = cls(league.roster_positions, budget)
+        roster_ids = [str(t.roster_id) for t in all_teams] if all_teams is not None else \
+            [str(i) for i in range(1, (league.total_rosters or 0) + 1)]
+        for roster_id in roster_ids:
+            state.add_team(roster_id, budget)
+        if players is not None:
+            state.add_available_players(players)
+        return state
+
+    @staticmethod
+    def _player_id(player):
+        return str(getattr(player, "player_id", player))
+
     def add_available_player(self, player):
-        self.available_players.append(player)
-    
-    def draft_player(self, player, team):
-        if player in self.available_players:
-            self.available_players.remove(player)
-            self.drafted_players.append(player)
-            self.team_budgets[team] -= player.cost  # Assuming player has a cost attribute
-    
+        pid = self._player_id(player)
+        self._available[pid] = player
+        self._available_by_position.setdefault(getattr(player, "position", None), set()).add(pid)
+
+    def add_available_players(self, players):
+        for player in players:
+            self.add_available_player(player)
+
+    def add_team(self, team, budget=None):
+        team = str(team)
+        if team in self.teams:
+            return self.teams[team]
+        budget = budget if budget is not None else (self.default_budget or 0)
+        open_slots = {}
+        for slot in self.roster_positions:
+            open_slots[slot] = open_slots.get(slot, 0) + 1
+            self.open_slots[slot] = self.open_slots.get(slot, 0) + 1
+        state = TeamState(team=team, budget=budget, open_slots=open_slots, open_count=len(self.roster_positions))
+        self.teams[team] = state
+        self.team_budgets[team] = state.remaining
+        self.money_left += state.remaining
+        self.open_slot_count += state.open_count
+        return state
+
+    def _fill_slot(self, team_state, position):
+        for slot in slot_order(position):
+            if team_state.open_slots.get(slot, 0) > 0:
+                team_state.open_slots[slot] -= 1
+                team_state.open_count -= 1
+                self.open_slots[slot] -= 1
+                self.open_slot_count -= 1
+                return slot
+        return None
+
+    def subscribe(self, callback):
+        """
+        Register callback(player_ids), called once per draft_player / apply_picks batch.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, player_ids):
+        if player_ids:
+            for callback in self._listeners:
+                callback(player_ids)
+
+    def draft_player(self, player, team, cost=None):
+        """
+        Move a player from available to drafted and charge team; O(1).
+        cost defaults to player.cost for callers that priced the player themselves.
+        Returns the roster slot filled (None if the roster was already full, or if the
+        player is not available, e.g. already drafted: nothing is charged then).
+        """
+        pid = self._player_id(player)
+        if pid not in self._available:
+            return None
+        slot = self._draft_player(player, team, cost)
+        self._notify([pid])
+        return slot
+
+    def _draft_player(self, player, team, cost=None):
+        pid = self._player_id(player)
+        if pid in self._drafted or pid not in self._available:
+            return None
+        player = self._available.pop(pid)
+        position = getattr(player, "position", None)
+        ids = self._available_by_position.get(position)
+        if ids is not None:
+            ids.discard(pid)
+        self._drafted[pid] = player
+        if cost is None:
+            cost = getattr(player, "cost", 0) or 0
+        team_state = self.teams.get(str(team)) or self.add_team(team)
+        team_state.spent += cost
+        team_state.players.append(pid)
+        self.team_budgets[team_state.team] = team_state.remaining
+        self.money_left -= cost
+        return self._fill_slot(team_state, position)
+
+    def apply_pick(self, pick):
+        """
+        Apply one DraftPick from the Sleeper feed; picks already applied (by pick_no) are ignored.
+        """
+        return self.apply_picks([pick])[0]
+
+    def _apply_pick(self, pick, applied):
+        if pick.pick_no is not None:
+            if pick.pick_no in self._pick_nos:
+                return None
+            self._pick_nos.add(pick.pick_no)
+        if pick.player_id in self._drafted:
+            return None
+        player = self._available.get(pick.player_id)
+        if player is None:
+            # never loaded into the pool: the feed is authoritative, so pool it with the
+            # position Sleeper sends with the pick and charge the team as usual
+            player = _PickedPlayer(pick.player_id, pick.metadata.get("position"))
+            self.add_available_player(player)
+        applied.append(pick.player_id)
+        amount = pick.metadata.get("amount")
+        cost = int(amount) if amount not in (None, "") else 0
+        return self._draft_player(player, pick.roster_id or pick.picked_by, cost)
+
+    def apply_picks(self, picks):
+        """
+        Bulk path for a list of DraftPicks or an AllDraftPicks, e.g. replaying a draft on a late join.
+        Subscribers hear about the whole batch once.
+        """
+        applied = []
+        slots = [self._apply_pick(pick, applied) for pick in picks]
+        self._notify(applied)
+        return slots
+
+    def is_available(self, player_id):
+        return str(player_id) in self._available
+
+    def available_by_position(self, position):
+        return [self._available[pid] for pid in self._available_by_position.get(position, ())]
+
+    def max_bid(self, team):
+        team_state = self.teams.get(str(team))
+        return team_state.max_bid if team_state is not None else 0
+
+    def max_team_bid(self):
+        return max((team_state.max_bid for team_state in self.teams.values()), default=0)
+
+    def get_open_slots(self, team):
+        team_state = self.teams.get(str(team))
+        return dict(team_state.open_slots) if team_state is not None else {}
+
+    @property
+    def available_players(self):
+        return list(self._available.values())
+
+    @property
+    def drafted_players(self):
+        return list(self._drafted.values())
+
     def get_available_players(self):
         return self.available_players
-    
+
     def get_drafted_players(self):
         return self.drafted_players
-    
+
     def set_team_budget(self, team, budget):
-        self.team_budgets[team] = budget
-    
+        team_state = self.teams.get(str(team)) or self.add_team(team, budget)
+        self.money_left += budget - team_state.budget
+        team_state.budget = budget
+        self.team_budgets[team_state.team] = team_state.remaining
+
     def get_team_budget(self, team):
-        return self.team_budgets.get(team, 0)
\ No newline at end of file
+        return self.team_budgets.get(str(team), 0)
+
+
+@dataclass
+class _PickedPlayer:
+    # stand-in for a drafted player that was never loaded into the available pool
+    player_id: str
+    position: Optional[str] = None
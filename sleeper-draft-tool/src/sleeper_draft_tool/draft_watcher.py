@@ -0,0 +1,107 @@
+import threading
+
+import client
+import fetchers
+import instrument
+import models
+
+# draft.last_picked values at or above this are epoch-ms timestamps, not pick numbers
+_TIMESTAMP_MS = 10 ** 9
+
+
+class DraftWatcher:
+    """
+    Background poller for a live Sleeper draft.
+
+    Every interval it makes the cheap /draft/{id} call and compares the change markers
+    (last_picked, last_message_time, status). Only when they move does it fetch
+    /draft/{id}/picks, merge it into `picks` by pick_no, and hand just the new picks to
+    draft_state.apply_picks and every subscriber as a delta.
+
+    Pass the app's shared SleeperClient: its ResponseCache revalidates /draft/ responses on
+    every request (TTL 0 in client.DEFAULT_TTLS), so a poll sees the latest picks and an
+    unchanged payload costs a 304. Without one an uncached client is created.
+    The marker is only remembered once the known picks reach draft.last_picked; a picks
+    response that lags the draft info is fetched again on the next poll.
+    With draft_state=None the caller applies the returned picks itself (the GUI does so on
+    the Tk thread through draft_session.DraftSession).
+    """
+
+    def __init__(self, api_endpoint, draft_id, sleeper_client=None, interval=1.0, draft_state=None, picks=None):
+        self.api_endpoint = api_endpoint
+        self.draft_id = draft_id
+        self.client = sleeper_client or client.SleeperClient(timeout=max(interval, 1.0) * 2, retries=1)
+        self.interval = interval
+        self.draft_state = draft_state
+        self.picks = picks if picks is not None else models.AllDraftPicks(draft_id=draft_id)
+        self.draft = None
+        self.last_error = None
+        self._marker = None
+        self._listeners = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, callback):
+        """
+        Register callback(new_picks, draft). Called from the watcher thread.
+        """
+        self._listeners.append(callback)
+
+    def poll(self):
+        """
+        Run one poll synchronously and return the list of newly seen DraftPicks.
+        """
+        with instrument.span("draft.poll") as span:
+            draft = fetchers.fetch_draft_info(self.api_endpoint, self.draft_id, self.client)
+            self.draft = draft
+            marker = (draft.last_picked, draft.last_message_time, draft.status)
+            if marker == self._marker:
+                span.set(changed=False)
+                return []
+            new_picks = fetchers.fetch_new_draft_picks(self.api_endpoint, self.draft_id, self.picks, self.client)
+            span.set(changed=True, rows=len(new_picks))
+        # only remember the marker once the picks behind it were ingested
+        if self._caught_up(draft, new_picks):
+            self._marker = marker
+        if new_picks:
+            if self.draft_state is not None:
+                self.draft_state.apply_picks(new_picks)
+            for callback in self._listeners:
+                callback(new_picks, draft)
+        return new_picks
+
+    def _caught_up(self, draft, new_picks):
+        last = draft.last_picked
+        if last is None or (self._marker is not None and last == self._marker[0]):
+            return True  # no pick since the remembered marker
+        if last < _TIMESTAMP_MS:
+            # a pick number: the picks list has to include it
+            return (self.picks.last_pick_no() or 0) >= last
+        # a pick time: the pick behind it has to have shown up
+        return bool(new_picks)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+                self.last_error = None
+            except Exception as e:
+                # keep polling through transient errors; the caller can inspect last_error
+                self.last_error = e
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
@@ -1,143 +1,383 @@
 import requests
+import json
+import os
 import models
+import cache
 import pdb
+import scoring
 import utils
+import time
+import functools
+import contextlib
+import instrument
+import jsoncodec
+import schemas
 
-def update_player_json(api_endpoint, sport, filename="players.json"):
-    response = requests.get(f"{api_endpoint}/players/{sport}")
+PLAYERS_MAX_AGE = 24 * 60 * 60  # players.json is refreshed daily
+
+def _get(url, client=None):
+    # route through the shared client (pooling, timeout, retries) when one is given
+    if client is not None:
+        return client.get(url)
+    with instrument.span("http.get", url=url):
+        return requests.get(url)
+
+def _model_name(build):
+    return getattr(build, "__qualname__", "payload").split(".")[0]
+
+@contextlib.contextmanager
+def _parse_span(build):
+    with instrument.span("parse", model=_model_name(build)) as span:
+        yield span
+
+def _parse(response, build, decode):
+    # typed one-pass decode from the response bytes when msgspec is installed,
+    # otherwise the tolerant dict parser
+    with _parse_span(build) as span:
+        if schemas.enabled() and isinstance(response.content, (bytes, bytearray)):
+            span.set(schema=True)
+            result = decode(response.content)
+        else:
+            result = build(jsoncodec.response_json(response))
+        span.set(rows=len(result) if hasattr(result, "__len__") else 1)
+        return result
+
+def _build(payload, build, decode):
+    # same choice for payloads already parsed by client.fetch_many
+    with _parse_span(build) as span:
+        result = decode(payload) if schemas.enabled() else build(payload)
+        span.set(rows=len(result) if hasattr(result, "__len__") else 1)
+        return result
+
+def _parse_projections(payload):
+    with instrument.span("parse", model="AllStats") as span:
+        all_projections = models.AllStats.from_sleeper_json(payload)
+        span.set(rows=len(all_projections.profiles), fast_path=all_projections.columns is not None)
+        return all_projections
+
+def update_player_json(api_endpoint, sport, filename="players.json", client=None):
+    if client is not None and client.cache is not None:
+        # conditional download straight to disk; a 304 leaves the file untouched
+        if client.download(f"{api_endpoint}/players/{sport}", filename):
+            instrument.event("players.updated", f"Player data updated in {filename}", filename=filename)
+        return
+    response = _get(f"{api_endpoint}/players/{sport}", client)
     if response.status_code == 200:
-        players = response.json()
-        with open(filename, "w+") as f:
-            import json
-            json.dump(players, f, indent=4)
-        print(f"Player data updated in {filename}")
+        # the body is already JSON: write the bytes through untouched (compact, no re-encode)
+        content = response.content if isinstance(response.content, (bytes, bytearray)) else jsoncodec.dumps(jsoncodec.response_json(response))
+        tmp_path = filename + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, filename)
+        instrument.event("players.updated", f"Player data updated in {filename}", filename=filename, bytes=len(content))
     else:
         raise Exception(f"Error fetching players: {response.status_code}")
 
-def fetch_all_players(api_endpoint, sport, filename="players.json"):
+def iter_player_json(filename, chunk_size=1 << 16):
+    """
+    Stream (player_id, player_dict) pairs out of a players.json dump.
+
+    The file is read in chunks and each top-level value is decoded on its own,
+    so only one player's dict is alive at a time instead of the whole dump.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, "r", encoding="utf-8") as f:
+        buf = f.read(chunk_size)
+        pos = 0
+        eof = not buf
+
+        def skip(buf, pos):
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            return pos
+
+        # top-level object opener
+        pos = skip(buf, pos)
+        if pos >= len(buf) or buf[pos] != "{":
+            raise ValueError(f"{filename} does not contain a JSON object")
+        pos += 1
+        while True:
+            pos = skip(buf, pos)
+            if pos < len(buf) and buf[pos] == "}":
+                return
+            try:
+                key, end = decoder.raw_decode(buf, pos)
+                end = skip(buf, end)
+                if end >= len(buf) or buf[end] != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", buf, end)
+                value, end = decoder.raw_decode(buf, skip(buf, end + 1))
+                end = skip(buf, end)
+                if end >= len(buf):
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, end)
+            except json.JSONDecodeError:
+                # most likely the current entry straddles the chunk boundary
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield key, value
+            if buf[end] == "}":
+                return
+            if buf[end] != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buf, end)
+            pos = end + 1
+
+
+def load_player_raw(filename, player_id):
+    # one player's original JSON, streamed back out of players.json on demand
+    player_id = str(player_id)
+    for pid, data in iter_player_json(filename):
+        if pid == player_id:
+            return data
+    return None
+
+def fetch_all_players(api_endpoint, sport, filename="players.json", predicate=None, keep_raw=False, stream=False, client=None,
+                      max_age=PLAYERS_MAX_AGE):
     # Function to fetch player data
-    # First try to read from local file
-    try:
-        with open(filename, "r") as f:
-            import json
-            players = json.load(f)
-            print(f"Loaded players from {filename}")
-    except FileNotFoundError:
-        print(f"{filename} not found, fetching from API")
-        update_player_json(api_endpoint, sport, filename)
-        with open(filename, "r") as f:
-            import json
-            players = json.load(f)
-    players = models.AllPlayers.from_sleeper_json(players)
+    # predicate(player_id, data) -> bool limits which players get built, and
+    # passing one (or stream=True) reads players.json incrementally.
+    # Without keep_raw the source JSON is dropped; AllPlayers.get_raw reloads it from filename.
+    if client is not None and client.cache is not None:
+        # the response cache decides whether players.json needs revalidating
+        update_player_json(api_endpoint, sport, filename, client)
+    # Otherwise read from the local file unless it is missing or older than max_age
+    elif not os.path.exists(filename):
+        instrument.event("players.missing", f"{filename} not found, fetching from API", filename=filename)
+        update_player_json(api_endpoint, sport, filename, client)
+    elif max_age is not None and time.time() - os.path.getmtime(filename) > max_age:
+        instrument.event("players.stale", f"{filename} is older than {max_age}s, fetching from API", filename=filename)
+        update_player_json(api_endpoint, sport, filename, client)
+    with instrument.span("players.load", bytes=os.path.getsize(filename)) as span:
+        if stream or predicate is not None:
+            # streamed one player at a time either way, so peak memory stays one entry;
+            # with msgspec each entry is validated (and the predicate sees PlayerSchema structs)
+            if schemas.enabled() and not keep_raw:
+                span.set(mode="stream_schema")
+                players = schemas.decode_player_items(iter_player_json(filename), predicate=predicate)
+            else:
+                span.set(mode="stream")
+                players = models.AllPlayers.from_sleeper_items(iter_player_json(filename), predicate=predicate, keep_raw=keep_raw)
+        elif schemas.enabled() and not keep_raw:
+            # full load: typed decode straight from the file bytes
+            span.set(mode="schema")
+            with open(filename, "rb") as f:
+                players = schemas.decode_players(f.read())
+        else:
+            span.set(mode="load")
+            players = models.AllPlayers.from_sleeper_json(jsoncodec.load(filename), keep_raw=keep_raw)
+        span.set(rows=len(players))
+    players.raw_source = functools.partial(load_player_raw, os.path.abspath(filename))
     return players
 
-def fetch_all_teams(api_endpoint, league_id):
+def fetch_all_teams(api_endpoint, league_id, client=None):
     # Function to fetch all teams from the external API
-    response = requests.get(f"{api_endpoint}/league/{league_id}/rosters")
+    response = _get(f"{api_endpoint}/league/{league_id}/rosters", client)
     if response.status_code == 200:
-        all_teams = models.AllTeams.from_sleeper_json(response.json())
+        all_teams = _parse(response, models.AllTeams.from_sleeper_json, schemas.decode_teams)
         return all_teams
     else:
         raise Exception(f"Error fetching all teams: {response.status_code}")
     
-def fetch_all_users(api_endpoint, league_id):
+def fetch_all_users(api_endpoint, league_id, client=None):
     # Function to fetch users from the external API
-    response = requests.get(f"{api_endpoint}/league/{league_id}/users")
+    response = _get(f"{api_endpoint}/league/{league_id}/users", client)
     if response.status_code == 200:
-        all_users = models.AllUsers.from_sleeper_json(response.json())
+        all_users = _parse(response, models.AllUsers.from_sleeper_json, schemas.decode_users)
         return all_users
     else:
         raise Exception(f"Error fetching all users: {response.status_code}")
     
-def fetch_all_drafts(api_endpoint, league_id):
+def fetch_all_drafts(api_endpoint, league_id, client=None):
     # Function to fetch all drafts from the external API
-    response = requests.get(f"{api_endpoint}/league/{league_id}/drafts")
+    response = _get(f"{api_endpoint}/league/{league_id}/drafts", client)
     if response.status_code == 200:
-        all_drafts = models.AllDrafts.from_sleeper_json(response.json())
+        all_drafts = _parse(response, models.AllDrafts.from_sleeper_json, schemas.decode_drafts)
         return all_drafts
     else:
         raise Exception(f"Error fetching all drafts: {response.status_code}")
     
-def fetch_draft_info(api_endpoint, draft_id):
+def fetch_draft_info(api_endpoint, draft_id, client=None):
     # Function to fetch live draft information from the external API
-    response = requests.get(f"{api_endpoint}/draft/{draft_id}")
+    response = _get(f"{api_endpoint}/draft/{draft_id}", client)
     if response.status_code == 200:
-        draft_info = models.Draft.from_sleeper_json(response.json())
+        draft_info = _parse(response, models.Draft.from_sleeper_json, schemas.decode_draft)
         return draft_info
     else:
         raise Exception(f"Error fetching draft info: {response.status_code}")
 
-def fetch_draft_picks(api_endpoint, draft_id):
+def _picks_from_schema(data):
+    picks = schemas.decode_picks(data)
+    return models.AllDraftPicks(picks=picks, draft_id=picks[0].draft_id if picks else None)
+
+def fetch_draft_picks(api_endpoint, draft_id, client=None):
     # Function to fetch live draft picks from the external API
-    response = requests.get(f"{api_endpoint}/draft/{draft_id}/picks")
+    response = _get(f"{api_endpoint}/draft/{draft_id}/picks", client)
     if response.status_code == 200:
-        draft_picks = models.AllDraftPicks.from_sleeper_json(response.json())
+        draft_picks = _parse(response, models.AllDraftPicks.from_sleeper_list, _picks_from_schema)
         return draft_picks
     else:
         raise Exception(f"Error fetching draft picks: {response.status_code}")
+
+def fetch_new_draft_picks(api_endpoint, draft_id, known_picks, client=None):
+    # Function to fetch live draft picks and merge only the unseen ones into known_picks
+    response = _get(f"{api_endpoint}/draft/{draft_id}/picks", client)
+    if response.status_code == 200:
+        return known_picks.merge(_parse(response, list, schemas.decode_picks))
+    else:
+        raise Exception(f"Error fetching draft picks: {response.status_code}")
     
-def fetch_all_player_projections(api_endpoint, sport, season, season_type):
+def fetch_all_player_projections(api_endpoint, sport, season, season_type, client=None):
     # Function to fetch all player projections from the external API
-    print(f"Fetching all player projections using URL: {api_endpoint}/projections/{sport}/{season}?season_type={season_type}&order_by=pts_std")
-    response = requests.get(f"{api_endpoint}/projections/{sport}/{season}?season_type={season_type}&order_by=pts_std")
+    response = _get(f"{api_endpoint}/projections/{sport}/{season}?season_type={season_type}&order_by=pts_std", client)
     if response.status_code == 200:
-        all_projections = models.AllStats.from_sleeper_json(response.json())
+        all_projections = _parse_projections(jsoncodec.response_json(response))
         return all_projections
     else:
         raise Exception(f"Error fetching all players' projections: {response.status_code}")
     
-def fetch_player_projections_by_pos(api_endpoint, sport, season, season_type, position):
+def fetch_player_projections_by_pos(api_endpoint, sport, season, season_type, position, client=None):
     # Function to fetch player projections for a certain position from the external API
-    response = requests.get(f"{api_endpoint}/projections/{sport}/{season}?season_type={season_type}&position={position}&order_by=pts_std")
+    response = _get(f"{api_endpoint}/projections/{sport}/{season}?season_type={season_type}&position={position}&order_by=pts_std", client)
     if response.status_code == 200:
-        projections_by_pos = models.AllStats.from_sleeper_json(response.json())
+        projections_by_pos = _parse_projections(jsoncodec.response_json(response))
         return projections_by_pos
     else:
         raise Exception(f"Error fetching {position} players' projections: {response.status_code}")
     
-def fetch_league(api_endpoint, league_id):
+def fetch_league(api_endpoint, league_id, client=None):
     # Function to fetch league information from the external API
-    response = requests.get(f"{api_endpoint}/league/{league_id}")
+    response = _get(f"{api_endpoint}/league/{league_id}", client)
     if response.status_code == 200:
-        league = models.League.from_sleeper_json(response.json())
+        league = _parse(response, models.League.from_sleeper_json, schemas.decode_league)
         return league
     else:
         raise Exception(f"Error fetching league info: {response.status_code}")
     
-def fetch_relevant_players_with_projections(api_endpoint, stats_endpoint, league_id, season, season_type, sport, draft_budget):
-    # Grab scoring settings for the league
-    league = fetch_league(api_endpoint, league_id)
-    scoring_settings = league.scoring_settings
-    # Grab all players
-    all_players = fetch_all_players(api_endpoint, sport)
-    # Grab season's player projections
-    all_projections = fetch_all_player_projections(stats_endpoint, sport, season, season_type)
-    # Apply scoring setting to each player's projection
-    print(f"Applying scoring settings for league {league_id}, season {season}, type {season_type}")
-    for player_id in all_projections.profiles:
-        proj = 0
-        for stat in all_projections.profiles[player_id].raw["stats"]:
-            try:
-                proj += all_projections.profiles[player_id].raw["stats"][stat] * scoring_settings[stat]
-            except KeyError:
-                pass
-        try:
-            all_players.players[player_id].update_projection(proj)
-        except KeyError:
-            pass
-    print("Scoring settings applied successfully.")
-    # clean player data after applyng projections
-    all_players = utils.clean_player_data(all_players, league)
-    # add vorp calculations
-    all_players = utils.calculate_vorps(all_players, league)
-    # add teamshare calculations
-    all_players = utils.calculate_teamshare(all_players, league)
-    # add stddevs calculations
-    all_players = utils.calculate_stddevs(all_players, league)
-    # calculate raw value based on draft amount
-    all_players = utils.calculate_raw_value(all_players, league, draft_budget)
+def fetch_league_context(client, api_endpoint, stats_endpoint, league_id, sport, season, season_type, draft_id=None):
+    # Fetch league, rosters, users, drafts, projections (and draft + picks when the
+    # draft id is known) concurrently; cold-load latency is the slowest single request
+    urls = {
+        "league": f"{api_endpoint}/league/{league_id}",
+        "teams": f"{api_endpoint}/league/{league_id}/rosters",
+        "users": f"{api_endpoint}/league/{league_id}/users",
+        "drafts": f"{api_endpoint}/league/{league_id}/drafts",
+        "projections": f"{stats_endpoint}/projections/{sport}/{season}?season_type={season_type}&order_by=pts_std",
+    }
+    if draft_id:
+        urls["draft"] = f"{api_endpoint}/draft/{draft_id}"
+        urls["picks"] = f"{api_endpoint}/draft/{draft_id}/picks"
+    payloads = client.fetch_many(urls)
+    context = {
+        "league": _build(payloads["league"], models.League.from_sleeper_json, schemas.decode_league),
+        "teams": _build(payloads["teams"], models.AllTeams.from_sleeper_json, schemas.decode_teams),
+        "users": _build(payloads["users"], models.AllUsers.from_sleeper_json, schemas.decode_users),
+        "drafts": _build(payloads["drafts"], models.AllDrafts.from_sleeper_json, schemas.decode_drafts),
+        "projections": _parse_projections(payloads["projections"]),
+    }
+    if draft_id:
+        context["draft"] = _build(payloads["draft"], models.Draft.from_sleeper_json, schemas.decode_draft)
+        context["picks"] = _build(payloads["picks"], models.AllDraftPicks.from_sleeper_list, _picks_from_schema)
+    return context
+
+def fetch_league_chain(api_endpoint, league_id, client=None, max_seasons=None):
+    # the league and every earlier season of it, newest first, following previous_league_id
+    leagues = []
+    seen = set()
+    while league_id and str(league_id) != "0" and str(league_id) not in seen:
+        if max_seasons is not None and len(leagues) >= max_seasons:
+            break
+        seen.add(str(league_id))
+        league = fetch_league(api_endpoint, league_id, client)
+        leagues.append(league)
+        league_id = league.previous_league_id
+    return leagues
+
+def fetch_auction_history(client, api_endpoint, stats_endpoint, league_id, sport, season_type, max_seasons=None, skip_drafts=()):
+    # Every completed auction draft of the league's seasons with its picks and that season's
+    # projections, as (league, draft, picks, projections). After the league chain is walked
+    # all seasons' drafts are fetched in one concurrent batch, then all projections and picks
+    # in another; drafts in skip_drafts are left out.
+    leagues = fetch_league_chain(api_endpoint, league_id, client, max_seasons)
+    payloads = client.fetch_many({league.league_id: f"{api_endpoint}/league/{league.league_id}/drafts" for league in leagues})
+    skip_drafts = set(map(str, skip_drafts))
+    drafts = []
+    for league in leagues:
+        all_drafts = _build(payloads[league.league_id], models.AllDrafts.from_sleeper_json, schemas.decode_drafts)
+        for draft in all_drafts.drafts.values():
+            if draft.type == "auction" and draft.status == "complete" and str(draft.draft_id) not in skip_drafts:
+                drafts.append((league, draft, draft.season or league.season))
+    urls = {}
+    for league, draft, season in drafts:
+        urls[f"projections:{season}"] = f"{stats_endpoint}/projections/{sport}/{season}?season_type={season_type}&order_by=pts_std"
+        urls[f"picks:{draft.draft_id}"] = f"{api_endpoint}/draft/{draft.draft_id}/picks"
+    payloads = client.fetch_many(urls)
+    projections = {}
+    history = []
+    for league, draft, season in drafts:
+        if season not in projections:
+            projections[season] = _parse_projections(payloads[f"projections:{season}"])
+        picks = _build(payloads[f"picks:{draft.draft_id}"], models.AllDraftPicks.from_sleeper_list, _picks_from_schema)
+        history.append((league, draft, picks, projections[season]))
+    return history
+
+def apply_projections(all_players, all_projections, scoring_settings):
+    # score every projection in one matrix product and store it on the matching players
+    with instrument.span("score") as span:
+        stat_matrix = scoring.StatMatrix.from_all_stats(all_projections)
+        touched = 0
+        for player_id, proj in zip(stat_matrix.player_ids, stat_matrix.points(scoring_settings).tolist()):
+            player = all_players.players.get(player_id)
+            if player is not None:
+                player.update_projection(proj)
+                touched += 1
+        span.set(rows=touched, projections=len(stat_matrix.player_ids))
     return all_players
 
+def fetch_relevant_players_with_projections(api_endpoint, stats_endpoint, league_id, season, season_type, sport, draft_budget, cache_dir=None,
+                                            client=None, league=None, all_projections=None):
+    with instrument.span("pipeline", league_id=str(league_id)):
+        # league / all_projections can be passed in when the caller already fetched them
+        if league is None and all_projections is None and client is not None:
+            payloads = client.fetch_many({
+                "league": f"{api_endpoint}/league/{league_id}",
+                "projections": f"{stats_endpoint}/projections/{sport}/{season}?season_type={season_type}&order_by=pts_std",
+            })
+            league = _build(payloads["league"], models.League.from_sleeper_json, schemas.decode_league)
+            all_projections = _parse_projections(payloads["projections"])
+        # Grab scoring settings for the league
+        if league is None:
+            league = fetch_league(api_endpoint, league_id, client)
+        scoring_settings = league.scoring_settings
+        # Grab season's player projections
+        if all_projections is None:
+            all_projections = fetch_all_player_projections(stats_endpoint, sport, season, season_type, client)
+        # Reuse the processed player table if nothing that feeds it has changed
+        cache_key = None
+        if cache_dir:
+            cache_key = cache.player_cache_key(league, season, season_type, draft_budget,
+                                               cache.projections_last_modified(all_projections))
+            cached_players = cache.load_players_cache(cache_dir, cache_key)
+            if cached_players is not None:
+                instrument.count("players_cache.hits")
+                instrument.event("players_cache.hit", f"Loaded {len(cached_players)} valued players from cache",
+                                 rows=len(cached_players))
+                return cached_players
+            instrument.count("players_cache.misses")
+        # Grab all players, only building the ones the league can actually roster
+        all_players = fetch_all_players(api_endpoint, sport, predicate=utils.relevant_player_predicate(league), keep_raw=False, client=client)
+        # Apply scoring setting to each player's projection
+        apply_projections(all_players, all_projections, scoring_settings)
+        # clean player data after applyng projections
+        all_players = utils.clean_player_data(all_players, league)
+        # add vorp, teamshare, stddevs and raw value (based on draft amount) in one vectorized pass
+        all_players = utils.calculate_values(all_players, league, draft_budget)
+        if cache_key is not None:
+            cache.save_players_cache(cache_dir, cache_key, all_players)
+        return all_players
+
 
 if __name__ == "__main__":
     import config
@@ -145,7 +385,7 @@ if __name__ == "__main__":
     try:
         players = fetch_relevant_players_with_projections(configs.API_ENDPOINT, configs.STATS_ENDPOINT, 
                                                           configs.LEAGUE_ID, configs.SEASON, configs.SEASON_TYPE, 
-                                                          configs.SPORT, configs.DRAFT_AMOUNT)
+                                                          configs.SPORT, configs.DRAFT_AMOUNT, configs.CACHE_DIR)
         #league = fetch_league(configs.API_ENDPOINT, configs.LEAGUE_ID)
     except Exception as e:
         print(e)
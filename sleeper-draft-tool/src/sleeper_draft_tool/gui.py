@@ -1,16 +1,24 @@
 from tkinter import Tk, Frame, Label, Entry, Button, BOTH, LEFT, RIGHT, Y, X, TOP, BOTTOM
 from tkinter import messagebox
 from tkinter.ttk import Treeview, Scrollbar, Style, Notebook
-import threading
 
+import client
 import config
+import draft_session
 import fetchers
+import instrument
+import jsoncodec
+import plots
 import utils
+import row_sync
+import schemas
+import search
+import virtual_table
+import worker
 
 # plotting
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
 
 
 class SleeperDraftToolGUI:
@@ -19,11 +27,25 @@ class SleeperDraftToolGUI:
         master.title("Sleeper Draft Tool - Players by Projection")
 
         self.configs = config.Config()
-        self.rows = []          # full set of rows (tuples)
+        jsoncodec.set_backend(getattr(self.configs, "JSON_BACKEND", None))
+        schemas.ENABLED = getattr(self.configs, "SCHEMA_DECODING", True)
+        instrument.RECORDER.echo = getattr(self.configs, "INSTRUMENT_ECHO", False)
+        http_cache_dir = getattr(self.configs, "HTTP_CACHE_DIR", None)
+        self.client = client.SleeperClient(
+            timeout=getattr(self.configs, "HTTP_TIMEOUT", 10.0),
+            cache=client.ResponseCache(http_cache_dir) if http_cache_dir else None,
+        )
+        self.league_context = {}
+        self.rows = []          # full set of rows (tuples), see worker.ROW_FIELDS
+        self.display = {}       # player_id -> formatted row, built by the worker
+        self.search_index = None  # search.NameIndex over self.rows
+        self.session = None       # draft_session.DraftSession: live adjusted values as picks come in
+        self.poll_interval = getattr(self.configs, "DRAFT_POLL_INTERVAL", 1.0)
+        self.virtual = getattr(self.configs, "VIRTUAL_TABLES", True)
+        self.virtual_tables = {}  # tab name -> VirtualTreeview when self.virtual
+        self.row_syncs = {}       # tab name -> TreeviewSync otherwise
         self.positions = set()  # discovered positions
 
-        # keep last highlighted lines per position so we can remove them
-        self._selected_lines = {}         # pos -> {"line": Line2D, "marker": [Line2D,...]}
         self._position_stats = {}         # populated by load_players
 
         # Top frame for controls + search
@@ -44,22 +66,29 @@ class SleeperDraftToolGUI:
         self.status_label = Label(ctrl_frame, text="Ready")
         self.status_label.pack(side=LEFT, padx=8)
 
+        self.stats_btn = Button(ctrl_frame, text="Stats", command=self.toggle_stats_panel)
+        self.stats_btn.pack(side=RIGHT)
+        self.stats_frame = None  # stage timings panel, built on first toggle
+
         # Graphs frame (above table)
         self.graphs_frame = Frame(master)
         self.graphs_frame.pack(fill=X, padx=8, pady=(0, 6))
 
-        # Prepare placeholders for four position plots: WR, RB, TE, DEF
+        # Four position plots (WR, RB, TE, DEF), built once; loads and selections update them in place
         self.plot_positions = ["WR", "RB", "TE", "DEF"]
-        self._plot_frames = {}
-        self._plot_canvases = {}
+        plot_mode = getattr(self.configs, "PLOT_MODE", "kde")
+        self._plot_titles = {}
+        self._plots = {}
         for pos in self.plot_positions:
             pf = Frame(self.graphs_frame, width=200, height=150, relief="groove", bd=1)
             pf.pack(side=LEFT, fill=X, expand=True, padx=4)
-            lbl = Label(pf, text=pos)
-            lbl.pack(anchor="n")
-            # placeholder canvas reference stored; actual canvas created when drawing
-            self._plot_frames[pos] = pf
-            self._plot_canvases[pos] = None
+            self._plot_titles[pos] = Label(pf, text=pos)
+            self._plot_titles[pos].pack(anchor="n")
+            fig = Figure(figsize=(3, 1.8), dpi=100)
+            canvas = FigureCanvasTkAgg(fig, master=pf)
+            self._plots[pos] = plots.PositionPlot(fig, canvas, mode=plot_mode)
+            fig.tight_layout()
+            canvas.get_tk_widget().pack(fill=BOTH, expand=True)
 
         # Table frame
         table_frame = Frame(master)
@@ -73,20 +102,12 @@ class SleeperDraftToolGUI:
         style = Style()
         style.configure("Treeview", rowheight=20)
 
-        # column definitions (Raw Value, StdDevs, Teamshare, VORP, ...)
-        self.columns = (
-            "raw_value",
-            "stddevs",
-            "teamshare",
-            "vorp",
-            "projection",
-            "name",
-            "team",
-            "position",
-            "player_id",
-        )
+        # column definitions (Raw Value, Adj Value, StdDevs, Teamshare, VORP, ...)
+        self.columns = worker.DISPLAY_FIELDS
         self.column_headings = {
             "raw_value": "Raw Value",
+            "adjusted_value": "Adj Value",
+            "marginal": "Marginal",
             "stddevs": "StdDevs",
             "teamshare": "Teamshare",
             "vorp": "VORP",
@@ -103,9 +124,44 @@ class SleeperDraftToolGUI:
         # create an "All" tab up front
         self._create_tab("All")
 
+        # fetch/score/row building run on the pipeline; its queue is drained from the Tk loop
+        self.pipeline = worker.Pipeline()
+        self._queue_handlers = {
+            "status": self.set_status,
+            "result": self._apply_load_result,
+            "error": self._on_load_error,
+            "done": self._on_job_done,
+        }
+        # live draft polls get their own pipeline so a poll never supersedes a reload
+        self.poller = worker.Pipeline()
+        self._poll_handlers = {
+            "result": self._apply_new_picks,
+            "error": self._on_poll_error,
+        }
+        self._drain_queue()
+        self._poll_draft()
+        master.protocol("WM_DELETE_WINDOW", self.close)
+
         # double click will be bound per-tree when created
         self.load_players_async()
 
+    def _drain_queue(self):
+        self.pipeline.drain(self._queue_handlers)
+        self.poller.drain(self._poll_handlers)
+        self.master.after(50, self._drain_queue)
+
+    def _poll_draft(self):
+        # one watcher poll at a time on the poller; its picks come back through _apply_new_picks
+        session = self.session
+        if session is not None and session.watcher is not None and not self.poller.busy:
+            self.poller.submit(lambda post: (session, session.poll()))
+        self.master.after(int(self.poll_interval * 1000), self._poll_draft)
+
+    def close(self):
+        self.pipeline.shutdown()
+        self.poller.shutdown()
+        self.master.destroy()
+
     def _create_tab(self, tab_name: str):
         if tab_name in self.trees:
             return self.trees[tab_name]
@@ -116,6 +172,8 @@ class SleeperDraftToolGUI:
         for col in self.columns:
             tree.heading(col, text=self.column_headings.get(col, col))
         tree.column("raw_value", width=90, anchor="e")
+        tree.column("adjusted_value", width=90, anchor="e")
+        tree.column("marginal", width=80, anchor="e")
         tree.column("stddevs", width=80, anchor="e")
         tree.column("teamshare", width=90, anchor="e")
         tree.column("vorp", width=90, anchor="e")
@@ -135,250 +193,219 @@ class SleeperDraftToolGUI:
 
         # bind double click and single selection
         tree.bind("<Double-1>", self.on_row_double_click)
-        tree.bind("<<TreeviewSelect>>", self.on_row_select)
+        if self.virtual:
+            # only the visible window of rows exists as Treeview items
+            self.virtual_tables[tab_name] = virtual_table.VirtualTreeview(
+                tree, vsb, self._format_row, on_select=self.on_row_select)
+        else:
+            tree.bind("<<TreeviewSelect>>", self.on_row_select)
+            # rows keep their Treeview item across refreshes; only changes are sent to Tk
+            self.row_syncs[tab_name] = row_sync.TreeviewSync(tree, self._format_row)
 
         self.notebook.add(frame, text=tab_name)
         self.trees[tab_name] = (frame, tree, vsb, hsb)
         return self.trees[tab_name]
 
+    def toggle_stats_panel(self):
+        # small panel with per-stage timings from instrument, refreshed once a second while shown
+        if self.stats_frame is not None:
+            self.stats_frame.destroy()
+            self.stats_frame = None
+            return
+        self.stats_frame = Frame(self.master, relief="groove", bd=1)
+        self.stats_frame.pack(fill=X, padx=8, pady=(0, 6), before=self.graphs_frame)
+        columns = ("stage", "calls", "last_ms", "total_ms", "rows", "bytes")
+        tree = Treeview(self.stats_frame, columns=columns, show="headings", height=6)
+        for col, heading, width in zip(columns, ("Stage", "Calls", "Last ms", "Total ms", "Rows", "Bytes"),
+                                       (160, 60, 80, 80, 80, 100)):
+            tree.heading(col, text=heading)
+            tree.column(col, width=width, anchor="w" if col == "stage" else "e")
+        tree.pack(side=LEFT, fill=X, expand=True)
+        side = Frame(self.stats_frame)
+        side.pack(side=LEFT, fill=Y, padx=6)
+        Button(side, text="Export", command=self.export_stats).pack(anchor="n")
+        counters = Label(side, text="", justify=LEFT, anchor="nw")
+        counters.pack(anchor="n", pady=(6, 0))
+        self._refresh_stats_panel(self.stats_frame, tree, counters)
+
+    def _refresh_stats_panel(self, frame, tree, counters):
+        if frame is not self.stats_frame:
+            return  # panel was closed
+        summary = instrument.RECORDER.summary()
+        tree.delete(*tree.get_children())
+        for row in instrument.summary_rows(summary):
+            tree.insert("", "end", values=row)
+        counters.config(text="\n".join(f"{name}: {value}" for name, value in sorted(summary["counters"].items())))
+        self.master.after(1000, lambda: self._refresh_stats_panel(frame, tree, counters))
+
+    def export_stats(self):
+        path = getattr(self.configs, "INSTRUMENT_LOG", "instrument.jsonl")
+        written = instrument.RECORDER.export_jsonl(path)
+        self.set_status(f"Exported {written} records to {path}")
+
     def set_status(self, text):
         self.status_label.config(text=text)
-        self.master.update_idletasks()
 
     def load_players_async(self):
-        t = threading.Thread(target=self.load_players, daemon=True)
-        t.start()
-
-    def load_players(self):
-        self.set_status("Loading players and projections...")
         self.refresh_btn.config(state="disabled")
-        try:
-            all_players = fetchers.fetch_relevant_players_with_projections(
-                self.configs.API_ENDPOINT,
-                self.configs.STATS_ENDPOINT,
-                self.configs.LEAGUE_ID,
-                self.configs.SEASON,
-                self.configs.SEASON_TYPE,
-                self.configs.SPORT,
-                getattr(self.configs, "DRAFT_AMOUNT", None),
-            )
-            # fetch league to compute position stats used for plots
-            league = fetchers.fetch_league(self.configs.API_ENDPOINT, self.configs.LEAGUE_ID)
-        except Exception as e:
-            self.set_status("Error loading data")
-            messagebox.showerror("Error", f"Failed to load players: {e}")
-            self.refresh_btn.config(state="normal")
-            return
-
-        # Build rows and collect positions
-        rows = []  # tuples: (raw_value_display, stddevs, teamshare, vorp, proj, name, team, pos, pid)
-        positions = set()
-        for pid, player in all_players.players.items():
-            # raw_value from player attribute or raw
-            raw_value = getattr(player, "raw_value", None)
-            if raw_value is None:
-                raw = getattr(player, "raw", {}) or {}
-                raw_value = raw.get("raw_value") or raw.get("value") or raw.get("score")
-            # keep raw_value as string/number; try float for display
-            try:
-                raw_value_num = float(raw_value) if raw_value is not None else None
-                raw_value_display = raw_value_num if raw_value_num is not None else (str(raw_value) if raw_value is not None else "")
-            except Exception:
-                raw_value_display = str(raw_value) if raw_value is not None else ""
-
-            # stddevs from player attribute or raw
-            stddevs = getattr(player, "stddevs", None)
-            if stddevs is None:
-                raw = getattr(player, "raw", {}) or {}
-                stddevs = raw.get("stddevs") or raw.get("std_dev") or raw.get("stddev")
-            try:
-                stddevs = float(stddevs) if stddevs is not None else 0.0
-            except Exception:
-                stddevs = 0.0
-
-            # teamshare from player attribute or raw
-            teamshare = getattr(player, "teamshare", None)
-            if teamshare is None:
-                raw = getattr(player, "raw", {}) or {}
-                teamshare = raw.get("teamshare") or raw.get("team_share") or raw.get("share")
-            try:
-                teamshare = float(teamshare) if teamshare is not None else 0.0
-            except Exception:
-                teamshare = 0.0
+        self.set_status("Loading players and projections...")
+        self.pipeline.submit(self.load_players)
 
-            vorp = getattr(player, "vorp", None)
-            if vorp is None:
-                raw = getattr(player, "raw", {}) or {}
-                vorp = raw.get("vorp") or raw.get("value") or raw.get("vorp_score")
-            try:
-                vorp = float(vorp) if vorp is not None else 0.0
-            except Exception:
-                vorp = 0.0
-
-            proj = None
-            for attr in ("projection", "proj", "projected", "pts_ppr"):
-                proj = getattr(player, attr, None)
-                if proj is not None:
-                    break
-            if proj is None:
-                raw = getattr(player, "raw", {}) or {}
-                if isinstance(raw, dict):
-                    proj = raw.get("projection") or raw.get("proj") or raw.get("pts_ppr")
-                    stats = raw.get("stats")
-                    if proj is None and isinstance(stats, dict):
-                        proj = stats.get("pts_ppr") or stats.get("pts_std") or stats.get("pts")
+    def load_players(self, post):
+        """
+        Worker job: fetch, score and value the players, then build the sorted rows, their
+        display strings and the search index. Runs off the Tk thread, so it only posts.
+        """
+        # league, rosters, users, drafts and projections in one concurrent batch
+        context = fetchers.fetch_league_context(
+            self.client,
+            self.configs.API_ENDPOINT,
+            self.configs.STATS_ENDPOINT,
+            self.configs.LEAGUE_ID,
+            self.configs.SPORT,
+            self.configs.SEASON,
+            self.configs.SEASON_TYPE,
+            getattr(self.configs, "DRAFT_ID", None),
+        )
+        league = context["league"]
+        post("status", "Scoring and valuing players...")
+        all_players = fetchers.fetch_relevant_players_with_projections(
+            self.configs.API_ENDPOINT,
+            self.configs.STATS_ENDPOINT,
+            self.configs.LEAGUE_ID,
+            self.configs.SEASON,
+            self.configs.SEASON_TYPE,
+            self.configs.SPORT,
+            getattr(self.configs, "DRAFT_AMOUNT", None),
+            getattr(self.configs, "CACHE_DIR", None),
+            client=self.client,
+            league=league,
+            all_projections=context["projections"],
+        )
+        post("status", "Building player tables...")
+        # draft state and live adjusted values, caught up with any picks already made
+        teams = context["teams"]
+        my_team = draft_session.roster_for(getattr(self.configs, "USERNAME", None), context["users"], teams)
+        session = draft_session.DraftSession(all_players, league, getattr(self.configs, "DRAFT_AMOUNT", None),
+                                             teams=teams if len(teams) else None, picks=context.get("picks"),
+                                             my_team=my_team)
+        rows = tuple(row for row in worker.build_rows(all_players) if not session.is_drafted(row[8]))
+        # then poll for new picks through the shared client (it revalidates draft responses with ETags)
+        draft_id = getattr(self.configs, "DRAFT_ID", None) or league.draft_id
+        if draft_id:
+            session.watch(self.configs.API_ENDPOINT, draft_id, self.client, interval=self.poll_interval,
+                          picks=context.get("picks"))
+        table = all_players.to_table()
+        # reuse the position stats from valuation; only a cache hit needs them computed
+        position_stats = all_players.position_stats
+        if position_stats is None:
             try:
-                proj = float(proj) if proj is not None else 0.0
+                position_stats = utils.calculate_position_stats(all_players, league)
             except Exception:
-                proj = 0.0
-
-            name = " ".join(filter(None, (getattr(player, "first_name", None), getattr(player, "last_name", None)))).strip() or getattr(player, "search_full_name", "") or pid
-            team = getattr(player, "team", "") or (getattr(player, "raw", {}) or {}).get("team", "")
-            # determine primary position
-            pos = getattr(player, "position", "") or ",".join(getattr(player, "fantasy_positions", [])[:1] or [])
-            pos = pos or "UNK"
-            positions.add(pos)
-
-            rows.append((raw_value_display, stddevs, teamshare, vorp, proj, name, team, pos, pid))
-
-        # sort globally by VORP desc then projection
-        rows.sort(key=lambda r: (r[3] is None, -r[3] if isinstance(r[3], (int, float)) else 0, -r[4] if isinstance(r[4], (int, float)) else 0))
-
-        # store for filtering and tab generation
-        self.rows = rows
-        self.positions = positions
+                position_stats = {}
+        return {
+            "context": context,
+            "rows": rows,
+            "session": session,
+            "display": {row[8]: worker.display_row(row, session.live_values(row[8])) for row in rows},
+            "positions": frozenset(row[7] for row in rows),
+            "search_index": search.NameIndex(rows, fields=lambda r: (r[5], r[6], r[8]), key=lambda r: r[8]),
+            "position_stats": position_stats,
+            # per-position projections for the distribution plots
+            "projections": {pos: table.projection[table.position_mask(pos)] for pos in self.plot_positions},
+        }
 
+    def _apply_load_result(self, result):
+        # main thread: swap in everything the worker built in one go
+        self.league_context = result["context"]
+        self.session = result["session"]
+        self.rows = result["rows"]
+        self.display = result["display"]
+        self.positions = result["positions"]
+        self.search_index = result["search_index"]
+        self._position_stats = result["position_stats"]
         # ensure tabs exist for each position (plus "All")
-        for pos in sorted(positions):
+        for pos in sorted(self.positions):
             self._create_tab(pos)
+        # keep any search that was typed while loading
+        self.on_search_change(None)
+        self._update_graphs(self._position_stats, result["projections"])
+
+    def _apply_new_picks(self, result):
+        # main thread: apply a poll's picks, drop the drafted rows and redraw the changed ones;
+        # the tables' sync() then only touches those rows (in either table mode)
+        session, picks = result
+        if session is not self.session or not picks:
+            return  # nothing new, or a reload replaced the session while the poll ran
+        changed = session.apply_picks(picks)
+        self.rows = tuple(row for row in self.rows if not session.is_drafted(row[8]))
+        for row in self.rows:
+            if row[8] in changed:
+                self.display[row[8]] = worker.display_row(row, session.live_values(row[8]))
+        self.on_search_change(None)
+        self.set_status(f"{len(picks)} new pick(s), {len(self.rows)} players left")
+
+    def _on_poll_error(self, error):
+        # keep polling; the next tick retries
+        self.set_status(f"Draft poll failed: {error}")
+
+    def _on_load_error(self, error):
+        self.set_status("Error loading data")
+        messagebox.showerror("Error", f"Failed to load players: {error}")
+
+    def _on_job_done(self, _payload):
+        if not self.pipeline.busy:
+            self.refresh_btn.config(state="normal")
 
-        # compute position stats required for graphs using utils helper
-        try:
-            position_stats = utils.calculate_position_stats(all_players, league)
-        except Exception:
-            position_stats = {}
-
-        # store position stats for later (used when highlighting selected player)
-        self._position_stats = position_stats
-
-        # update UI on main thread: populate trees and update graphs
-        self.master.after(0, lambda: self._populate_trees(self.rows))
-        self.master.after(0, lambda: self._update_graphs(position_stats))
-        self.refresh_btn.config(state="normal")
+    def _format_row(self, row):
+        # preformatted by the worker; rows it didn't see are formatted on demand
+        return self.display.get(row[8]) or worker.display_row(row)
 
     def _populate_trees(self, rows):
-        # clear all trees
-        for tab_name, (_frame, tree, _vsb, _hsb) in self.trees.items():
-            tree.delete(*tree.get_children())
-
-        # populate "All" tab and position tabs
-        for raw_value_display, stddevs, teamshare, vorp, proj, name, team, pos, pid in rows:
-            stddevs_display = f"{stddevs:.2f}" if isinstance(stddevs, (int, float)) else str(stddevs)
-            teamshare_display = f"{teamshare:.3f}" if isinstance(teamshare, (int, float)) else str(teamshare)
-            vorp_display = f"{vorp:+.2f}"
-            proj_display = f"{proj:.2f}" if isinstance(proj, (int, float)) else str(proj)
-            raw_value_display_formatted = f"${raw_value_display:.2f}" if isinstance(raw_value_display, (int, float)) else str(raw_value_display)
-            # insert into All
-            _, all_tree, _, _ = self.trees["All"]
-            all_tree.insert("", "end", values=(raw_value_display_formatted, stddevs_display, teamshare_display, vorp_display, proj_display, name, team, pos, pid))
-            # insert into position tab if exists
-            tab_key = pos if pos in self.trees else None
-            if tab_key:
-                _, pos_tree, _, _ = self.trees[tab_key]
-                pos_tree.insert("", "end", values=(raw_value_display_formatted, stddevs_display, teamshare_display, vorp_display, proj_display, name, team, pos, pid))
+        # split rows into the "All" tab and position tabs
+        rows_by_tab = {"All": rows}
+        for row in rows:
+            rows_by_tab.setdefault(row[7], []).append(row)
+
+        # both table kinds diff against what each tree already shows: a VirtualTreeview only
+        # rewrites the changed items of its window, a TreeviewSync only the changed rows
+        tables = self.virtual_tables if self.virtual else self.row_syncs
+        for tab_name, table in tables.items():
+            table.sync(rows_by_tab.get(tab_name, []))
 
         self.set_status(f"Loaded {len(rows)} players")
 
-    def _update_graphs(self, position_stats: dict):
+    def _update_graphs(self, position_stats, projections=None):
         """
-        Draw normal curve plots for WR, RB, TE, DEF using mean/std from position_stats.
+        Update the WR, RB, TE, DEF plots in place: the projection distribution (PLOT_MODE
+        "kde" or "hist", from the player table) or a normal curve from mean/std_dev, plus
+        the stats in each title label.
         position_stats expected format:
             { "WR": {"mean": .., "median": .., "std_dev": ..}, ... }
-
-        Use default matplotlib axis scaling (do not force a fixed x range).
-        Also update the position title label to include mean/median/stddev.
         """
-        # clear any previous selection markers because canvases are recreated
-        self._selected_lines = {}
-
+        projections = projections or {}
         for pos in self.plot_positions:
-            pf = self._plot_frames[pos]
-            # capture the existing title label if present (it's the Label packed at init)
-            title_label = None
-            for child in pf.winfo_children():
-                if isinstance(child, Label):
-                    title_label = child
-                    break
-
-            # clear previous canvas/frame contents (keep title label)
-            for child in pf.winfo_children():
-                if child is title_label:
-                    continue
-                child.destroy()
-            # remove old canvas if present
-            old_canvas = self._plot_canvases.get(pos)
-            if old_canvas:
-                try:
-                    old_canvas.get_tk_widget().destroy()
-                except Exception:
-                    pass
-                self._plot_canvases[pos] = None
-
             stats = position_stats.get(pos)
-            if not stats or stats.get("std_dev") is None or stats.get("mean") is None:
-                # update title label if present
-                if title_label:
-                    title_label.config(text=pos + "\nN/A")
-                na_label = Label(pf, text="N/A", fg="gray")
-                na_label.pack(expand=True)
+            if not self._plots[pos].update(stats, projections.get(pos)):
+                self._plot_titles[pos].config(text=pos + "\nN/A")
                 continue
-
-            mean = float(stats["mean"])
-            std = float(stats["std_dev"]) if float(stats["std_dev"]) > 0 else 1.0
-            median = stats.get("median", stats.get("med", None))
-            try:
-                median = float(median) if median is not None else None
-            except Exception:
-                median = None
-
-            # update title label with stats
-            if title_label:
-                med_text = f" median: {median:.1f}" if median is not None else ""
-                title_label.config(text=f"{pos}\nmean: {mean:.1f}{med_text}  std: {std:.2f}")
-
-            # choose an x-range centered on the mean using std (default matplotlib autoscale will be used)
-            span = max(4.0 * std, max(1.0, abs(mean) * 0.5))
-            x = np.linspace(mean - span, mean + span, 300)
-            # normal pdf
-            y = (1.0 / (std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mean) / std) ** 2)
-
-            fig = Figure(figsize=(3, 1.8), dpi=100)
-            ax = fig.add_subplot(111)
-            ax.plot(x, y, color="tab:blue")
-            ax.fill_between(x, y, color="tab:blue", alpha=0.2)
-            ax.axvline(mean, color="tab:red", linestyle="--", linewidth=1)
-            ax.set_title("")  # title moved to label
-            ax.set_yticks([])
-            ax.set_xlabel("Projection")
-            # do NOT call ax.set_xlim(...) so matplotlib will use default/autoscale
-            fig.tight_layout()
-
-            canvas = FigureCanvasTkAgg(fig, master=pf)
-            widget = canvas.get_tk_widget()
-            widget.pack(fill=BOTH, expand=True)
-            canvas.draw()
-            self._plot_canvases[pos] = canvas
+            mean, median, std = ((stats or {}).get(key) for key in ("mean", "median", "std_dev"))
+            if mean is None or std is None:
+                self._plot_titles[pos].config(text=pos)
+                continue
+            med_text = f" median: {median:.1f}" if median is not None else ""
+            self._plot_titles[pos].config(text=f"{pos}\nmean: {mean:.1f}{med_text}  std: {std:.2f}")
 
     def on_search_change(self, _event):
-        q = (self.search_entry.get() or "").strip().lower()
-        if not q:
+        q = (self.search_entry.get() or "").strip()
+        if not q or self.search_index is None:
             self._populate_trees(self.rows)
             return
-        filtered = []
-        for raw_value_display, stddevs, teamshare, vorp, proj, name, team, pos, pid in self.rows:
-            if q in name.lower() or q in str(pid).lower():
-                filtered.append((raw_value_display, stddevs, teamshare, vorp, proj, name, team, pos, pid))
-        self._populate_trees(filtered)
+        results = self.search_index.search(q, fuzzy=getattr(self.configs, "FUZZY_SEARCH", False))
+        if self.session is not None:
+            # the index is built at load time; players drafted since stay out of the tables
+            results = [row for row in results if not self.session.is_drafted(row[8])]
+        self._populate_trees(results)
 
     def clear_search(self):
         self.search_entry.delete(0, "end")
@@ -389,20 +416,20 @@ class SleeperDraftToolGUI:
         item = tree.selection()
         if not item:
             return
-        vals = tree.item(item, "values")
-        # columns: raw_value, stddevs, teamshare, vorp, projection, name, team, position, player_id
-        raw_value = vals[0]
-        stddevs = vals[1]
-        teamshare = vals[2]
-        vorp = vals[3]
-        proj = vals[4]
-        name = vals[5]
-        team = vals[6]
-        pos = vals[7]
-        pid = vals[8]
+        vals = dict(zip(self.columns, tree.item(item, "values")))
+        raw_value = vals.get("raw_value")
+        adjusted_value = vals.get("adjusted_value")
+        stddevs = vals.get("stddevs")
+        teamshare = vals.get("teamshare")
+        vorp = vals.get("vorp")
+        proj = vals.get("projection")
+        name = vals.get("name")
+        pos = vals.get("position")
+        pid = vals.get("player_id")
         messagebox.showinfo(
             "Player Details",
-            f"{name}\nPlayer ID: {pid}\nProjection: {proj}\nVORP: {vorp}\nTeamshare: {teamshare}\nStdDevs: {stddevs}\nRaw Value: {raw_value}",
+            f"{name}\nPlayer ID: {pid}\nProjection: {proj}\nVORP: {vorp}\nTeamshare: {teamshare}\nStdDevs: {stddevs}\n"
+            f"Raw Value: {raw_value}\nAdjusted Value: {adjusted_value}",
         )
 
         # try to highlight the selected player's projection on the appropriate position plot
@@ -425,10 +452,9 @@ class SleeperDraftToolGUI:
         item = tree.selection()
         if not item:
             return
-        vals = tree.item(item, "values")
-        # columns: raw_value, stddevs, teamshare, vorp, projection, name, team, position, player_id
-        proj = vals[4]
-        pos = vals[7] if len(vals) > 7 else None
+        vals = dict(zip(self.columns, tree.item(item, "values")))
+        proj = vals.get("projection")
+        pos = vals.get("position")
 
         try:
             proj_val = float(str(proj).replace("+", "").strip())
@@ -440,61 +466,8 @@ class SleeperDraftToolGUI:
             self._highlight_on_graph(pos_key, proj_val)
 
     def _highlight_on_graph(self, pos: str, proj_value: float):
-        """
-        Add a vertical line and marker to the position plot for proj_value.
-        Clears previous highlight for that position.
-        """
-        canvas = self._plot_canvases.get(pos)
-        if not canvas:
-            return
-        fig = getattr(canvas, "figure", None)
-        if not fig or not fig.axes:
-            return
-        ax = fig.axes[0]
-
-        # remove existing highlight for this pos
-        prev = self._selected_lines.get(pos)
-        if prev:
-            try:
-                if prev.get("line") is not None:
-                    prev["line"].remove()
-                markers = prev.get("marker")
-                if markers:
-                    for m in markers:
-                        try:
-                            m.remove()
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-            self._selected_lines.pop(pos, None)
-
-        # compute y coordinate for marker if mean/std known, else place at top of axis
-        stats = self._position_stats.get(pos, {})
-        y_val = None
-        try:
-            mean = float(stats.get("mean"))
-            std = float(stats.get("std_dev")) if float(stats.get("std_dev")) > 0 else 1.0
-            y_val = (1.0 / (std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((proj_value - mean) / std) ** 2)
-        except Exception:
-            # fallback: place marker at 90% of current y-axis limit
-            ylim = ax.get_ylim()
-            y_val = ylim[1] * 0.9 if ylim[1] > 0 else None
-
-        # add vertical line and marker
-        try:
-            line = ax.axvline(proj_value, color="green", linestyle="--", linewidth=1.5, zorder=5)
-            marker_lines = []
-            if y_val is not None:
-                mk, = ax.plot([proj_value], [y_val], marker="o", color="green", markersize=6, zorder=6)
-                marker_lines.append(mk)
-            # redraw canvas
-            canvas.draw()
-            self._selected_lines[pos] = {"line": line, "marker": marker_lines}
-        except Exception:
-            # ignore plotting errors
-            return
-
+        # blits just the highlight, so this is cheap enough for every arrow-key selection
+        self._plots[pos].highlight(proj_value)
 
 if __name__ == "__main__":
     root = Tk()
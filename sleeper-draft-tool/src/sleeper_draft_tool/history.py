@@ -0,0 +1,315 @@
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+import numpy as np
+
+import fetchers
+import instrument
+import scoring
+import utils
+from player_table import PlayerTable
+
+# Optional Parquet storage; without pyarrow datasets are written as compressed .npz instead.
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:
+    pyarrow = None
+
+EXTENSION = ".parquet" if pyarrow is not None else ".npz"
+DEFAULT_BUDGET = 200
+
+# one row per auction pick: who went for how much, and what the player was worth going in
+SCHEMA = {
+    "season": np.int32,
+    "league_id": str,
+    "draft_id": str,
+    "pick_no": np.int32,
+    "player_id": str,
+    "position": str,
+    "picked_by": str,
+    "roster_id": str,
+    "price": np.int32,
+    "budget": np.int32,
+    "teams": np.int32,
+    "projection": np.float64,   # NaN when that season's projections didn't cover the player
+    "vorp": np.float64,
+    "stddevs": np.float64,
+    "value": np.float64,        # raw value under that season's league settings and budget
+}
+
+
+@dataclass
+class HistoryDataset:
+    """
+    Past auction picks joined with that season's projections and values, as NumPy columns
+    (see SCHEMA). Saved as Parquet when pyarrow is installed, compressed .npz otherwise.
+    """
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls) -> "HistoryDataset":
+        return cls({name: np.empty(0, dtype=dtype) for name, dtype in SCHEMA.items()})
+
+    @classmethod
+    def concat(cls, parts) -> "HistoryDataset":
+        parts = [part for part in parts if part is not None and len(part)]
+        if not parts:
+            return cls.empty()
+        return cls({name: np.concatenate([part.columns[name] for part in parts]).astype(dtype, copy=False)
+                    for name, dtype in SCHEMA.items()})
+
+    def __len__(self) -> int:
+        return len(self.columns.get("player_id", ()))
+
+    def __getitem__(self, name) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def seasons(self):
+        return sorted(set(self.columns["season"].tolist()))
+
+    @property
+    def draft_ids(self):
+        return set(self.columns["draft_id"].tolist())
+
+    def filter(self, mask) -> "HistoryDataset":
+        return HistoryDataset({name: column[mask] for name, column in self.columns.items()})
+
+    def to_pandas(self):
+        import pandas  # only needed for ad-hoc analysis
+        return pandas.DataFrame(self.columns)
+
+    def save(self, path) -> None:
+        with instrument.span("history.save", rows=len(self), path=path):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp = path + ".tmp" + os.path.splitext(path)[1]
+            if path.endswith(".parquet"):
+                if pyarrow is None:
+                    raise ImportError("pyarrow is required to write Parquet history datasets")
+                parquet.write_table(pyarrow.table(self.columns), tmp, compression="zstd")
+            else:
+                np.savez_compressed(tmp, **self.columns)
+            os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path) -> "HistoryDataset":
+        with instrument.span("history.load", path=path) as span:
+            if path.endswith(".parquet"):
+                if pyarrow is None:
+                    raise ImportError("pyarrow is required to read Parquet history datasets")
+                table = parquet.read_table(path, columns=list(SCHEMA))
+                columns = {name: table.column(name).to_numpy(zero_copy_only=False) for name in SCHEMA}
+            else:
+                with np.load(path, allow_pickle=False) as data:
+                    columns = {name: data[name] for name in SCHEMA}
+            dataset = cls({name: np.asarray(columns[name]).astype(dtype, copy=False) for name, dtype in SCHEMA.items()})
+            span.set(rows=len(dataset))
+            return dataset
+
+
+def history_path(cache_dir, league_id) -> str:
+    return os.path.join(cache_dir, f"history_{league_id}{EXTENSION}")
+
+
+def _projection_positions(all_projections, player_ids):
+    # position as the projections payload had it that season
+    positions = []
+    for player_id in player_ids:
+        profile = all_projections.profiles.get(player_id)
+        info = profile.raw.get("player") if profile is not None and isinstance(profile.raw, dict) else None
+        if isinstance(info, dict):
+            positions.append(info.get("position") or "")
+            continue
+        entry = profile.latest_entry() if profile is not None else None
+        positions.append((entry.player.position if entry is not None else None) or "")
+    return np.array(positions, dtype=str)
+
+
+def season_values(league, all_projections, budget, buffer=1) -> PlayerTable:
+    """
+    Score one season's projections under that season's league settings and value them with
+    the same vectorized chain as the live tool (utils.calculate_table_values).
+    """
+    matrix = scoring.StatMatrix.from_all_stats(all_projections)
+    points = matrix.points(league.scoring_settings)
+    positions = _projection_positions(all_projections, matrix.player_ids)
+    # same pool as clean_player_data: scored players at a rostered position
+    keep = (points != 0) & np.isin(positions, list(set(league.roster_positions)))
+    labels, codes = np.unique(positions[keep], return_inverse=True)
+    n = int(keep.sum())
+    table = PlayerTable(
+        player_ids=np.array(matrix.player_ids, dtype=object)[keep],
+        positions=[str(label) for label in labels],
+        position_codes=codes.astype(np.intp),
+        projection=points[keep].astype(np.float64),
+        **{column: np.full(n, np.nan) for column in PlayerTable.VALUE_COLUMNS[1:]},
+    )
+    return utils.calculate_table_values(table, league, budget, buffer)
+
+
+def _join(keys, ids):
+    # row of each key in ids (-1 when absent) by binary search over the sorted ids
+    if not len(ids):
+        return np.full(len(keys), -1, dtype=np.intp)
+    order = np.argsort(ids, kind="stable")
+    sorted_ids = ids[order]
+    at = np.minimum(np.searchsorted(sorted_ids, keys), len(ids) - 1)
+    return np.where(sorted_ids[at] == keys, order[at], -1)
+
+
+def _amount(pick):
+    amount = (pick.metadata or {}).get("amount")
+    try:
+        return int(amount)
+    except (TypeError, ValueError):
+        return None
+
+
+def season_rows(league, draft, picks, all_projections, buffer=1) -> HistoryDataset:
+    """
+    One draft's priced picks joined with that season's projected values.
+    """
+    with instrument.span("history.season", season=str(draft.season or league.season), draft_id=str(draft.draft_id)) as span:
+        budget = int((draft.settings or {}).get("budget") or DEFAULT_BUDGET)
+        teams = int((draft.settings or {}).get("teams") or league.total_rosters or 0)
+        picks = [pick for pick in picks if pick.player_id and _amount(pick) is not None]
+        table = season_values(league, all_projections, budget, buffer)
+        player_ids = np.array([pick.player_id for pick in picks], dtype=str)
+        rows = _join(player_ids, table.player_ids.astype(str))
+        hit = rows >= 0
+
+        def take(column):
+            out = np.full(len(rows), np.nan)
+            out[hit] = column[rows[hit]]
+            return out
+
+        codes = np.full(len(rows), -1, dtype=np.intp)
+        codes[hit] = table.position_codes[rows[hit]]
+        table_positions = np.array(table.positions + [""], dtype=str)[codes]
+        pick_positions = np.array([(pick.metadata or {}).get("position") or "" for pick in picks], dtype=str)
+        n = len(picks)
+        dataset = HistoryDataset({
+            "season": np.full(n, int(draft.season or league.season or 0), dtype=np.int32),
+            "league_id": np.full(n, str(league.league_id)),
+            "draft_id": np.full(n, str(draft.draft_id)),
+            "pick_no": np.array([pick.pick_no or 0 for pick in picks], dtype=np.int32),
+            "player_id": player_ids,
+            "position": np.where(pick_positions != "", pick_positions, table_positions),
+            "picked_by": np.array([pick.picked_by or "" for pick in picks], dtype=str),
+            "roster_id": np.array([pick.roster_id or "" for pick in picks], dtype=str),
+            "price": np.array([_amount(pick) for pick in picks], dtype=np.int32),
+            "budget": np.full(n, budget, dtype=np.int32),
+            "teams": np.full(n, teams, dtype=np.int32),
+            "projection": take(table.projection),
+            "vorp": take(table.vorp),
+            "stddevs": take(table.stddevs),
+            "value": take(table.raw_value),
+        })
+        span.set(rows=n, matched=int(hit.sum()))
+        return HistoryDataset.concat([dataset])
+
+
+def fetch_history(client, api_endpoint, stats_endpoint, league_id, sport="nfl", season_type="regular",
+                  max_seasons=None, skip_drafts=(), buffer=1) -> HistoryDataset:
+    """
+    Every completed auction draft of the league and its previous seasons, priced and valued.
+    """
+    with instrument.span("history.fetch", league_id=str(league_id)) as span:
+        history = fetchers.fetch_auction_history(client, api_endpoint, stats_endpoint, league_id, sport, season_type,
+                                                 max_seasons, skip_drafts)
+        dataset = HistoryDataset.concat([season_rows(league, draft, picks.picks, projections, buffer)
+                                         for league, draft, picks, projections in history])
+        span.set(drafts=len(history), rows=len(dataset))
+        return dataset
+
+
+def build_history(client, api_endpoint, stats_endpoint, league_id, path, sport="nfl", season_type="regular",
+                  max_seasons=None, refresh=False) -> HistoryDataset:
+    """
+    Load the dataset at path and add any completed drafts it doesn't have yet (a finished
+    draft never changes), or rebuild it from scratch with refresh=True. Saves back to path.
+    """
+    existing = None
+    if not refresh and os.path.exists(path):
+        existing = HistoryDataset.load(path)
+    fetched = fetch_history(client, api_endpoint, stats_endpoint, league_id, sport, season_type, max_seasons,
+                            skip_drafts=existing.draft_ids if existing is not None else ())
+    if existing is not None and not len(fetched):
+        return existing
+    dataset = HistoryDataset.concat([existing, fetched])
+    dataset.save(path)
+    return dataset
+
+
+@dataclass
+class PriceModel:
+    """
+    What players actually sold for against what they were worth going in:
+    log(price / budget) = intercept + slope * log(value / budget), fit by least squares per
+    position and shrunk toward the all-position fit. Working in shares of the budget lets
+    seasons with different budgets share one fit; sigma is the residual spread in log dollars.
+    The defaults (intercept 0, slope 1) predict price = value.
+    """
+    intercept: float = 0.0
+    slope: float = 1.0
+    sigma: float = 0.0
+    positions: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    samples: int = 0
+
+    @classmethod
+    def fit(cls, dataset, shrinkage=10.0, min_value=1.0, seasons=None):
+        """
+        shrinkage is how many picks' worth of weight the all-position fit gets in each
+        position's fit; seasons restricts the fit to those seasons.
+        """
+        price = dataset["price"].astype(np.float64)
+        value = dataset["value"]
+        budget = dataset["budget"].astype(np.float64)
+        mask = (price >= 1) & (value >= min_value) & (budget > 0)
+        if seasons is not None:
+            mask &= np.isin(dataset["season"], list(seasons))
+        if mask.sum() < 2:
+            return cls()
+        x = np.log(value[mask] / budget[mask])
+        y = np.log(price[mask] / budget[mask])
+        X = np.column_stack((np.ones(len(x)), x))
+        beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+        positions = {}
+        position_labels = dataset["position"][mask]
+        for position in np.unique(position_labels):
+            rows = position_labels == position
+            # ridge toward the pooled coefficients: small positions stay close to them
+            A = X[rows].T @ X[rows] + shrinkage * np.eye(2)
+            b = X[rows].T @ y[rows] + shrinkage * beta
+            positions[str(position)] = tuple(float(c) for c in np.linalg.solve(A, b))
+        coefficients = np.array([positions[str(p)] for p in position_labels])
+        residuals = y - coefficients[:, 0] - coefficients[:, 1] * x
+        return cls(intercept=float(beta[0]), slope=float(beta[1]), sigma=float(residuals.std()),
+                   positions=positions, samples=int(mask.sum()))
+
+    def coefficients(self, position=None):
+        return self.positions.get(position, (self.intercept, self.slope))
+
+    def predict(self, values, positions=None, budget=DEFAULT_BUDGET) -> np.ndarray:
+        """
+        Expected auction price for each value (and position), in whole-dollar range [1, budget].
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if positions is None:
+            intercept, slope = np.full(values.shape, self.intercept), np.full(values.shape, self.slope)
+        else:
+            coefficients = np.array([self.coefficients(str(p)) for p in np.asarray(positions).ravel()],
+                                    dtype=np.float64).reshape(values.shape + (2,))
+            intercept, slope = coefficients[..., 0], coefficients[..., 1]
+        share = np.maximum(np.nan_to_num(values), 1e-9) / budget
+        price = budget * np.exp(intercept + slope * np.log(share))
+        return np.where(values >= 1, np.clip(price, 1.0, budget), 1.0)
+
+    def predict_table(self, table, budget=DEFAULT_BUDGET, column="raw_value") -> np.ndarray:
+        """
+        Expected prices for a valued PlayerTable, e.g. as simulate_auction(values=...).
+        """
+        positions = np.array(table.positions + [""], dtype=str)[table.position_codes]
+        return self.predict(getattr(table, column), positions, budget)
@@ -0,0 +1,151 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class Span:
+    """
+    One timed stage. Numeric fields (rows, bytes, ...) can be added while it runs.
+    """
+    __slots__ = ("name", "start", "seconds", "fields", "parent")
+
+    def __init__(self, name, fields, parent):
+        self.name = name
+        self.start = time.perf_counter()
+        self.seconds = None
+        self.fields = fields
+        self.parent = parent
+
+    def add(self, key, n=1):
+        self.fields[key] = self.fields.get(key, 0) + n
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+
+class Recorder:
+    """
+    Stage-level timings and counters for the fetch -> parse -> score -> value pipeline.
+
+    - span(name, **fields): times a block; nested spans record their parent's name
+    - count(name, n): running counters (cache hits/misses, bytes, ...)
+    - event(name, message, **fields): a point-in-time record; message is printed only with echo
+    Records are plain dicts kept in a bounded deque, so recording is cheap enough for the
+    per-pick path, and can be exported as JSON lines. Safe to use from worker threads.
+    """
+
+    def __init__(self, maxlen=5000, echo=False):
+        self.records = deque(maxlen=maxlen)
+        self.counters = {}
+        self.echo = echo
+        self._stats = {}  # span name -> aggregate, see summary()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _record(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    @contextmanager
+    def span(self, name, **fields):
+        stack = self._local.__dict__.setdefault("stack", [])
+        span = Span(name, fields, stack[-1].name if stack else None)
+        stack.append(span)
+        error = None
+        try:
+            yield span
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            span.seconds = time.perf_counter() - span.start
+            record = {"type": "span", "name": name, "ts": time.time(), "seconds": round(span.seconds, 6)}
+            if span.parent:
+                record["parent"] = span.parent
+            if error:
+                record["error"] = error
+            record.update(span.fields)
+            with self._lock:
+                self.records.append(record)
+                stats = self._stats.setdefault(name, {"count": 0, "total_seconds": 0.0, "last_seconds": 0.0})
+                stats["count"] += 1
+                stats["total_seconds"] += span.seconds
+                stats["last_seconds"] = span.seconds
+                for key, value in span.fields.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        stats[key] = stats.get(key, 0) + value
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def event(self, name, message=None, **fields):
+        record = {"type": "event", "name": name, "ts": time.time()}
+        if message is not None:
+            record["message"] = message
+        record.update(fields)
+        self._record(record)
+        if self.echo and message is not None:
+            print(message)
+
+    def current(self):
+        # innermost open span on this thread, or None
+        stack = getattr(self._local, "stack", None)
+        return stack[-1] if stack else None
+
+    def summary(self):
+        """
+        {"spans": {name: {count, total_seconds, last_seconds, summed numeric fields}}, "counters": {...}}
+        """
+        with self._lock:
+            return {"spans": {name: dict(stats) for name, stats in self._stats.items()},
+                    "counters": dict(self.counters)}
+
+    def export_jsonl(self, path):
+        """
+        Write every kept record, then one counters record, as JSON lines. Returns the record count.
+        """
+        with self._lock:
+            records = list(self.records)
+            counters = dict(self.counters)
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+            f.write(json.dumps({"type": "counters", "ts": time.time(), **counters}) + "\n")
+        return len(records)
+
+    def reset(self):
+        with self._lock:
+            self.records.clear()
+            self.counters.clear()
+            self._stats.clear()
+
+
+# process-wide recorder used by the fetchers, client, utils and the GUI
+RECORDER = Recorder()
+
+
+def span(name, **fields):
+    return RECORDER.span(name, **fields)
+
+
+def count(name, n=1):
+    RECORDER.count(name, n)
+
+
+def event(name, message=None, **fields):
+    RECORDER.event(name, message, **fields)
+
+
+def summary_rows(summary=None):
+    # (stage, calls, last ms, total ms, rows, bytes) sorted by total time, for the GUI status panel
+    summary = summary if summary is not None else RECORDER.summary()
+    rows = []
+    for name, stats in summary["spans"].items():
+        rows.append((name, stats["count"], round(stats["last_seconds"] * 1000, 1), round(stats["total_seconds"] * 1000, 1),
+                     stats.get("rows", ""), stats.get("bytes", "")))
+    rows.sort(key=lambda row: -row[3])
+    return rows
@@ -0,0 +1,115 @@
+import json
+import os
+
+# Optional accelerated backends, best first; the stdlib json module is always there.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def available_backends():
+    return [name for name, module in (("orjson", orjson), ("msgspec", msgspec)) if module is not None] + ["json"]
+
+
+def _stdlib_loads(data):
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj):
+    # compact separators: no indentation or padding in cache files
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _orjson_dumps(obj):
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    except TypeError:
+        # something orjson won't take (e.g. a numpy scalar): the stdlib encoder gives the same JSON
+        return _stdlib_dumps(obj)
+
+
+def _msgspec_loads(data):
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as e:
+        # callers catch ValueError, like json.JSONDecodeError and orjson.JSONDecodeError
+        raise ValueError(str(e)) from e
+
+
+def _msgspec_dumps(obj):
+    try:
+        return msgspec.json.encode(obj)
+    except TypeError:
+        return _stdlib_dumps(obj)
+
+
+_BACKENDS = {
+    "json": (_stdlib_loads, _stdlib_dumps),
+    "orjson": (lambda data: orjson.loads(data), _orjson_dumps),
+    "msgspec": (_msgspec_loads, _msgspec_dumps),
+}
+
+BACKEND = None
+_loads = _dumps = None
+
+
+def set_backend(name=None):
+    """
+    Pick the JSON backend by name ("orjson", "msgspec" or "json"), or the fastest installed one.
+    Returns the name in use.
+    """
+    global BACKEND, _loads, _dumps
+    name = name or available_backends()[0]
+    if name not in available_backends():
+        raise ValueError(f"JSON backend {name} is not available (installed: {', '.join(available_backends())})")
+    BACKEND = name
+    _loads, _dumps = _BACKENDS[name]
+    return name
+
+
+set_backend()
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str. Bytes go straight to the parser without a decode step.
+    """
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return _loads(data)
+
+
+def dumps(obj):
+    """
+    Compact JSON as UTF-8 bytes.
+    """
+    return _dumps(obj)
+
+
+def load(filename):
+    with open(filename, "rb") as f:
+        return loads(f.read())
+
+
+def dump(obj, filename):
+    # write through a temp file so readers never see a half-written cache file
+    tmp_path = filename + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(obj))
+    os.replace(tmp_path, filename)
+
+
+def response_json(response):
+    """
+    Parse a requests.Response body from its raw bytes, skipping requests' str decode.
+    Falls back to response.json() for anything that doesn't expose bytes content.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return loads(content)
+    return response.json()
@@ -1,7 +1,91 @@
+import sys
+from array import array
 from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any, Iterable, Iterator
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Callable
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    # share one copy of strings that repeat across thousands of records (team, position, status)
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+_NUMBER_TYPES = frozenset((int, float))
+
+
+def _id(value: Any) -> Optional[str]:
+    # Sleeper sends ids as strings in some payloads and numbers in others; keep them as str
+    return str(value) if value is not None else None
+
+
+def _intern_list(values: Optional[Iterable[Any]]) -> List[Any]:
+    return [_intern(v) for v in values or []]
+
+
+class LazyIndex:
+    """
+    Secondary key -> items lookup over a container, built on first use.
+    - keys_fn(item) returns the keys an item is filed under
+    - items are filed by their container key (dict key, or list position)
+    - the container's mutators bump a mutation counter and keep a built index in step
+      through add/discard(..., version); a lookup under any other version rebuilds it
+    - a size mismatch (the container was edited directly) also rebuilds; direct edits that
+      keep the size need the container's invalidate_indexes()
+    Items come back in container order.
+    """
+
+    def __init__(self, keys_fn: Callable[[Any], Iterable[Any]]):
+        self.keys_fn = keys_fn
+        self._map: Optional[Dict[Any, Dict[Any, Any]]] = None
+        self._version = 0
+        self._size = 0
+
+    def invalidate(self) -> None:
+        self._map = None
+
+    def _build(self, source, version) -> None:
+        self._map = {}
+        for ckey, item in source.items() if hasattr(source, "items") else enumerate(source):
+            for key in set(self.keys_fn(item)):
+                self._map.setdefault(key, {})[ckey] = item
+        self._version = version
+        self._size = len(source)
+
+    def lookup(self, key, source, version=0) -> List[Any]:
+        if self._map is None or self._version != version or self._size != len(source):
+            self._build(source, version)
+        return list(self._map.get(key, {}).values())
+
+    def add(self, ckey, item, version) -> None:
+        # only keeps a built index current if it saw every mutation before this one
+        if self._map is None or self._version != version - 1:
+            self._map = None
+            return
+        for key in set(self.keys_fn(item)):
+            self._map.setdefault(key, {})[ckey] = item
+        self._version = version
+        self._size += 1
+
+    def discard(self, ckey, item, version) -> None:
+        if self._map is None or self._version != version - 1:
+            self._map = None
+            return
+        for key in set(self.keys_fn(item)):
+            bucket = self._map.get(key)
+            if bucket is not None:
+                bucket.pop(ckey, None)
+        self._version = version
+        self._size -= 1
+
+
+def _player_position_keys(p: "Player") -> List[str]:
+    return [(p.position or "").upper()] + [fp.upper() for fp in p.fantasy_positions or []]
+
+
+def _team_player_keys(t: "Team") -> List[str]:
+    return list(t.players or []) + list(t.starters or []) + list(t.reserve or [])
+
+
+@dataclass(slots=True)
 class Player:
     player_id: str
     first_name: Optional[str] = None
@@ -40,10 +124,11 @@ class Player:
     teamshare: Optional[float] = None
     stddevs: Optional[float] = None
     raw_value: Optional[float] = None
-    raw: Dict[str, Any] = field(default_factory=dict)  # keep original JSON for reference
+    adjusted_value: Optional[float] = None
+    raw: Dict[str, Any] = field(default_factory=dict)  # original JSON, only when kept (see AllPlayers.get_raw)
 
     @classmethod
-    def from_sleeper_json(cls, player_id: str, data: Dict[str, Any]) -> "Player":
+    def from_sleeper_json(cls, player_id: str, data: Dict[str, Any], keep_raw: bool = False) -> "Player":
         return cls(
             player_id=str(player_id),
             first_name=data.get("first_name"),
@@ -53,17 +138,17 @@ class Player:
             search_full_name=data.get("search_full_name"),
             hashtag=data.get("hashtag"),
             number=data.get("number"),
-            position=data.get("position"),
-            fantasy_positions=list(data.get("fantasy_positions") or []),
-            depth_chart_position=data.get("depth_chart_position"),
+            position=_intern(data.get("position")),
+            fantasy_positions=_intern_list(data.get("fantasy_positions")),
+            depth_chart_position=_intern(data.get("depth_chart_position")),
             depth_chart_order=data.get("depth_chart_order"),
-            status=data.get("status"),
-            injury_status=data.get("injury_status"),
+            status=_intern(data.get("status")),
+            injury_status=_intern(data.get("injury_status")),
             injury_start_date=data.get("injury_start_date"),
-            practice_participation=data.get("practice_participation"),
-            sport=data.get("sport"),
-            team=data.get("team"),
-            college=data.get("college"),
+            practice_participation=_intern(data.get("practice_participation")),
+            sport=_intern(data.get("sport")),
+            team=_intern(data.get("team")),
+            college=_intern(data.get("college")),
             height=data.get("height"),
             weight=data.get("weight"),
             age=data.get("age"),
@@ -75,14 +160,15 @@ class Player:
             yahoo_id=data.get("yahoo_id"),
             sportradar_id=data.get("sportradar_id"),
             stats_id=data.get("stats_id"),
-            birth_country=data.get("birth_country"),
+            birth_country=_intern(data.get("birth_country")),
             search_rank=data.get("search_rank"),
             projection=data.get("projection"),
             vorp=data.get("vorp"),
             teamshare=data.get("teamshare"),
             stddevs=data.get("stddens"),
             raw_value=data.get("raw_value"),
-            raw=dict(data),
+            adjusted_value=data.get("adjusted_value"),
+            raw=data if keep_raw else {},
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -97,26 +183,50 @@ class AllPlayers:
     """
     Container for all Player objects returned by the /players endpoint.
     - players: mapping player_id -> Player
-    - raw: original JSON dict as returned by the API
+    - raw: original JSON dict as returned by the API, only when built with keep_raw=True
+    - raw_source: optional player_id -> JSON dict loader, so get_raw works without keeping raw
     """
     players: Dict[str, "Player"] = field(default_factory=dict)
     raw: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    position_stats: Any = field(default=None, repr=False, compare=False)
+    raw_source: Optional[Callable[[str], Optional[Dict[str, Any]]]] = field(default=None, repr=False, compare=False)
+    _removal_listeners: List[Any] = field(default_factory=list, init=False, repr=False, compare=False)
+    _name_index: Any = field(default=None, init=False, repr=False, compare=False)
+    _mutations: int = field(default=0, init=False, repr=False, compare=False)
+    _indexes: Dict[str, LazyIndex] = field(default_factory=lambda: {
+        "position": LazyIndex(_player_position_keys),
+        "team": LazyIndex(lambda p: [(p.team or "").upper()]),
+    }, init=False, repr=False, compare=False)
 
     @classmethod
-    def from_sleeper_json(cls, data: Dict[str, Dict[str, Any]]) -> "AllPlayers":
+    def from_sleeper_json(cls, data: Dict[str, Dict[str, Any]], keep_raw: bool = False) -> "AllPlayers":
         """
         Build AllPlayers from the top-level /players JSON where each key is a player_id.
+        keep_raw keeps each source dict (shared between Player.raw and AllPlayers.raw).
+        """
+        return cls.from_sleeper_items((data or {}).items(), keep_raw=keep_raw)
+
+    @classmethod
+    def from_sleeper_items(cls, items: Iterable[tuple], predicate=None, keep_raw: bool = False) -> "AllPlayers":
+        """
+        Build AllPlayers from an iterable of (player_id, data) pairs, e.g. a streamed players.json.
+        - predicate(player_id, data) -> bool: only matching players are built
+        - keep_raw: also keep a copy of each source dict in AllPlayers.raw
         """
         players: Dict[str, "Player"] = {}
-        for pid, pdata in (data or {}).items():
-            # Player.from_sleeper_json expects player_id and the data dict
+        raw: Dict[str, Dict[str, Any]] = {}
+        for pid, pdata in items:
+            if predicate is not None and not predicate(pid, pdata):
+                continue
             try:
-                player_obj = Player.from_sleeper_json(pid, pdata)
+                player_obj = Player.from_sleeper_json(pid, pdata, keep_raw=keep_raw)
             except Exception:
                 # fallback: construct with minimal fields if parsing fails
                 player_obj = Player(player_id=str(pid), raw=dict(pdata))
             players[str(pid)] = player_obj
-        return cls(players=players, raw={str(k): dict(v) for k, v in (data or {}).items()})
+            if keep_raw:
+                raw[str(pid)] = player_obj.raw
+        return cls(players=players, raw=raw)
 
     def get(self, player_id: str) -> Optional["Player"]:
         return self.players.get(str(player_id))
@@ -124,31 +234,42 @@ class AllPlayers:
     def all(self) -> List["Player"]:
         return list(self.players.values())
 
+    def get_raw(self, player_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Original JSON for one player: kept raw if any, else loaded from raw_source on demand.
+        """
+        pid = str(player_id)
+        if pid in self.raw:
+            return self.raw[pid]
+        player = self.players.get(pid)
+        if player is not None and player.raw:
+            return player.raw
+        return self.raw_source(pid) if self.raw_source is not None else None
+
     def by_position(self, position: str) -> List["Player"]:
-        pos = (position or "").upper()
-        return [p for p in self.players.values() if (p.position or "").upper() == pos or pos in [fp.upper() for fp in p.fantasy_positions]]
+        # matches position or any fantasy_positions entry, case-insensitively
+        return self._indexes["position"].lookup((position or "").upper(), self.players, self._mutations)
 
     def by_team(self, team: str) -> List["Player"]:
-        t = (team or "").upper()
-        return [p for p in self.players.values() if (p.team or "").upper() == t]
-
-    def search_name(self, query: str) -> List["Player"]:
-        q = (query or "").lower()
-        results: List["Player"] = []
-        for p in self.players.values():
-            if p.search_full_name and q in p.search_full_name:
-                results.append(p)
-                continue
-            if p.first_name and p.last_name and q in f"{p.first_name.lower()} {p.last_name.lower()}":
-                results.append(p)
-                continue
-            if p.search_first_name and q in p.search_first_name:
-                results.append(p)
-                continue
-            if p.search_last_name and q in p.search_last_name:
-                results.append(p)
-                continue
-        return results
+        return self._indexes["team"].lookup((team or "").upper(), self.players, self._mutations)
+
+    def invalidate_indexes(self) -> None:
+        """
+        Drop the lookup indexes after editing players in place (e.g. changing a team).
+        """
+        for index in self._indexes.values():
+            index.invalidate()
+        self._name_index = None
+
+    def search_name(self, query: str, fuzzy: bool = False) -> List["Player"]:
+        """
+        Players whose name, team or id contains query, via a search.NameIndex built on first use.
+        fuzzy=True also returns close misspellings after the exact matches.
+        """
+        if self._name_index is None or len(self._name_index) != len(self.players):
+            import search
+            self._name_index = search.NameIndex(self.players.values())
+        return self._name_index.search(query, fuzzy=fuzzy)
 
     def __len__(self) -> int:
         return len(self.players)
@@ -161,7 +282,56 @@ class AllPlayers:
             "players": {pid: p.to_dict() for pid, p in self.players.items()},
             "raw": dict(self.raw),
         }
-    
+
+    def to_table(self):
+        """
+        Export the players to a NumPy-backed PlayerTable for vectorized valuation.
+        """
+        import player_table
+        return player_table.PlayerTable.from_players(self.players.values())
+
+    def apply_table(self, table) -> None:
+        """
+        Import vorp/teamshare/stddevs/raw_value from a PlayerTable back onto the players.
+        """
+        table.apply_to(self)
+
+    def add_removal_listener(self, callback) -> None:
+        """
+        Register callback(player) to be called whenever remove_player takes a player out.
+        """
+        self._removal_listeners.append(callback)
+
+    def set_position_stats(self, stats) -> None:
+        """
+        Attach a utils.PositionStats for this pool and keep it updated through remove_player.
+        """
+        if self.position_stats is not None and self.position_stats is not stats:
+            try:
+                self._removal_listeners.remove(self.position_stats.remove_player)
+            except ValueError:
+                pass
+        self.position_stats = stats
+        if stats is not None and stats.remove_player not in self._removal_listeners:
+            self.add_removal_listener(stats.remove_player)
+
+    def add_player(self, player: "Player") -> None:
+        """
+        Add a player, or replace the one with the same player_id; lookups stay current.
+        """
+        pid = str(player.player_id)
+        replacing = pid in self.players
+        self.players[pid] = player
+        self._mutations += 1
+        for index in self._indexes.values():
+            if replacing:
+                # the replacement keeps the old one's place in the dict, so rebuild in order
+                index.invalidate()
+            else:
+                index.add(pid, player, self._mutations)
+        # the name index has no incremental add; it is rebuilt on the next search
+        self._name_index = None
+
     def remove_player(self, player_id):
         """
         Remove a player from the AllPlayers container.
@@ -175,9 +345,19 @@ class AllPlayers:
         # keep raw in sync if it was keyed by player id
         if isinstance(self.raw, dict):
             self.raw.pop(pid, None)
-
-
-@dataclass
+        if removed is not None:
+            self._mutations += 1
+            for index in self._indexes.values():
+                index.discard(pid, removed, self._mutations)
+        if removed is not None and self._name_index is not None:
+            self._name_index.remove(pid)
+        if removed is not None:
+            for callback in self._removal_listeners:
+                callback(removed)
+        return removed
+
+
+@dataclass(slots=True)
 class User:
     user_id: str
     username: Optional[str] = None
@@ -271,7 +451,7 @@ class AllUsers:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     roster_id: Optional[int] = None
     owner_id: Optional[str] = None
@@ -290,8 +470,8 @@ class Team:
         """
         return cls(
             roster_id=data.get("roster_id"),
-            owner_id=data.get("owner_id"),
-            league_id=data.get("league_id"),
+            owner_id=_id(data.get("owner_id")),
+            league_id=_id(data.get("league_id")),
             players=[str(p) for p in (data.get("players") or [])],
             starters=[str(s) for s in (data.get("starters") or [])],
             reserve=[str(r) for r in (data.get("reserve") or [])],
@@ -313,6 +493,11 @@ class AllTeams:
     """
     teams: Dict[str, "Team"] = field(default_factory=dict)
     raw: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    _indexes: Dict[str, LazyIndex] = field(default_factory=lambda: {
+        "owner": LazyIndex(lambda t: [t.owner_id]),
+        "league": LazyIndex(lambda t: [t.league_id]),
+        "player": LazyIndex(_team_player_keys),
+    }, init=False, repr=False, compare=False)
 
     @classmethod
     def from_sleeper_json(cls, data: Dict[str, Dict[str, Any]] | Iterable[Dict[str, Any]]) -> "AllTeams":
@@ -360,14 +545,18 @@ class AllTeams:
         return list(self.teams.values())
 
     def by_owner(self, owner_id: str) -> List["Team"]:
-        return [t for t in self.teams.values() if t.owner_id == str(owner_id)]
+        return self._indexes["owner"].lookup(str(owner_id), self.teams)
 
     def by_league(self, league_id: str) -> List["Team"]:
-        return [t for t in self.teams.values() if t.league_id == str(league_id)]
+        return self._indexes["league"].lookup(str(league_id), self.teams)
 
     def by_player(self, player_id: str) -> List["Team"]:
-        pid = str(player_id)
-        return [t for t in self.teams.values() if pid in t.players or pid in t.starters or pid in t.reserve]
+        # rostered, starting or on reserve
+        return self._indexes["player"].lookup(str(player_id), self.teams)
+
+    def invalidate_indexes(self) -> None:
+        for index in self._indexes.values():
+            index.invalidate()
 
     def __len__(self) -> int:
         return len(self.teams)
@@ -382,7 +571,7 @@ class AllTeams:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Draft:
     draft_id: Optional[str] = None
     league_id: Optional[str] = None
@@ -415,8 +604,8 @@ class Draft:
         slot_to_roster_id = {int(k): int(v) for k, v in (data.get("slot_to_roster_id") or {}).items()}
 
         return cls(
-            draft_id=data.get("draft_id"),
-            league_id=data.get("league_id"),
+            draft_id=_id(data.get("draft_id")),
+            league_id=_id(data.get("league_id")),
             type=data.get("type"),
             status=data.get("status"),
             start_time=data.get("start_time"),
@@ -427,7 +616,7 @@ class Draft:
             metadata=dict(data.get("metadata") or {}),
             last_picked=data.get("last_picked"),
             last_message_time=data.get("last_message_time"),
-            last_message_id=data.get("last_message_id"),
+            last_message_id=_id(data.get("last_message_id")),
             draft_order=draft_order,
             slot_to_roster_id=slot_to_roster_id,
             creators=data.get("creators"),
@@ -448,6 +637,8 @@ class AllDrafts:
     """
     drafts: Dict[str, "Draft"] = field(default_factory=dict)
     raw: Any = field(default_factory=dict)
+    _league_index: LazyIndex = field(default_factory=lambda: LazyIndex(lambda d: [getattr(d, "league_id", None)]),
+                                     init=False, repr=False, compare=False)
 
     @classmethod
     def from_sleeper_json(cls, data: Dict[str, Dict[str, Any]] | Iterable[Dict[str, Any]]) -> "AllDrafts":
@@ -487,7 +678,7 @@ class AllDrafts:
         return list(self.drafts.values())
 
     def by_league(self, league_id: str) -> List["Draft"]:
-        return [d for d in self.drafts.values() if getattr(d, "league_id", None) == str(league_id)]
+        return self._league_index.lookup(str(league_id), self.drafts)
 
     def __len__(self) -> int:
         return len(self.drafts)
@@ -502,7 +693,7 @@ class AllDrafts:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DraftPick:
     player_id: str
     picked_by: Optional[str] = None  # user_id (may be "")
@@ -530,7 +721,7 @@ class DraftPick:
             pick_no=int(data.get("pick_no")) if data.get("pick_no") is not None else None,
             metadata=dict(data.get("metadata") or {}),
             is_keeper=(data.get("is_keeper") if data.get("is_keeper") is not None else None),
-            draft_id=data.get("draft_id"),
+            draft_id=_id(data.get("draft_id")),
             raw=dict(data),
         )
 
@@ -543,6 +734,16 @@ class AllDraftPicks:
     picks: List[DraftPick] = field(default_factory=list)
     draft_id: Optional[str] = None
     raw: List[Dict[str, Any]] = field(default_factory=list)
+    _pick_nos: set = field(default_factory=set, init=False, repr=False, compare=False)
+    _mutations: int = field(default=0, init=False, repr=False, compare=False)
+    _indexes: Dict[str, LazyIndex] = field(default_factory=lambda: {
+        "round": LazyIndex(lambda p: [p.round]),
+        "roster": LazyIndex(lambda p: [p.roster_id]),
+        "player": LazyIndex(lambda p: [p.player_id]),
+    }, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._pick_nos = {p.pick_no for p in self.picks if p.pick_no is not None}
 
     @classmethod
     def from_sleeper_list(cls, picks_list: Iterable[Dict[str, Any]]) -> "AllDraftPicks":
@@ -555,6 +756,45 @@ class AllDraftPicks:
         raw = [dict(p) for p in picks_list]
         return cls(picks=picks, draft_id=draft_id, raw=raw)
 
+    def merge(self, picks_list: Iterable[Dict[str, Any]]) -> List[DraftPick]:
+        """
+        Add picks from a (full or partial) /draft/{id}/picks payload, given as pick dicts
+        or as already decoded DraftPick objects (schemas.decode_picks).
+        Picks whose pick_no is already known are skipped before being parsed.
+        Returns only the newly added DraftPick objects, in pick_no order.
+        """
+        new_picks: List[DraftPick] = []
+        for p in picks_list:
+            decoded = not isinstance(p, dict)
+            pick_no = p.pick_no if decoded else p.get("pick_no")
+            if pick_no is not None and int(pick_no) in self._pick_nos:
+                continue
+            pick = p if decoded else DraftPick.from_sleeper_json(p)
+            if pick.pick_no is not None:
+                self._pick_nos.add(pick.pick_no)
+            new_picks.append(pick)
+            if not decoded:
+                self.raw.append(dict(p))
+        new_picks.sort(key=lambda pick: pick.pick_no if pick.pick_no is not None else 0)
+        start = len(self.picks)
+        self.picks.extend(new_picks)
+        for i, pick in enumerate(new_picks, start):
+            self._mutations += 1
+            for index in self._indexes.values():
+                index.add(i, pick, self._mutations)
+        if self.draft_id is None and new_picks:
+            self.draft_id = new_picks[0].draft_id
+        return new_picks
+
+    def last_pick_no(self) -> Optional[int]:
+        return max(self._pick_nos) if self._pick_nos else None
+
+    def __len__(self) -> int:
+        return len(self.picks)
+
+    def __iter__(self) -> Iterator[DraftPick]:
+        return iter(self.picks)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "draft_id": self.draft_id,
@@ -563,16 +803,16 @@ class AllDraftPicks:
         }
 
     def by_round(self, rnd: int) -> List[DraftPick]:
-        return [p for p in self.picks if p.round == rnd]
+        return self._indexes["round"].lookup(rnd, self.picks, self._mutations)
 
     def by_roster(self, roster_id: str) -> List[DraftPick]:
-        return [p for p in self.picks if p.roster_id == str(roster_id)]
+        return self._indexes["roster"].lookup(str(roster_id), self.picks, self._mutations)
 
     def by_player(self, player_id: str) -> List[DraftPick]:
-        return [p for p in self.picks if p.player_id == str(player_id)]
+        return self._indexes["player"].lookup(str(player_id), self.picks, self._mutations)
 
 
-@dataclass
+@dataclass(slots=True)
 class StatValue:
     """
     Normalized wrapper for a stat value which can be:
@@ -623,7 +863,7 @@ class StatValue:
         return {"raw": self.raw, "parsed": self.parsed, "source": self.source}
 
 
-@dataclass
+@dataclass(slots=True)
 class StatPlayerInfo:
     player_id: Optional[str] = None
     first_name: Optional[str] = None
@@ -643,10 +883,10 @@ class StatPlayerInfo:
             player_id=data.get("player_id"),
             first_name=data.get("first_name"),
             last_name=data.get("last_name"),
-            position=data.get("position"),
-            team=data.get("team"),
-            fantasy_positions=list(data.get("fantasy_positions") or []),
-            injury_status=data.get("injury_status"),
+            position=_intern(data.get("position")),
+            team=_intern(data.get("team")),
+            fantasy_positions=_intern_list(data.get("fantasy_positions")),
+            injury_status=_intern(data.get("injury_status")),
             years_exp=data.get("years_exp"),
             metadata=dict(data.get("metadata") or {}),
         )
@@ -655,7 +895,7 @@ class StatPlayerInfo:
         return asdict(self)
     
 
-@dataclass
+@dataclass(slots=True)
 class StatsProfileEntry:
     """
     One entry in a stats profile (the inner object like the "0" entry).
@@ -674,12 +914,12 @@ class StatsProfileEntry:
     game_id: Optional[str] = None
     stats: Dict[str, StatValue] = field(default_factory=dict)
     player: StatPlayerInfo = field(default_factory=StatPlayerInfo)
-    raw: Dict[str, Any] = field(default_factory=dict)
+    raw: Dict[str, Any] = field(default_factory=dict)  # only when built with keep_raw
 
     @classmethod
-    def from_sleeper_json(cls, index_key: str, data: Dict[str, Any]) -> "StatsProfileEntry":
-        stats_raw = dict(data.get("stats") or {})
-        stats_conv: Dict[str, StatValue] = {k: StatValue.from_raw(v) for k, v in stats_raw.items()}
+    def from_sleeper_json(cls, index_key: str, data: Dict[str, Any], keep_raw: bool = False) -> "StatsProfileEntry":
+        stats_raw = data.get("stats") or {}
+        stats_conv: Dict[str, StatValue] = {_intern(k): StatValue.from_raw(v) for k, v in stats_raw.items()}
         week_val = data.get("week")
         try:
             week_val = int(week_val) if week_val is not None else None
@@ -689,18 +929,18 @@ class StatsProfileEntry:
         return cls(
             index_key=str(index_key),
             player_id=data.get("player_id"),
-            season=str(data.get("season")) if data.get("season") is not None else None,
-            season_type=data.get("season_type"),
-            category=data.get("category"),
-            team=data.get("team"),
-            company=data.get("company"),
+            season=_intern(str(data.get("season"))) if data.get("season") is not None else None,
+            season_type=_intern(data.get("season_type")),
+            category=_intern(data.get("category")),
+            team=_intern(data.get("team")),
+            company=_intern(data.get("company")),
             week=week_val,
             last_modified=data.get("last_modified"),
             updated_at=data.get("updated_at"),
             game_id=data.get("game_id"),
             stats=stats_conv,
             player=StatPlayerInfo.from_sleeper_json(data.get("player") or {}),
-            raw=dict(data),
+            raw=data if keep_raw else {},
         )
 
     def stat_value(self, key: str) -> Optional[StatValue]:
@@ -717,28 +957,30 @@ class StatsProfileEntry:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class StatsProfile:
     """
     Container for a player's stats profile returned as a map (keys like "0","1"...).
     - entries: mapping index_key -> StatsProfileEntry
     - player_id: filled if available from entries
-    - raw: original profile JSON
+    - raw: original profile JSON (only with keep_raw), or the flat item itself for profiles
+      that couldn't be split into entries, e.g. the projections list shape (see scoring._profile_stats)
     """
     entries: Dict[str, StatsProfileEntry] = field(default_factory=dict)
     player_id: Optional[str] = None
     raw: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
-    def from_sleeper_profile(cls, data: Dict[str, Any]) -> "StatsProfile":
+    def from_sleeper_profile(cls, data: Dict[str, Any], keep_raw: bool = False) -> "StatsProfile":
         entries: Dict[str, StatsProfileEntry] = {}
         pid: Optional[str] = None
         for k, v in (data or {}).items():
-            entry = StatsProfileEntry.from_sleeper_json(k, v)
+            entry = StatsProfileEntry.from_sleeper_json(k, v, keep_raw)
             entries[str(k)] = entry
             if not pid and entry.player_id:
                 pid = entry.player_id
-        return cls(entries=entries, player_id=pid, raw={str(k): dict(v) for k, v in (data or {}).items()})
+        raw = {str(k): v for k, v in (data or {}).items()} if keep_raw else {}
+        return cls(entries=entries, player_id=pid, raw=raw)
 
     def latest_entry(self) -> Optional[StatsProfileEntry]:
         # choose latest by updated_at then last_modified then index order
@@ -759,18 +1001,80 @@ class StatsProfile:
         }
 
 
+@dataclass(slots=True)
+class StatColumns:
+    """
+    Numeric stats as flat arrays, filled straight from the projections payload.
+    Player player_ids[r] owns counts[r] consecutive entries of cols/values, and cols
+    index into stat_keys. scoring.StatMatrix scatters this into its dense matrix.
+    """
+    player_ids: List[str] = field(default_factory=list)
+    stat_keys: List[str] = field(default_factory=list)
+    counts: array = field(default_factory=lambda: array("l"))
+    cols: array = field(default_factory=lambda: array("l"))
+    values: array = field(default_factory=lambda: array("d"))
+
+
 @dataclass
 class AllStats:
     """
     Container for StatsProfile objects for many players.
     - profiles: mapping player_id -> StatsProfile
-    - raw: original JSON as returned by the API (dict or list normalized)
+    - raw: original JSON as returned by the API (dict or list normalized), only with keep_raw
+    - columns: StatColumns when the payload was the flat projections list (fast path)
+    - last_modified: newest last_modified/updated_at seen by the fast path
     """
     profiles: Dict[str, StatsProfile] = field(default_factory=dict)
     raw: Any = field(default_factory=dict)
+    columns: Optional[StatColumns] = field(default=None, repr=False, compare=False)
+    last_modified: Optional[int] = field(default=None, repr=False, compare=False)
 
     @classmethod
-    def from_sleeper_json(cls, data: Dict[str, Any] | Iterable[Dict[str, Any]]) -> "AllStats":
+    def from_projection_list(cls, data: List[Dict[str, Any]], keep_raw: bool = False) -> Optional["AllStats"]:
+        """
+        Fast path for the projections endpoint: a list of {"player_id", "stats": {...}, ...}.
+        Numeric stats go straight into StatColumns (no StatValue per stat); each profile just
+        references its item. Returns None as soon as an item doesn't fit that shape so the
+        tolerant parser can run instead.
+        """
+        profiles: Dict[str, StatsProfile] = {}
+        stat_index: Dict[str, int] = {}
+        counts: List[int] = []
+        cols: List[int] = []
+        values: List[float] = []
+        latest = None
+        for item in data:
+            if type(item) is not dict:
+                return None
+            pid = item.get("player_id")
+            stats = item.get("stats")
+            if pid is None or type(stats) is not dict:
+                return None
+            pid = str(pid)
+            if pid in profiles:
+                # repeated player (e.g. weekly rows): leave it to the tolerant parser
+                return None
+            profiles[pid] = StatsProfile(player_id=pid, raw=item)
+            for stamp in (item.get("last_modified"), item.get("updated_at")):
+                if type(stamp) in (int, float) and (latest is None or stamp > latest):
+                    latest = stamp
+            if not _NUMBER_TYPES.issuperset(map(type, stats.values())):
+                # bools, strings or None mixed in: keep only the real numbers
+                stats = {k: v for k, v in stats.items() if type(v) is float or type(v) is int}
+            if not stat_index.keys() >= stats.keys():
+                for key in stats:
+                    if key not in stat_index:
+                        stat_index[_intern(key)] = len(stat_index)
+            # list.extend over dict views runs at C speed
+            counts.append(len(stats))
+            cols.extend(map(stat_index.__getitem__, stats))
+            values.extend(stats.values())
+        columns = StatColumns(player_ids=list(profiles), stat_keys=list(stat_index), counts=array("l", counts),
+                              cols=array("l", cols), values=array("d", values))
+        return cls(profiles=profiles, raw={"list": list(data)} if keep_raw else {}, columns=columns, last_modified=latest)
+
+    @classmethod
+    def from_sleeper_json(cls, data: Dict[str, Any] | Iterable[Dict[str, Any]], keep_raw: bool = False) -> "AllStats":
         """
         Accept either:
         - mapping player_id -> profile-mapping (typical response)
@@ -782,6 +1086,12 @@ class AllStats:
         if not data:
             return cls(profiles={}, raw={})
 
+        # the projections endpoint's flat list shape has a fast path
+        if isinstance(data, list):
+            fast = cls.from_projection_list(data, keep_raw)
+            if fast is not None:
+                return fast
+
         # helper to try to extract player_id and profile mapping from an item
         def _extract(item: Any) -> (Optional[str], Dict[str, Any]):
             if not isinstance(item, dict):
@@ -806,40 +1116,42 @@ class AllStats:
 
         # If data is a mapping of player_id -> profile mapping
         if isinstance(data, dict) and all(isinstance(v, dict) for v in data.values()):
-            raw = {str(k): dict(v) for k, v in (data or {}).items()}
+            raw = {str(k): v for k, v in (data or {}).items()} if keep_raw else {}
             for pid, pdata in (data or {}).items():
                 try:
-                    profile = StatsProfile.from_sleeper_profile(pdata)
+                    profile = StatsProfile.from_sleeper_profile(pdata, keep_raw)
                 except Exception:
-                    profile = StatsProfile(entries={}, player_id=str(pid), raw=dict(pdata))
+                    profile = StatsProfile(entries={}, player_id=str(pid), raw=pdata)
                 profiles[str(profile.player_id or pid)] = profile
             return cls(profiles=profiles, raw=raw)
 
         # otherwise treat as iterable/list of items
         raw_list = []
         for item in data:
-            raw_list.append(dict(item) if isinstance(item, dict) else item)
+            if keep_raw:
+                raw_list.append(item)
             pid, pdata = _extract(item)
             try:
                 if isinstance(pdata, dict) and any(str(k).isdigit() for k in pdata.keys()):
-                    profile = StatsProfile.from_sleeper_profile(pdata)
+                    profile = StatsProfile.from_sleeper_profile(pdata, keep_raw)
                 else:
                     # if item is {player_id: profile} handle that case
                     if isinstance(item, dict) and len(item) == 1:
                         k, v = next(iter(item.items()))
                         if isinstance(v, dict):
-                            profile = StatsProfile.from_sleeper_profile(v)
+                            profile = StatsProfile.from_sleeper_profile(v, keep_raw)
                             pid = pid or k
                         else:
-                            profile = StatsProfile(entries={}, player_id=pid, raw=dict(item))
+                            profile = StatsProfile(entries={}, player_id=pid, raw=item)
                     else:
-                        profile = StatsProfile.from_sleeper_profile(pdata) if isinstance(pdata, dict) else StatsProfile(entries=[], player_id=pid, raw=dict(item))
+                        profile = StatsProfile.from_sleeper_profile(pdata, keep_raw) if isinstance(pdata, dict) else StatsProfile(entries=[], player_id=pid, raw=item)
                 profiles[str(profile.player_id or pid or len(profiles))] = profile
             except Exception:
+                # the item is the profile's only copy of its data, so it is kept (by reference)
                 key = str(pid) if pid else str(len(profiles))
-                profiles[key] = StatsProfile(entries={}, player_id=pid, raw=dict(item) if isinstance(item, dict) else {"raw": item})
+                profiles[key] = StatsProfile(entries={}, player_id=pid, raw=item if isinstance(item, dict) else {"raw": item})
 
-        return cls(profiles=profiles, raw={"list": raw_list})
+        return cls(profiles=profiles, raw={"list": raw_list} if keep_raw else {})
 
     def get(self, player_id: str) -> Optional[StatsProfile]:
         return self.profiles.get(str(player_id))
@@ -869,7 +1181,7 @@ class AllStats:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class League:
     total_rosters: Optional[int] = None
     status: Optional[str] = None
@@ -899,7 +1211,7 @@ class League:
             season=str(data.get("season")) if data.get("season") is not None else None,
             scoring_settings=dict(data.get("scoring_settings") or {}),
             roster_positions=list(data.get("roster_positions") or []),
-            previous_league_id=data.get("previous_league_id"),
+            previous_league_id=_id(data.get("previous_league_id")),
             name=data.get("name"),
             league_id=str(data.get("league_id")) if data.get("league_id") is not None else None,
             draft_id=str(data.get("draft_id")) if data.get("draft_id") is not None else None,
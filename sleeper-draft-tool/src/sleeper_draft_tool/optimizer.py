@@ -0,0 +1,365 @@
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import draft_state as ds
+import instrument
+
+NEG = -np.inf
+
+
+@dataclass
+class RosterSolution:
+    """
+    Best set of available players for a team's open starting slots.
+    - slots: roster slot -> player ids placed there
+    - cost: sum of the players' prices; budget: dollars the starters could use
+    """
+    player_ids: List[str]
+    slots: Dict[str, List[str]]
+    projection: float
+    cost: int
+    budget: int
+
+
+def _slot_accepts(slot, positions):
+    eligible = ds.SLOT_ELIGIBILITY.get(slot)
+    return bool(eligible & positions) if eligible is not None else slot in positions
+
+
+def _undominated(costs, points, max_count):
+    """
+    Indexes of the players worth considering: a player is dropped when max_count others
+    cost no more and project at least as much, since one of those always does as well.
+    """
+    kept, top = [], []  # top: min-heap of the best max_count projections seen so far
+    for i in np.lexsort((-points, costs)):
+        if len(top) >= max_count and points[i] <= top[0]:
+            continue
+        kept.append(int(i))
+        heapq.heappush(top, points[i])
+        if len(top) > max_count:
+            heapq.heappop(top)
+    return kept
+
+
+def _knapsack(costs, points, max_count, budget):
+    """
+    best[k, b]: most points from exactly k players with total cost <= b (-inf if impossible);
+    take[i, k, b]: player i is part of best[k, b] among players 0..i (for backtracking).
+    """
+    best = np.full((max_count + 1, budget + 1), NEG)
+    best[0] = 0.0
+    take = np.zeros((len(costs), max_count + 1, budget + 1), dtype=bool)
+    for i, (cost, point) in enumerate(zip(costs, points)):
+        if cost > budget:
+            continue
+        candidate = np.full_like(best, NEG)
+        candidate[1:, cost:] = best[:-1, :budget + 1 - cost] + point
+        take[i] = candidate > best
+        best = np.maximum(best, candidate)
+    return best, take
+
+
+class _Group:
+    # available players sharing one set of eligible positions, with their knapsack table
+    __slots__ = ("positions", "rows", "kept", "best", "take")
+
+    def __init__(self, positions):
+        self.positions = positions
+        self.rows = []      # optimizer rows in this group
+        self.kept = None    # undominated available rows, in knapsack order
+        self.best = None
+        self.take = None
+
+    def pick(self, costs, k, b):
+        # rows behind best[k, b]
+        chosen = []
+        for i in range(len(self.kept) - 1, -1, -1):
+            if k == 0:
+                break
+            if self.take[i, k, b]:
+                chosen.append(self.kept[i])
+                k -= 1
+                b -= costs[self.kept[i]]
+        return chosen
+
+
+class RosterOptimizer:
+    """
+    "Given my remaining budget and open slots, which available players maximize my projection?"
+
+    Every open starting slot in the team's DraftState is filled. A player may take a slot if
+    one of Player.fantasy_positions (or the position) fits it, FLEX-style slots per
+    SLOT_ELIGIBILITY. Each player costs prices[player_id], by default the adjusted or raw
+    value rounded to whole dollars and at least $1. Open bench slots are held back at $1 each.
+
+    Players with the same eligible positions form a group. Each group gets a
+    cardinality-knapsack table: the best projection for k players at total cost <= b, built
+    only from players no others dominate on price and projection. A DP over groups then
+    tracks how many of each slot type are used and combines the tables with a max-plus
+    convolution over the budget. A slot type stops being tracked once no later group can
+    fill it.
+
+    Warm start: as a DraftState listener, a pick only rebuilds the tables of groups that lost
+    an undominated player. The last solution is kept as is when none of its players went and
+    the team's budget and slots did not change.
+    """
+
+    def __init__(self, players, draft_state, team, prices=None, subscribe=True):
+        self.draft_state = draft_state
+        self.team = str(team)
+        rows = [p for p in players if p.projection is not None and p.projection == p.projection]
+        self.player_ids = [p.player_id for p in rows]
+        self._row_index = {pid: i for i, pid in enumerate(self.player_ids)}
+        self.projection = np.array([p.projection for p in rows], dtype=np.float64)
+        prices = prices or {}
+        self.costs = np.array([max(1, int(round(self._price(p, prices)))) for p in rows], dtype=np.intp)
+        self.available = np.array([draft_state.is_available(pid) for pid in self.player_ids], dtype=bool)
+        self.groups = {}
+        self._group_of = []
+        for row, player in enumerate(rows):
+            positions = frozenset(player.fantasy_positions or ()) | {player.position}
+            group = self.groups.setdefault(positions, _Group(positions))
+            group.rows.append(row)
+            self._group_of.append(group)
+        self._shape = None          # (open starting slots, budget) the cached results are for
+        self._solution = None
+        self._marginals = None
+        self._diff = None
+        if subscribe:
+            draft_state.subscribe(self.on_picks)
+
+    @staticmethod
+    def _price(player, prices):
+        price = prices.get(player.player_id)
+        if price is None:
+            price = player.adjusted_value if getattr(player, "adjusted_value", None) is not None else player.raw_value
+        return price if price is not None and price == price else 1
+
+    def _team_shape(self):
+        team = self.draft_state.teams.get(self.team)
+        if team is None:
+            return (), 0
+        slots = tuple(sorted((slot, n) for slot, n in team.open_slots.items() if n > 0 and slot != ds.BENCH_SLOT))
+        return slots, team.remaining - team.open_slots.get(ds.BENCH_SLOT, 0)
+
+    def _build(self, group, budget):
+        rows = [row for row in group.rows if self.available[row]]
+        costs, points = self.costs[rows], self.projection[rows]
+        group.kept = [rows[i] for i in _undominated(costs, points, self._max_count(group))]
+        group.best, group.take = _knapsack(self.costs[group.kept], self.projection[group.kept], self._max_count(group),
+                                           budget)
+
+    def _max_count(self, group):
+        return sum(n for slot, n in self._shape[0] if _slot_accepts(slot, group.positions))
+
+    def _maxplus(self, a, c):
+        # out[b] = max over j of a[b - j] + c[j], with the j used
+        diff = self._diff[:len(a), :len(a)]
+        scores = np.where(diff >= 0, a[np.maximum(diff, 0)] + c[None, :], NEG)
+        j = scores.argmax(axis=1)
+        return scores[np.arange(len(a)), j], j
+
+    def _combine(self, caps, groups, budget):
+        """
+        DP over groups keyed by how many of each slot type are used. Returns (values by budget,
+        back pointers, final state) for the state with every fillable slot in caps filled, or
+        None. Slot types no available player fits are left open.
+        """
+        slot_names = list(caps)
+        eligible = [[k for k, slot in enumerate(slot_names) if caps[slot] and _slot_accepts(slot, g.positions)]
+                    for g in groups]
+        last = [max((gi for gi, slots in enumerate(eligible) if k in slots), default=-1) for k in range(len(slot_names))]
+        capacity = [caps[slot] if last[k] >= 0 else 0 for k, slot in enumerate(slot_names)]
+        states = {tuple([0] * len(slot_names)): np.zeros(budget + 1)}
+        back = []
+        for gi, group in enumerate(groups):
+            closing = [k for k in range(len(slot_names)) if last[k] == gi]
+            new, steps = {}, {}
+            for used, values in states.items():
+                for alloc in itertools.product(*[range(capacity[k] - used[k] + 1) for k in eligible[gi]]):
+                    count = sum(alloc)
+                    after = list(used)
+                    for k, n in zip(eligible[gi], alloc):
+                        after[k] += n
+                    if count >= len(group.best) or any(after[k] != capacity[k] for k in closing):
+                        continue
+                    if count == 0:
+                        total, spent = values, np.zeros(budget + 1, dtype=np.intp)
+                    else:
+                        total, spent = self._maxplus(values, group.best[count, :budget + 1])
+                    after = tuple(after)
+                    step = (used, {slot_names[k]: n for k, n in zip(eligible[gi], alloc) if n}, count)
+                    if after not in new:
+                        new[after] = total
+                        steps[after] = [(step, spent, np.ones(budget + 1, dtype=bool))]
+                        continue
+                    better = total > new[after]
+                    if better.any():
+                        for _, _, mask in steps[after]:
+                            mask &= ~better
+                        steps[after].append((step, spent, better))
+                        new[after] = np.where(better, total, new[after])
+            if not new:
+                return None
+            states = new
+            back.append(steps)
+        full = tuple(capacity)
+        return (states[full], back, full) if full in states else None
+
+    @staticmethod
+    def _path(groups, back, state, budget):
+        # walk the back pointers from state at budget: (group, k, dollars, slot allocation) per group
+        path = []
+        for gi in range(len(groups) - 1, -1, -1):
+            for (prev, alloc, count), spent, mask in back[gi][state]:
+                if mask[budget]:
+                    dollars = int(spent[budget])
+                    path.append((groups[gi], count, dollars, alloc))
+                    state, budget = prev, budget - dollars
+                    break
+        return path
+
+    def _groups(self):
+        return [g for g in self.groups.values() if g.best is not None and g.kept and self._max_count(g)]
+
+    def _refresh(self):
+        shape = self._team_shape()
+        if shape != self._shape:
+            old = self._shape
+            self._shape = shape
+            self._solution = self._marginals = None
+            # tables stay valid while the budget and slot counts only shrink
+            if old is None or shape[1] > old[1] or any(n > dict(old[0]).get(slot, 0) for slot, n in shape[0]):
+                for group in self.groups.values():
+                    group.best = None
+        slots, budget = self._shape
+        budget = max(budget, 0)
+        if self._diff is None or len(self._diff) != budget + 1:
+            index = np.arange(budget + 1)
+            self._diff = index[:, None] - index[None, :]
+        for group in self.groups.values():
+            if group.best is None and self._max_count(group):
+                self._build(group, budget)
+        return dict(slots), budget
+
+    def solve(self) -> Optional[RosterSolution]:
+        """
+        The best roster for the team's open starting slots, or None if the budget can't fill them.
+        """
+        caps, budget = self._refresh()
+        if self._solution is not None:
+            return self._solution
+        with instrument.span("optimize", rows=int(self.available.sum()), slots=sum(caps.values())):
+            groups = self._groups()
+            result = self._combine(caps, groups, budget)
+            if result is None or result[0][budget] == NEG:
+                return None
+            values, back, full = result
+            slots = {}
+            for group, count, dollars, alloc in self._path(groups, back, full, budget):
+                picked = sorted(group.pick(self.costs, count, dollars), key=lambda row: -self.projection[row])
+                # best players into the position's own slots, the rest into flex slots
+                for slot, n in sorted(alloc.items(), key=lambda item: item[0] in ds.SLOT_ELIGIBILITY):
+                    slots.setdefault(slot, []).extend(self.player_ids[row] for row in picked[:n])
+                    picked = picked[n:]
+            chosen = [pid for ids in slots.values() for pid in ids]
+            rows = [self._row_index[pid] for pid in chosen]
+            self._solution = RosterSolution(chosen, slots, float(values[budget]), int(self.costs[rows].sum()), budget)
+        return self._solution
+
+    def marginal_values(self) -> Dict[str, float]:
+        """
+        {player_id: best roster projection with the player at their price - best without them}
+        for every available player an open starting slot could take. Positive for the players
+        in the solution (what losing them costs), zero or negative for everyone else. When
+        nobody else can fill a slot within the budget, the roster without the player leaves
+        that slot open.
+        """
+        solution = self.solve()
+        if solution is None:
+            return {}
+        if self._marginals is not None:
+            return self._marginals
+        caps, budget = dict(self._shape[0]), self._shape[1]
+        with instrument.span("optimize.marginal", rows=int(self.available.sum())):
+            groups = self._groups()
+            best = solution.projection
+            marginals = {pid: best - self._without(self._row_index[pid], caps, budget, leave_open=True)
+                         for pid in solution.player_ids}
+            # best roster for the other slots once the player takes one slot of a type, at every budget
+            rest = {}
+            for slot in caps:
+                fewer = dict(caps, **{slot: caps[slot] - 1})
+                rest[slot] = (fewer, self._combine(fewer, groups, budget))
+            used = {}  # (slot, budget) -> rows in that rest-of-roster solution
+            for row in np.flatnonzero(self.available):
+                pid = self.player_ids[row]
+                cost = self.costs[row]
+                if pid in marginals or cost > budget:
+                    continue
+                group = self._group_of[row]
+                value = NEG
+                for slot, (fewer, result) in rest.items():
+                    if result is None or not _slot_accepts(slot, group.positions) or result[0][budget - cost] == NEG:
+                        continue
+                    other = result[0][budget - cost]
+                    if row in group.kept:
+                        key = (slot, budget - cost)
+                        if key not in used:
+                            used[key] = {r for g, count, dollars, _ in self._path(groups, result[1], result[2], budget - cost)
+                                         for r in g.pick(self.costs, count, dollars)}
+                        if row in used[key]:
+                            # that roster already has this player: solve it without them
+                            other = self._without(row, fewer, budget - cost)
+                    value = max(value, other + self.projection[row])
+                if value != NEG:
+                    marginals[pid] = float(value - best)
+            self._marginals = marginals
+        return marginals
+
+    def _best(self, caps, groups, budget):
+        result = self._combine(caps, groups, budget)
+        return float(result[0][budget]) if result is not None else NEG
+
+    def _without(self, row, caps, budget, leave_open=False):
+        # best projection at budget with one player taken out of the pool; with leave_open, a
+        # slot nobody else can fill within the budget stays open, as solve does with slots no
+        # available player fits (the solution minus the player always fills the rest)
+        group = self._group_of[row]
+        saved = group.kept, group.best, group.take
+        self.available[row] = False
+        try:
+            self._build(group, self._shape[1])
+            groups = self._groups()
+            best = self._best(caps, groups, budget)
+            if best == NEG and leave_open:
+                best = max((self._best(dict(caps, **{slot: n - 1}), groups, budget) for slot, n in caps.items() if n),
+                           default=NEG)
+        finally:
+            self.available[row] = True
+            group.kept, group.best, group.take = saved
+        return best
+
+    def on_picks(self, player_ids):
+        """
+        DraftState listener: drop the drafted players and invalidate only what they touched.
+        """
+        solution = set(self._solution.player_ids) if self._solution is not None else set()
+        for pid in player_ids:
+            row = self._row_index.get(str(pid))
+            if row is None or not self.available[row]:
+                continue
+            self.available[row] = False
+            group = self._group_of[row]
+            if group.kept is not None and row in group.kept:
+                group.best = None
+                self._marginals = None
+            elif self._marginals is not None:
+                self._marginals.pop(self.player_ids[row], None)
+            if pid in solution:
+                self._solution = None
@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional
+
+import numpy as np
+
+
+@dataclass
+class PlayerTable:
+    """
+    Column-oriented view of a player pool used for vectorized valuation.
+    - player_ids: player id per row (object array of str)
+    - positions: distinct position labels; position_codes[i] indexes into it
+    - projection, vorp, teamshare, stddevs, raw_value, adjusted_value: float64 columns (NaN when unset)
+    """
+    player_ids: np.ndarray
+    positions: List[str]
+    position_codes: np.ndarray
+    projection: np.ndarray
+    vorp: np.ndarray
+    teamshare: np.ndarray
+    stddevs: np.ndarray
+    raw_value: np.ndarray
+    adjusted_value: np.ndarray
+    _row_index: Optional[Dict[str, int]] = field(default=None, repr=False, compare=False)
+
+    VALUE_COLUMNS = ("projection", "vorp", "teamshare", "stddevs", "raw_value", "adjusted_value")
+
+    @classmethod
+    def from_players(cls, all_players) -> "PlayerTable":
+        """
+        Export an AllPlayers container (or any iterable of Player) into columns.
+        """
+        players = list(all_players)
+        positions, codes = np.unique(np.array([p.position or "" for p in players], dtype=object).astype(str), return_inverse=True)
+        columns = {
+            col: np.array([getattr(p, col) for p in players], dtype=np.float64)
+            for col in cls.VALUE_COLUMNS
+        }
+        return cls(
+            player_ids=np.array([p.player_id for p in players], dtype=object),
+            positions=[str(pos) for pos in positions],
+            position_codes=codes.astype(np.intp),
+            **columns,
+        )
+
+    def apply_to(self, all_players) -> None:
+        """
+        Write the value columns back onto the matching Player objects.
+        """
+        columns = [getattr(self, col).tolist() for col in self.VALUE_COLUMNS[1:]]
+        for pid, vorp, teamshare, stddevs, raw_value, adjusted_value in zip(self.player_ids, *columns):
+            player = all_players.players.get(pid)
+            if player is None:
+                continue
+            player.vorp = vorp
+            player.teamshare = teamshare
+            player.stddevs = stddevs
+            player.raw_value = raw_value
+            player.adjusted_value = None if adjusted_value != adjusted_value else adjusted_value
+
+    def row(self, player_id: str) -> Optional[int]:
+        if self._row_index is None:
+            self._row_index = {pid: i for i, pid in enumerate(self.player_ids)}
+        return self._row_index.get(str(player_id))
+
+    def position_code(self, position: str) -> Optional[int]:
+        try:
+            return self.positions.index(position)
+        except ValueError:
+            return None
+
+    def position_mask(self, position: str) -> np.ndarray:
+        code = self.position_code(position)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.position_codes == code
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
@@ -0,0 +1,149 @@
+import numpy as np
+
+MODES = ("kde", "hist", "normal")
+
+
+def normal_curve(mean, std, points=300):
+    # normal pdf centered on the mean; the old plot, used when there are no projections
+    std = std if std > 0 else 1.0
+    span = max(4.0 * std, max(1.0, abs(mean) * 0.5))
+    x = np.linspace(mean - span, mean + span, points)
+    return x, (1.0 / (std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mean) / std) ** 2)
+
+
+def kde_curve(values, points=300):
+    """
+    Gaussian kernel density estimate of values on an evenly spaced grid (Scott's bandwidth).
+    """
+    values = np.asarray(values, dtype=float)
+    bandwidth = values.std() * len(values) ** -0.2 or 1.0
+    x = np.linspace(values.min() - 3 * bandwidth, values.max() + 3 * bandwidth, points)
+    z = (x[:, None] - values[None, :]) / bandwidth
+    y = np.exp(-0.5 * z * z).sum(axis=1) / (len(values) * bandwidth * np.sqrt(2 * np.pi))
+    return x, y
+
+
+class PositionPlot:
+    """
+    One position's projection distribution, built once and updated in place.
+
+    update() swaps the data of the existing artists (KDE curve, histogram or normal curve,
+    mean line) and schedules a single redraw. The selected-player highlight is an animated
+    artist: the rest of the figure is cached as a background on every full draw, and
+    highlight() restores that background and blits just the highlight, so moving through
+    the table never redraws the figure.
+    """
+
+    def __init__(self, figure, canvas, mode="kde", points=300):
+        if mode not in MODES:
+            raise ValueError(f"Unknown plot mode {mode}, expected one of {', '.join(MODES)}")
+        self.figure = figure
+        self.canvas = canvas
+        self.mode = mode
+        self.points = points
+        self.ax = ax = figure.add_subplot(111)
+        ax.set_yticks([])
+        ax.set_xlabel("Projection")
+        self.curve, = ax.plot([], [], color="tab:blue")
+        self.fill = ax.fill_between([0.0, 1.0], [0.0, 0.0], color="tab:blue", alpha=0.2)
+        self.bars = ax.stairs([0.0], [0.0, 1.0], fill=True, color="tab:blue", alpha=0.3, visible=False)
+        self.mean_line = ax.axvline(0.0, color="tab:red", linestyle="--", linewidth=1, visible=False)
+        self.empty_text = ax.text(0.5, 0.5, "N/A", color="gray", ha="center", va="center", transform=ax.transAxes,
+                                  visible=False)
+        self.highlight_line = ax.axvline(0.0, color="green", linestyle="--", linewidth=1.5, zorder=5, animated=True,
+                                         visible=False)
+        self.highlight_marker, = ax.plot([], [], marker="o", color="green", markersize=6, zorder=6, animated=True,
+                                         visible=False)
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self._background = None
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, _event):
+        # a full draw just happened (update, resize): cache it and put the highlight back on top
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_highlight()
+
+    def _draw_highlight(self):
+        for artist in (self.highlight_line, self.highlight_marker):
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def update(self, stats, projections=None):
+        """
+        Show the distribution of projections (or the normal curve from stats when there are
+        too few) and the mean line. Returns False, and shows N/A, when there is nothing to plot.
+        """
+        values = np.asarray(projections if projections is not None else (), dtype=float)
+        values = values[~np.isnan(values)]
+        mean = stats.get("mean") if stats else None
+        std = stats.get("std_dev") if stats else None
+        mode = self.mode if len(values) >= 2 else "normal"
+        if mode == "normal" and (mean is None or std is None):
+            self.clear()
+            return False
+
+        if mode == "hist":
+            counts, edges = np.histogram(values, bins="auto", density=True)
+            self.bars.set_data(counts, edges)
+            self.x = (edges[:-1] + edges[1:]) / 2
+            self.y = counts
+        else:
+            self.x, self.y = kde_curve(values, self.points) if mode == "kde" else normal_curve(float(mean), float(std), self.points)
+            self.curve.set_data(self.x, self.y)
+            self.fill.set_verts([np.column_stack((np.r_[self.x[0], self.x, self.x[-1]], np.r_[0.0, self.y, 0.0]))])
+        self.bars.set_visible(mode == "hist")
+        self.curve.set_visible(mode != "hist")
+        self.fill.set_visible(mode != "hist")
+        self.empty_text.set_visible(False)
+        if mean is not None:
+            self.mean_line.set_xdata([float(mean)] * 2)
+        self.mean_line.set_visible(mean is not None)
+        self.highlight_line.set_visible(False)
+        self.highlight_marker.set_visible(False)
+
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
+        self.ax.set_ylim(bottom=0)
+        self._background = None  # stale until the next full draw
+        self.canvas.draw_idle()
+        return True
+
+    def clear(self):
+        for artist in (self.curve, self.fill, self.bars, self.mean_line, self.highlight_line, self.highlight_marker):
+            artist.set_visible(False)
+        self.empty_text.set_visible(True)
+        self.x = self.y = np.empty(0)
+        self._background = None
+        self.canvas.draw_idle()
+
+    def density_at(self, value):
+        # height of the shown distribution at value, or None outside it
+        if not len(self.x):
+            return None
+        if self.bars.get_visible():
+            edges = self.bars.get_data().edges
+            if value < edges[0] or value > edges[-1]:
+                return None
+            return float(self.y[min(np.searchsorted(edges, value, side="right") - 1, len(self.y) - 1)])
+        if value < self.x[0] or value > self.x[-1]:
+            return None
+        return float(np.interp(value, self.x, self.y))
+
+    def highlight(self, value):
+        """
+        Move the selected-player line and marker to value, redrawing only those two artists.
+        """
+        if not len(self.x):
+            return
+        y = self.density_at(value)
+        self.highlight_line.set_xdata([value, value])
+        self.highlight_line.set_visible(True)
+        self.highlight_marker.set_data([value], [y if y is not None else 0.0])
+        self.highlight_marker.set_visible(y is not None)
+        if self._background is None:
+            self.canvas.draw()  # first draw caches the background and draws the highlight
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_highlight()
+        self.canvas.blit(self.figure.bbox)
@@ -0,0 +1,111 @@
+import bisect
+
+
+def _stable_positions(old_positions):
+    """
+    Indexes (into old_positions) of a longest increasing subsequence, skipping None.
+    Those rows are already in the right relative order and never need to move.
+    """
+    tails = []      # tails[k] = index of the smallest tail of an increasing run of length k+1
+    tail_values = []
+    parents = [None] * len(old_positions)
+    for i, position in enumerate(old_positions):
+        if position is None:
+            continue
+        k = bisect.bisect_left(tail_values, position)
+        parents[i] = tails[k - 1] if k > 0 else None
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(position)
+        else:
+            tails[k] = i
+            tail_values[k] = position
+    stable = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        stable.add(i)
+        i = parents[i]
+    return stable
+
+
+class TreeviewSync:
+    """
+    Keeps a flat ttk.Treeview in step with a row list without rebuilding it.
+
+    Every row key (player_id) owns one Treeview item for the life of the table. sync(rows)
+    diffs the new rows against what is on screen and only issues:
+    - item(values=...) for rows whose formatted values changed
+    - detach for rows that left (they keep their item and come back with reattach)
+    - insert for rows never seen before
+    - move/reattach for rows out of order; rows on the longest run already in order stay put
+    Items that stay attached keep their selection, and the scroll position is restored.
+    """
+
+    def __init__(self, tree, formatter, key=None):
+        self.tree = tree
+        self.formatter = formatter
+        self.key = key or (lambda row: row[-1])
+        self._items = {}    # key -> item id
+        self._values = {}   # key -> values last written to the item
+        self._order = []    # keys currently attached, top to bottom
+        self.last_counts = {}
+
+    def item_for(self, key):
+        return self._items.get(key)
+
+    def _index_after(self, previous_item, appending):
+        if appending:
+            return "end"
+        return self.tree.index(previous_item) + 1 if previous_item is not None else 0
+
+    def sync(self, rows):
+        """
+        Make the tree show rows, in order. Returns counts of the Treeview calls made.
+        """
+        tree = self.tree
+        counts = {"updated": 0, "inserted": 0, "moved": 0, "detached": 0}
+        first_visible = tree.yview()[0] if self._order else 0.0
+        selection = set(tree.selection())
+        selected_keys = {key for key, item in self._items.items() if item in selection}
+
+        keys = [self.key(row) for row in rows]
+        new_keys = set(keys)
+        leaving = [key for key in self._order if key not in new_keys]
+        if leaving:
+            tree.detach(*[self._items[key] for key in leaving])
+            counts["detached"] = len(leaving)
+
+        old_index = {key: i for i, key in enumerate(self._order)}
+        stable = _stable_positions([old_index.get(key) for key in keys])
+        # with nothing attached yet (first load, or after an empty filter) rows just append
+        appending = not old_index
+        previous_item = None
+        for i, (key, row) in enumerate(zip(keys, rows)):
+            values = tuple(self.formatter(row))
+            item = self._items.get(key)
+            if item is None:
+                item = tree.insert("", self._index_after(previous_item, appending), values=values)
+                self._items[key] = item
+                self._values[key] = values
+                counts["inserted"] += 1
+            else:
+                if i not in stable:
+                    if key in old_index:
+                        # take it out first so the target index doesn't count its old position
+                        tree.detach(item)
+                    # move() also reattaches a detached item
+                    tree.move(item, "", self._index_after(previous_item, appending))
+                    counts["moved"] += 1
+                if values != self._values[key]:
+                    tree.item(item, values=values)
+                    self._values[key] = values
+                    counts["updated"] += 1
+            previous_item = item
+        self._order = keys
+
+        still_selected = [self._items[key] for key in selected_keys if key in new_keys]
+        if still_selected and set(still_selected) != set(tree.selection()):
+            tree.selection_set(still_selected)
+        tree.yview_moveto(first_visible)
+        self.last_counts = counts
+        return counts
@@ -0,0 +1,309 @@
+from typing import Any, Dict, List, Optional, Union
+
+import models
+
+# Typed decoding of Sleeper payloads with msgspec, when it is installed.
+# The JSON is parsed and validated against the structs below in one C-level pass and then
+# copied into the regular model dataclasses, so callers get the same objects as from the
+# tolerant from_sleeper_json parsers. A field of the wrong type raises ValueError instead
+# of being passed through or dropped. Model .raw fields are left empty on this path.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+AVAILABLE = msgspec is not None
+ENABLED = True  # set False to always use the tolerant parsers
+
+
+def enabled():
+    return AVAILABLE and ENABLED
+
+
+def _str(value):
+    return str(value) if value is not None else None
+
+
+if msgspec is not None:
+    Id = Union[str, int, None]  # Sleeper sends some ids as strings in one payload and numbers in another
+
+    class PlayerSchema(msgspec.Struct, gc=False):
+        first_name: Optional[str] = None
+        last_name: Optional[str] = None
+        search_first_name: Optional[str] = None
+        search_last_name: Optional[str] = None
+        search_full_name: Optional[str] = None
+        hashtag: Optional[str] = None
+        number: Optional[int] = None
+        position: Optional[str] = None
+        fantasy_positions: Optional[List[str]] = None
+        depth_chart_position: Id = None
+        depth_chart_order: Optional[int] = None
+        status: Optional[str] = None
+        injury_status: Optional[str] = None
+        injury_start_date: Optional[str] = None
+        practice_participation: Optional[str] = None
+        sport: Optional[str] = None
+        team: Optional[str] = None
+        college: Optional[str] = None
+        height: Id = None
+        weight: Id = None
+        age: Optional[int] = None
+        years_exp: Optional[int] = None
+        fantasy_data_id: Optional[int] = None
+        rotoworld_id: Id = None
+        rotowire_id: Id = None
+        espn_id: Id = None
+        yahoo_id: Id = None
+        sportradar_id: Id = None
+        stats_id: Id = None
+        birth_country: Optional[str] = None
+        search_rank: Optional[int] = None
+        active: Optional[bool] = None
+
+        def get(self, key, default=None):
+            # dict-style access so fetch_all_players predicates work on either form
+            return getattr(self, key, default)
+
+    class UserSchema(msgspec.Struct, gc=False):
+        user_id: Union[str, int]
+        username: Optional[str] = None
+        display_name: Optional[str] = None
+        avatar: Optional[str] = None
+
+    class TeamSchema(msgspec.Struct, gc=False):
+        roster_id: Optional[int] = None
+        owner_id: Id = None
+        league_id: Id = None
+        players: Optional[List[Union[str, int]]] = None
+        starters: Optional[List[Union[str, int]]] = None
+        reserve: Optional[List[Union[str, int]]] = None
+        settings: Optional[Dict[str, Any]] = None
+
+    class DraftSchema(msgspec.Struct, gc=False):
+        draft_id: Id = None
+        league_id: Id = None
+        type: Optional[str] = None
+        status: Optional[str] = None
+        start_time: Optional[int] = None
+        sport: Optional[str] = None
+        settings: Optional[Dict[str, Any]] = None
+        season_type: Optional[str] = None
+        season: Id = None
+        metadata: Optional[Dict[str, Any]] = None
+        last_picked: Optional[int] = None
+        last_message_time: Optional[int] = None
+        last_message_id: Id = None
+        draft_order: Optional[Dict[str, int]] = None
+        slot_to_roster_id: Optional[Dict[int, int]] = None
+        creators: Any = None
+        created: Optional[int] = None
+
+    class DraftPickSchema(msgspec.Struct, gc=False):
+        player_id: Id = None
+        picked_by: Id = None
+        roster_id: Id = None
+        round: Optional[int] = None
+        draft_slot: Optional[int] = None
+        pick_no: Optional[int] = None
+        metadata: Optional[Dict[str, Any]] = None
+        is_keeper: Optional[bool] = None
+        draft_id: Id = None
+
+    class LeagueSchema(msgspec.Struct, gc=False):
+        total_rosters: Optional[int] = None
+        status: Optional[str] = None
+        sport: Optional[str] = None
+        settings: Optional[Dict[str, Any]] = None
+        season_type: Optional[str] = None
+        season: Id = None
+        scoring_settings: Optional[Dict[str, float]] = None
+        roster_positions: Optional[List[str]] = None
+        previous_league_id: Id = None
+        name: Optional[str] = None
+        league_id: Id = None
+        draft_id: Id = None
+        avatar: Optional[str] = None
+
+    _TYPES = {
+        "player": PlayerSchema,
+        "players": Dict[str, PlayerSchema],
+        "users": List[UserSchema],
+        "teams": List[TeamSchema],
+        "drafts": List[DraftSchema],
+        "draft": DraftSchema,
+        "picks": List[DraftPickSchema],
+        "league": Optional[LeagueSchema],
+    }
+    _DECODERS = {kind: msgspec.json.Decoder(typ) for kind, typ in _TYPES.items()}
+
+
+def _load(kind, data):
+    """
+    Decode JSON bytes/str, or validate an already parsed payload, into the schema for kind.
+    """
+    if not AVAILABLE:
+        raise RuntimeError("msgspec is not installed")
+    try:
+        if isinstance(data, (bytes, bytearray, memoryview, str)):
+            return _DECODERS[kind].decode(data)
+        return msgspec.convert(data, _TYPES[kind], str_keys=True)
+    except msgspec.DecodeError as e:
+        # ValidationError included: "Expected `int`, got `str` - at `$[...].age`"
+        raise ValueError(f"Invalid {kind} payload: {e}") from e
+
+
+def _player(player_id, s):
+    intern = models._intern
+    return models.Player(
+        player_id=player_id,
+        first_name=s.first_name,
+        last_name=s.last_name,
+        search_first_name=s.search_first_name,
+        search_last_name=s.search_last_name,
+        search_full_name=s.search_full_name,
+        hashtag=s.hashtag,
+        number=s.number,
+        position=intern(s.position),
+        fantasy_positions=models._intern_list(s.fantasy_positions),
+        depth_chart_position=intern(s.depth_chart_position),
+        depth_chart_order=s.depth_chart_order,
+        status=intern(s.status),
+        injury_status=intern(s.injury_status),
+        injury_start_date=s.injury_start_date,
+        practice_participation=intern(s.practice_participation),
+        sport=intern(s.sport),
+        team=intern(s.team),
+        college=intern(s.college),
+        height=s.height,
+        weight=s.weight,
+        age=s.age,
+        years_exp=s.years_exp,
+        fantasy_data_id=s.fantasy_data_id,
+        rotoworld_id=s.rotoworld_id,
+        rotowire_id=s.rotowire_id,
+        espn_id=s.espn_id,
+        yahoo_id=s.yahoo_id,
+        sportradar_id=s.sportradar_id,
+        stats_id=s.stats_id,
+        birth_country=intern(s.birth_country),
+        search_rank=s.search_rank,
+    )
+
+
+def _draft(s):
+    return models.Draft(
+        draft_id=_str(s.draft_id),
+        league_id=_str(s.league_id),
+        type=s.type,
+        status=s.status,
+        start_time=s.start_time,
+        sport=s.sport,
+        settings=s.settings or {},
+        season_type=s.season_type,
+        season=_str(s.season),
+        metadata=s.metadata or {},
+        last_picked=s.last_picked,
+        last_message_time=s.last_message_time,
+        last_message_id=_str(s.last_message_id),
+        draft_order=s.draft_order or {},
+        slot_to_roster_id=s.slot_to_roster_id or {},
+        creators=s.creators,
+        created=s.created,
+    )
+
+
+def _pick(s):
+    return models.DraftPick(
+        player_id=_str(s.player_id),
+        picked_by=_str(s.picked_by) or "",
+        roster_id=_str(s.roster_id),
+        round=s.round,
+        draft_slot=s.draft_slot,
+        pick_no=s.pick_no,
+        metadata=s.metadata or {},
+        is_keeper=s.is_keeper,
+        draft_id=_str(s.draft_id),
+    )
+
+
+def decode_players(data, predicate=None) -> models.AllPlayers:
+    # predicate(player_id, PlayerSchema) -> bool, like AllPlayers.from_sleeper_items
+    players = {}
+    for pid, s in _load("players", data).items():
+        if predicate is None or predicate(pid, s):
+            players[pid] = _player(pid, s)
+    return models.AllPlayers(players=players)
+
+
+def decode_player_items(items, predicate=None) -> models.AllPlayers:
+    # same as decode_players over (player_id, dict) pairs, e.g. fetchers.iter_player_json:
+    # each player is validated on its own, so the whole dump is never in memory at once
+    players = {}
+    for pid, data in items:
+        s = _load("player", data)
+        if predicate is None or predicate(pid, s):
+            players[pid] = _player(pid, s)
+    return models.AllPlayers(players=players)
+
+
+def decode_users(data) -> models.AllUsers:
+    users = {}
+    for s in _load("users", data):
+        users[str(s.user_id)] = models.User(user_id=str(s.user_id), username=s.username, display_name=s.display_name,
+                                            avatar=s.avatar)
+    return models.AllUsers(users=users)
+
+
+def decode_teams(data) -> models.AllTeams:
+    teams = {}
+    for i, s in enumerate(_load("teams", data)):
+        team = models.Team(
+            roster_id=s.roster_id,
+            owner_id=_str(s.owner_id),
+            league_id=_str(s.league_id),
+            players=[str(p) for p in s.players or ()],
+            starters=[str(p) for p in s.starters or ()],
+            reserve=[str(p) for p in s.reserve or ()],
+            settings=s.settings or {},
+        )
+        teams[str(s.roster_id) if s.roster_id is not None else str(i)] = team
+    return models.AllTeams(teams=teams)
+
+
+def decode_drafts(data) -> models.AllDrafts:
+    drafts = {}
+    for s in _load("drafts", data):
+        draft = _draft(s)
+        drafts[str(draft.draft_id)] = draft
+    return models.AllDrafts(drafts=drafts)
+
+
+def decode_draft(data) -> models.Draft:
+    return _draft(_load("draft", data))
+
+
+def decode_picks(data) -> List[models.DraftPick]:
+    # plain DraftPick list; AllDraftPicks(picks=...) or AllDraftPicks.merge take it from here
+    return [_pick(s) for s in _load("picks", data)]
+
+
+def decode_league(data) -> models.League:
+    s = _load("league", data)
+    if s is None:
+        return models.League()
+    return models.League(
+        total_rosters=s.total_rosters,
+        status=s.status,
+        sport=s.sport,
+        settings=s.settings or {},
+        season_type=s.season_type,
+        season=_str(s.season),
+        scoring_settings=s.scoring_settings or {},
+        roster_positions=s.roster_positions or [],
+        previous_league_id=_str(s.previous_league_id),
+        name=s.name,
+        league_id=_str(s.league_id),
+        draft_id=_str(s.draft_id),
+        avatar=s.avatar,
+    )
@@ -1,6 +1,104 @@
 import fetchers
-from tqdm import tqdm
 import pdb
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable
+import numpy as np
+
+
+def _profile_stats(profile) -> Dict[str, Any]:
+    # stats dict for one StatsProfile: the flat projection shape keeps it on raw["stats"],
+    # indexed profiles keep it on their latest entry
+    raw_stats = profile.raw.get("stats") if isinstance(profile.raw, dict) else None
+    if isinstance(raw_stats, dict):
+        return raw_stats
+    entry = profile.latest_entry()
+    if entry is None:
+        return {}
+    return {k: v.value() for k, v in entry.stats.items()}
+
+
+@dataclass
+class StatMatrix:
+    """
+    Dense players x stats matrix built once from AllStats.
+    - player_ids: row labels
+    - stat_keys: column labels (stat_index maps key -> column)
+    - values: float64 array, 0 where a player has no value for a stat
+    Scoring a league is then a single matrix-vector product.
+    """
+    player_ids: List[str] = field(default_factory=list)
+    stat_keys: List[str] = field(default_factory=list)
+    values: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    stat_index: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_all_stats(cls, all_stats) -> "StatMatrix":
+        if getattr(all_stats, "columns", None) is not None:
+            return cls.from_columns(all_stats.columns)
+        player_ids: List[str] = []
+        stat_index: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        vals: List[float] = []
+        for player_id, profile in all_stats.profiles.items():
+            row = len(player_ids)
+            player_ids.append(str(player_id))
+            for stat, value in _profile_stats(profile).items():
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    continue
+                col = stat_index.setdefault(stat, len(stat_index))
+                rows.append(row)
+                cols.append(col)
+                vals.append(value)
+        values = np.zeros((len(player_ids), len(stat_index)), dtype=np.float64)
+        values[rows, cols] = vals
+        return cls(player_ids=player_ids, stat_keys=list(stat_index), values=values, stat_index=stat_index)
+
+    @classmethod
+    def from_columns(cls, columns) -> "StatMatrix":
+        """
+        Build from models.StatColumns (the AllStats fast path) without touching per-stat objects.
+        """
+        values = np.zeros((len(columns.player_ids), len(columns.stat_keys)), dtype=np.float64)
+        if len(columns.values):
+            # array.array exposes its buffer, so these are views rather than copies
+            rows = np.repeat(np.arange(len(columns.player_ids)), np.asarray(columns.counts))
+            values[rows, np.asarray(columns.cols)] = np.asarray(columns.values)
+        stat_keys = list(columns.stat_keys)
+        return cls(player_ids=list(columns.player_ids), stat_keys=stat_keys, values=values,
+                   stat_index={key: i for i, key in enumerate(stat_keys)})
+
+    def settings_vector(self, scoring_settings: Dict[str, Any]) -> np.ndarray:
+        """
+        Align a league's scoring_settings with the matrix columns (unscored stats weigh 0).
+        """
+        vector = np.zeros(len(self.stat_keys), dtype=np.float64)
+        for stat, weight in (scoring_settings or {}).items():
+            col = self.stat_index.get(stat)
+            if col is not None:
+                vector[col] = weight
+        return vector
+
+    def points(self, scoring_settings: Dict[str, Any]) -> np.ndarray:
+        """
+        Fantasy points for every player under one league's scoring settings.
+        """
+        return self.values @ self.settings_vector(scoring_settings)
+
+    def points_many(self, scoring_settings_list: Iterable[Dict[str, Any]]) -> np.ndarray:
+        """
+        Fantasy points for several leagues at once: returns a players x leagues array.
+        """
+        weights = [self.settings_vector(s) for s in scoring_settings_list]
+        if not weights:
+            return np.zeros((len(self.player_ids), 0))
+        return self.values @ np.column_stack(weights)
+
+    def points_by_player(self, scoring_settings: Dict[str, Any]) -> Dict[str, float]:
+        return dict(zip(self.player_ids, self.points(scoring_settings).tolist()))
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
 
 
 
@@ -0,0 +1,122 @@
+import re
+import unicodedata
+
+import numpy as np
+
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+_SPACES = re.compile(r" +")
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+
+def normalize(text):
+    # lowercase, strip accents and punctuation, collapse whitespace: "D'Andre Swift Jr." -> "dandre swift jr"
+    text = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode("ascii").lower()
+    return _SPACES.sub(" ", _NON_ALNUM.sub("", text.replace("-", " "))).strip()
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def player_fields(player):
+    # what a player can be found by: "first last", Sleeper's search_full_name, team and id
+    name = " ".join(filter(None, (player.first_name, player.last_name)))
+    return (name, player.search_full_name, player.team, player.player_id)
+
+
+class NameIndex:
+    """
+    Substring search over a fixed list of items (players, GUI rows, ...).
+
+    Each item's fields are normalized and joined into one string; a trigram -> item
+    postings map (sorted int32 arrays) narrows a query to the few items containing all of
+    its trigrams, which are then checked with a plain substring test. Queries shorter
+    than three characters fall back to scanning the strings, which is still ~1 ms on the
+    full players dump.
+
+    - a query that extends the previous one only re-checks the previous results
+    - fuzzy=True appends near misses (most shared trigrams) after the exact matches
+    - remove(key) drops an item without rebuilding
+    - last_checked is how many items the last query substring-tested, i.e. its work
+    Results keep the order items were given in.
+    """
+
+    FUZZY_MIN_SHARE = 0.5  # a fuzzy match needs at least half of the query's trigrams
+
+    def __init__(self, items, fields=player_fields, key=None):
+        self.items = list(items)
+        key = key or (lambda item: item.player_id)
+        self._texts = ["|".join(normalize(f) for f in fields(item) if f) for item in self.items]
+        self._positions = {key(item): i for i, item in enumerate(self.items)}
+        self._alive = np.ones(len(self.items), dtype=bool)
+        postings = {}
+        for i, text in enumerate(self._texts):
+            for gram in trigrams(text):
+                postings.setdefault(gram, []).append(i)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._last_query = None
+        self._last_ids = None
+        self.last_checked = 0
+
+    def __len__(self):
+        return int(self._alive.sum())
+
+    def remove(self, key):
+        i = self._positions.pop(key, None)
+        if i is not None:
+            self._alive[i] = False
+
+    def _candidates(self, query):
+        ids = None
+        if self._last_query and self._last_query in query:
+            # typing on: every match for the longer query matched the shorter one too
+            ids = self._last_ids
+        if len(query) >= 3:
+            arrays = sorted((self._postings.get(gram, _EMPTY) for gram in trigrams(query)), key=len)
+            if ids is not None:
+                arrays.insert(0, ids)
+            ids = arrays[0]
+            for other in arrays[1:]:
+                if not len(ids):
+                    break
+                ids = np.intersect1d(ids, other, assume_unique=True)
+        if ids is None:
+            ids = np.flatnonzero(self._alive)
+        return ids
+
+    def search_ids(self, query):
+        query = normalize(query)
+        if not query:
+            return np.flatnonzero(self._alive)
+        texts = self._texts
+        alive = self._alive
+        candidates = self._candidates(query)
+        self.last_checked = len(candidates)
+        ids = np.array([i for i in candidates.tolist() if alive[i] and query in texts[i]], dtype=np.int32)
+        self._last_query, self._last_ids = query, ids
+        return ids
+
+    def fuzzy_ids(self, query, exclude=_EMPTY, limit=20):
+        # rank items by trigrams shared with the query
+        grams = [gram for gram in trigrams(normalize(query)) if gram in self._postings]
+        if not grams:
+            return _EMPTY
+        shared = np.bincount(np.concatenate([self._postings[gram] for gram in grams]), minlength=len(self.items))
+        shared[~self._alive] = 0
+        shared[exclude] = 0
+        needed = max(1, int(np.ceil(len(trigrams(normalize(query))) * self.FUZZY_MIN_SHARE)))
+        ids = np.flatnonzero(shared >= needed)
+        # most shared first, ties in item order
+        return ids[np.argsort(-shared[ids], kind="stable")][:limit]
+
+    def search(self, query, fuzzy=False, limit=None):
+        """
+        Items whose name, team or id contains query (after normalization).
+        """
+        ids = self.search_ids(query)
+        if fuzzy and len(normalize(query)) >= 4:
+            ids = np.concatenate([ids, self.fuzzy_ids(query, exclude=ids)])
+        if limit is not None:
+            ids = ids[:limit]
+        items = self.items
+        return [items[i] for i in ids.tolist()]
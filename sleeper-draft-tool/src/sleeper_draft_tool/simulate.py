@@ -0,0 +1,201 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+import draft_state as ds
+import instrument
+
+
+@dataclass
+class BidModel:
+    """
+    Opponent bidding model: team t will go up to value * exp(bias[t] + sigma * N(0, 1)),
+    drawn independently for every simulation and nomination.
+    """
+    sigma: float = 0.35
+    bias: Dict[str, float] = field(default_factory=dict)
+    default_bias: float = 0.0
+
+    @classmethod
+    def fit(cls, picks, values, shrinkage=5.0, min_value=1.0):
+        """
+        Fit from completed auction picks (DraftPicks with metadata["amount"]) and the values
+        the players had going in ({player_id: value}). Uses log(price / value) per pick: the
+        league-wide mean and spread, plus per-team means shrunk toward the league mean.
+        """
+        residuals = {}
+        for pick in picks:
+            amount = (pick.metadata or {}).get("amount")
+            value = values.get(str(pick.player_id))
+            if amount in (None, "") or value is None or not value >= min_value:
+                continue
+            team = str(pick.roster_id or pick.picked_by)
+            residuals.setdefault(team, []).append(np.log(max(int(amount), 1) / value))
+        if sum(len(r) for r in residuals.values()) < 2:
+            return cls()
+        mean = float(np.mean(np.concatenate([np.asarray(r) for r in residuals.values()])))
+        bias = {team: float((np.sum(r) + shrinkage * mean) / (len(r) + shrinkage)) for team, r in residuals.items()}
+        centered = np.concatenate([np.asarray(r) - bias[team] for team, r in residuals.items()])
+        return cls(sigma=max(float(centered.std()), 0.05), bias=bias, default_bias=mean)
+
+    def team_bias(self, teams):
+        return np.array([self.bias.get(str(team), self.default_bias) for team in teams], dtype=np.float64)
+
+
+@dataclass
+class SimulationResult:
+    """
+    Totals over n_sims simulated auctions, rows in nomination order.
+    - win_counts: (players, teams) number of simulations each team bought each player
+    - price_sums: (players,) sum of closing prices over the simulations the player sold in
+    - points_sums / spent_sums: (teams,) projection bought and dollars spent, summed over simulations
+    """
+    player_ids: np.ndarray
+    teams: List[str]
+    n_sims: int
+    win_counts: np.ndarray
+    price_sums: np.ndarray
+    points_sums: np.ndarray
+    spent_sums: np.ndarray
+
+    @property
+    def p_drafted(self) -> np.ndarray:
+        return self.win_counts.sum(axis=1) / self.n_sims
+
+    @property
+    def expected_price(self) -> np.ndarray:
+        # mean closing price when the player sells; NaN if the player never sold
+        sold = self.win_counts.sum(axis=1)
+        return np.divide(self.price_sums, sold, out=np.full(len(sold), np.nan), where=sold > 0)
+
+    @property
+    def team_probabilities(self) -> np.ndarray:
+        return self.win_counts / self.n_sims
+
+    @property
+    def expected_points(self) -> Dict[str, float]:
+        return dict(zip(self.teams, (self.points_sums / self.n_sims).tolist()))
+
+    @property
+    def expected_spent(self) -> Dict[str, float]:
+        return dict(zip(self.teams, (self.spent_sums / self.n_sims).tolist()))
+
+    def row(self, player_id) -> Optional[int]:
+        rows = np.flatnonzero(self.player_ids == str(player_id))
+        return int(rows[0]) if len(rows) else None
+
+    def player(self, player_id) -> Optional[dict]:
+        """
+        {"expected_price", "p_drafted", "teams": {team: probability}} for one player.
+        """
+        row = self.row(player_id)
+        if row is None:
+            return None
+        probabilities = self.win_counts[row] / self.n_sims
+        return {
+            "expected_price": float(self.expected_price[row]),
+            "p_drafted": float(probabilities.sum()),
+            "teams": {team: float(p) for team, p in zip(self.teams, probabilities) if p > 0},
+        }
+
+    def merge(self, other) -> "SimulationResult":
+        return SimulationResult(self.player_ids, self.teams, self.n_sims + other.n_sims,
+                                self.win_counts + other.win_counts, self.price_sums + other.price_sums,
+                                self.points_sums + other.points_sums, self.spent_sums + other.spent_sums)
+
+
+def _simulate_chunk(values, projections, slot_lists, position_codes, budgets, open_slots, bias, sigma, n_sims, seed):
+    """
+    Play out n_sims auctions at once. Every array below has a leading simulation axis, so
+    each nomination is a handful of NumPy operations over (n_sims, teams).
+    Returns (win_counts, price_sums, points_sums, spent_sums).
+    """
+    rng = np.random.default_rng(seed)
+    n_players, n_teams = len(values), len(budgets)
+    remaining = np.repeat(budgets[None, :], n_sims, axis=0)           # (S, T) dollars left
+    slots = np.repeat(open_slots[None, :, :], n_sims, axis=0)         # (S, T, slots) open count
+    open_count = slots.sum(axis=2)                                     # (S, T)
+    sims = np.arange(n_sims)
+    win_counts = np.zeros((n_players, n_teams), dtype=np.int64)
+    price_sums = np.zeros(n_players)
+    points_sums = np.zeros(n_teams)
+    spent_sums = np.zeros(n_teams)
+    for i in range(n_players):
+        if i % 32 == 0 and not open_count.any():
+            break  # every roster in every simulation is full
+        # first open slot each team could put this player in (own position, flexes, bench)
+        chosen = np.full((n_sims, n_teams), -1, dtype=np.intp)
+        for slot in reversed(slot_lists[position_codes[i]]):
+            chosen = np.where(slots[:, :, slot] > 0, slot, chosen)
+        max_bid = remaining - (open_count - 1)
+        can_bid = (chosen >= 0) & (max_bid >= 1)
+        if not can_bid.any():
+            continue
+        # each team's walk-away price; the random tiebreak keeps $1 endgame picks from favoring team 0
+        limit = np.maximum(values[i] * np.exp(bias + sigma * rng.standard_normal((n_sims, n_teams))), 1.0)
+        limit = np.minimum(limit, max_bid) + rng.random((n_sims, n_teams)) * 1e-3
+        limit[~can_bid] = 0.0
+        winner = limit.argmax(axis=1)
+        best = limit[sims, winner]
+        second = np.partition(limit, n_teams - 2, axis=1)[:, n_teams - 2] if n_teams > 1 else np.zeros(n_sims)
+        sold = np.flatnonzero(best >= 1.0)
+        # English auction: the winner pays a dollar over the runner-up's limit, never more than its own limit
+        price = np.maximum(np.minimum(np.floor(second[sold]) + 1, np.floor(best[sold])), 1.0)
+        team = winner[sold]
+        remaining[sold, team] -= price.astype(remaining.dtype)
+        slots[sold, team, chosen[sold, team]] -= 1
+        open_count[sold, team] -= 1
+        win_counts[i] = np.bincount(team, minlength=n_teams)
+        price_sums[i] = price.sum()
+        points_sums += win_counts[i] * projections[i]
+        spent_sums += np.bincount(team, weights=price, minlength=n_teams)
+    return win_counts, price_sums, points_sums, spent_sums
+
+
+def simulate_auction(draft_state, table, n_sims=10000, bid_model=None, seed=None, processes=1, values=None):
+    """
+    Monte Carlo the rest of an auction from draft_state.
+
+    table is the valued PlayerTable; players still available in draft_state are nominated in
+    order of value (adjusted_value when the live engine filled it in, else raw_value, or the
+    values array passed in). Teams bid by bid_model up to their max bid and only for players
+    they have an open slot for (SLOT_ELIGIBILITY flexes and bench included). processes > 1
+    splits the simulations across worker processes.
+    """
+    bid_model = bid_model or BidModel()
+    teams = list(draft_state.teams)
+    if values is None:
+        values = table.adjusted_value if not np.all(np.isnan(table.adjusted_value)) else table.raw_value
+    values = np.nan_to_num(np.asarray(values, dtype=np.float64))
+    available = np.array([draft_state.is_available(pid) for pid in table.player_ids], dtype=bool)
+    available &= ~np.isnan(table.projection)
+
+    slot_names = sorted(set(draft_state.roster_positions))
+    slot_index = {slot: k for k, slot in enumerate(slot_names)}
+    slot_lists = [[slot_index[slot] for slot in ds.slot_order(pos) if slot in slot_index] for pos in table.positions]
+    # only players some slot can hold, best value first
+    available &= np.array([bool(slot_lists[code]) for code in table.position_codes], dtype=bool)
+    rows = np.flatnonzero(available)
+    rows = rows[np.argsort(-values[rows], kind="stable")]
+
+    budgets = np.array([draft_state.teams[team].remaining for team in teams], dtype=np.int64)
+    open_slots = np.array([[draft_state.teams[team].open_slots.get(slot, 0) for slot in slot_names] for team in teams],
+                          dtype=np.int64).reshape(len(teams), len(slot_names))
+    args = (values[rows], np.nan_to_num(table.projection[rows]), slot_lists, table.position_codes[rows], budgets,
+            open_slots, bid_model.team_bias(teams), bid_model.sigma)
+
+    with instrument.span("simulate", rows=len(rows), sims=n_sims, teams=len(teams)):
+        chunks = [n for n in np.array_split(np.arange(n_sims), max(1, processes)) if len(n)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        if len(chunks) == 1:
+            totals = [_simulate_chunk(*args, n_sims, seeds[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                totals = list(executor.map(_simulate_chunk, *zip(*[args + (len(n), s) for n, s in zip(chunks, seeds)])))
+    result = None
+    for (win_counts, price_sums, points_sums, spent_sums), chunk in zip(totals, chunks):
+        part = SimulationResult(table.player_ids[rows], teams, len(chunk), win_counts, price_sums, points_sums, spent_sums)
+        result = part if result is None else result.merge(part)
+    return result
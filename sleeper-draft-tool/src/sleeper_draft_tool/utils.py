@@ -1,55 +1,308 @@
 import fetchers
+import bisect
 import pdb
-from tqdm import tqdm
 import numpy as np
+import instrument
+
+def relevant_player_predicate(league):
+    # filter for fetchers.fetch_all_players: only active players at a rostered position
+    league_positions = set(league.roster_positions)
+    def predicate(player_id, data):
+        return data.get("position") in league_positions and data.get("active", True) is not False
+    return predicate
 
 def clean_player_data(players, league):
     # get rid of bench dudes and positions that are not relevant
-    removal_list = []
-    # get league positions
-    league_positions = league.roster_positions
-    for p in tqdm(players.players):
-        #print(p)
-        if ((players.players[p].projection == 0) or (players.players[p].projection is None) or (players.players[p].position not in league_positions)):
-            #print(f"Removing player {p}")
-            removal_list.append(p)
-    print(f"Removing {len(removal_list)} players with 0 projection or irrelevant position")
-    for removing in removal_list:
-        players.remove_player(removing)
-    print(f"Remaining players: {len(players.players)}")
+    with instrument.span("clean", rows=len(players.players)) as span:
+        removal_list = []
+        # get league positions
+        league_positions = league.roster_positions
+        for p in players.players:
+            if ((players.players[p].projection == 0) or (players.players[p].projection is None) or (players.players[p].position not in league_positions)):
+                removal_list.append(p)
+        for removing in removal_list:
+            players.remove_player(removing)
+        span.set(removed=len(removal_list))
+    instrument.event("clean.done", f"Removed {len(removal_list)} players with 0 projection or irrelevant position, "
+                     f"{len(players.players)} remaining", removed=len(removal_list), remaining=len(players.players))
     return players
 
-def calculate_position_stats(players, league, buffer=1):
-    league_positions = league.roster_positions
-    total_rosters = league.total_rosters
-    # Calculate median projection for each position
-    position_projections = {}
-    for pid in players.players:
+class _RankTree:
+    """
+    Multiset of projections over a fixed ascending universe of distinct values: a Fenwick
+    tree of per-value counts, so insert/remove of a known value and the r-th smallest
+    member are O(log n).
+    """
+
+    def __init__(self, ascending):
+        values, counts = np.unique(np.asarray(ascending, dtype=np.float64), return_counts=True)
+        self.values = values.tolist()
+        self.counts = counts.tolist()
+        self.size = int(counts.sum())
+        tree = [0] + self.counts
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._step = 1 << (len(self.values).bit_length() - 1) if self.values else 0
+
+    def __len__(self):
+        return self.size
+
+    def index(self, value):
+        # position of value in the universe, None if it isn't one
+        j = bisect.bisect_left(self.values, value)
+        return j if j < len(self.values) and self.values[j] == value else None
+
+    def update(self, j, delta):
+        self.counts[j] += delta
+        self.size += delta
+        i = j + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def below(self, j):
+        # how many members are smaller than values[j]
+        total = 0
+        while j > 0:
+            total += self._tree[j]
+            j -= j & -j
+        return total
+
+    def kth(self, r):
+        # the r-th smallest member (0-based)
+        pos = 0
+        step = self._step
+        while step:
+            if pos + step < len(self._tree) and self._tree[pos + step] <= r:
+                pos += step
+                r -= self._tree[pos]
+            step >>= 1
+        return self.values[pos]
+
+    def members(self):
+        return [value for value, count in zip(self.values, self.counts) for _ in range(count)]
+
+
+class PositionStats:
+    """
+    Mean/median/std_dev of the top projections at each position, where "top" is the
+    number of starting slots for that position across the league plus a buffer.
+
+    Computed once per revaluation and shared by calculate_vorps, calculate_teamshare,
+    calculate_stddevs and the GUI. Reads like the dict calculate_position_stats used to
+    return ({pos: {'mean', 'median', 'std_dev'}}). Each position's projections are counted
+    in a Fenwick tree over its distinct values (_RankTree), with running sum/sum-of-squares
+    over the top window, so removing a drafted player, or adding one back, is O(log n)
+    rather than a re-sort. Only adding a projection the position never had rebuilds its
+    tree, which is O(n).
+    """
+
+    def __init__(self, league, buffer=1):
+        self.league_positions = list(league.roster_positions)
+        self.total_rosters = league.total_rosters
+        self.buffer = buffer
+        self._values = {}   # pos -> _RankTree of projections
+        self._sums = {}     # pos -> [sum, sum of squares] over the top window
+        self._stats = {}    # pos -> cached stats dict
+
+    @classmethod
+    def from_players(cls, players, league, buffer=1):
+        with instrument.span("position_stats", rows=len(players.players)):
+            stats = cls(league, buffer)
+            position_projections = {}
+            for player in players.players.values():
+                if player.projection is None:
+                    continue
+                position_projections.setdefault(player.position, []).append(player.projection)
+            for position, projections in position_projections.items():
+                stats._load(position, sorted(projections))
+            return stats
+
+    @classmethod
+    def from_table(cls, table, league, buffer=1):
+        with instrument.span("position_stats", rows=len(table)):
+            stats = cls(league, buffer)
+            order = np.lexsort((table.projection, table.position_codes))
+            sorted_codes = table.position_codes[order]
+            sorted_proj = table.projection[order]
+            codes = np.arange(len(table.positions))
+            starts = np.searchsorted(sorted_codes, codes, side="left")
+            ends = np.searchsorted(sorted_codes, codes, side="right")
+            for code, position in enumerate(table.positions):
+                projections = sorted_proj[starts[code]:ends[code]]
+                projections = projections[~np.isnan(projections)]
+                if len(projections):
+                    stats._load(position, projections.tolist())
+            return stats
+
+    def limit(self, position):
+        # only calculate stats for number of positions available in the league plus a buffer
+        return self.league_positions.count(position) * self.total_rosters + self.buffer
+
+    def _load(self, position, ascending):
+        top = np.asarray(ascending[-self.limit(position):], dtype=np.float64)
+        self._values[position] = _RankTree(ascending)
+        self._sums[position] = [float(top.sum()), float((top * top).sum())]
+        self._stats.pop(position, None)
+
+    def add(self, position, projection):
+        values = self._values.get(position)
+        if values is None:
+            values = self._values[position] = _RankTree([])
+        sums = self._sums.setdefault(position, [0.0, 0.0])
+        k = self.limit(position)
+        n = len(values)
+        if n < k or projection >= values.kth(n - k):
+            # lands in the top window, possibly pushing its lowest member out
+            sums[0] += projection
+            sums[1] += projection * projection
+            if n >= k:
+                leaving = values.kth(n - k)
+                sums[0] -= leaving
+                sums[1] -= leaving * leaving
+        j = values.index(projection)
+        if j is None:
+            self._values[position] = _RankTree(values.members() + [projection])
+        else:
+            values.update(j, 1)
+        self._stats.pop(position, None)
+
+    def remove(self, position, projection):
+        values = self._values.get(position)
+        if not values:
+            return False
+        j = values.index(projection)
+        if j is None or not values.counts[j]:
+            return False
+        i = values.below(j)
+        k = self.limit(position)
+        n = len(values)
+        sums = self._sums[position]
+        if i >= n - k:
+            sums[0] -= projection
+            sums[1] -= projection * projection
+            if n > k:
+                # the best player below the window moves up into it
+                entering = values.kth(n - k - 1)
+                sums[0] += entering
+                sums[1] += entering * entering
+        values.update(j, -1)
+        if not values:
+            del self._values[position]
+            del self._sums[position]
+        self._stats.pop(position, None)
+        return True
+
+    def remove_player(self, player):
+        if player is None or player.projection is None:
+            return False
+        return self.remove(player.position, player.projection)
+
+    def count(self, position):
+        return len(self._values.get(position, ()))
+
+    def nth_best(self, position, n):
+        # projection of the n-th best (1-based) player still at position, None if there are fewer
+        values = self._values.get(position, ())
+        return values.kth(len(values) - n) if 0 < n <= len(values) else None
+
+    def _compute(self, position):
+        values = self._values[position]
+        count = min(self.limit(position), len(values))
+        total, total_sq = self._sums[position]
+        mean = total / count
+        mid = len(values) - count + count // 2
+        median = values.kth(mid) if count % 2 else (values.kth(mid - 1) + values.kth(mid)) / 2
+        return {
+            'mean': mean,
+            'median': median,
+            'std_dev': float(np.sqrt(max(total_sq / count - mean * mean, 0.0))),
+        }
+
+    def __getitem__(self, position):
+        if position not in self._stats:
+            if position not in self._values:
+                raise KeyError(position)
+            self._stats[position] = self._compute(position)
+        return self._stats[position]
+
+    def get(self, position, default=None):
         try:
-            proj = players.players[pid].projection
-            pos = players.players[pid].position
-            position_projections[pos].append(proj)
+            return self[position]
         except KeyError:
-            position_projections[pos] = [proj]
-
-    position_stats = {}
-    for position in position_projections:
-        # only calucalte stats for number of positions available in the league plus a buffer
-        num_positions = league_positions.count(position) * total_rosters + buffer
-        cleaned_position_projections = position_projections[position]
-        cleaned_position_projections.sort(reverse=True)
-        cleaned_position_projections = cleaned_position_projections[:num_positions]
-        print(cleaned_position_projections)
-        position_stats[position] = {
-            'mean': np.mean(cleaned_position_projections),
-            'median': np.median(cleaned_position_projections),
-            'std_dev': np.std(cleaned_position_projections)
-        }
+            return default
+
+    def __contains__(self, position):
+        return position in self._values
+
+    def __iter__(self):
+        return iter(list(self._values))
 
-    return position_stats
+    def __len__(self):
+        return len(self._values)
+
+    def keys(self):
+        return list(self._values)
+
+    def items(self):
+        return [(position, self[position]) for position in self._values]
+
+    def arrays(self, positions):
+        # mean, median, std_dev arrays aligned with a PlayerTable's position codes
+        mean = np.full(len(positions), np.nan)
+        median = np.full(len(positions), np.nan)
+        std_dev = np.full(len(positions), np.nan)
+        for code, position in enumerate(positions):
+            stats = self.get(position)
+            if stats is not None:
+                mean[code], median[code], std_dev[code] = stats['mean'], stats['median'], stats['std_dev']
+        return mean, median, std_dev
+
+
+def calculate_position_stats(players, league, buffer=1):
+    return PositionStats.from_players(players, league, buffer)
+
+def calculate_table_position_stats(table, league, buffer=1, stats=None):
+    # Vectorized calculate_position_stats over a PlayerTable:
+    # returns mean, median, std_dev arrays indexed by position code
+    if stats is None:
+        stats = PositionStats.from_table(table, league, buffer)
+    return stats.arrays(table.positions)
+
+def calculate_table_values(table, league, draft_amount, buffer=1, stats=None):
+    # vorp, teamshare, stddevs and raw value for every row in one pass
+    mean, median, std_dev = calculate_table_position_stats(table, league, buffer, stats)
+    codes = table.position_codes
+    table.vorp = table.projection - median[codes]
+    median_team_total = sum(median[code] * league.roster_positions.count(position)
+                            for code, position in enumerate(table.positions) if not np.isnan(median[code]))
+    if median_team_total > 0:
+        table.teamshare = table.projection / median_team_total
+    else:
+        table.teamshare = np.zeros(len(table))
+    row_std = std_dev[codes]
+    table.stddevs = np.divide(table.vorp, row_std, out=np.zeros(len(table)), where=row_std > 0)
+    table.raw_value = table.teamshare * draft_amount
+    return table
+
+def calculate_values(cleaned_players, league, draft_amount, buffer=1, stats=None):
+    # vectorized replacement for calculate_vorps -> teamshare -> stddevs -> raw_value.
+    # The PositionStats used is kept on cleaned_players.position_stats and follows remove_player.
+    with instrument.span("values", rows=len(cleaned_players.players)):
+        table = cleaned_players.to_table()
+        if stats is None:
+            stats = PositionStats.from_table(table, league, buffer)
+        calculate_table_values(table, league, draft_amount, buffer, stats)
+        cleaned_players.apply_table(table)
+        cleaned_players.set_position_stats(stats)
+    return cleaned_players
 
-def calculate_vorps(cleaned_players, league):
-    stats = calculate_position_stats(cleaned_players, league)
+def calculate_vorps(cleaned_players, league, stats=None):
+    if stats is None:
+        stats = calculate_position_stats(cleaned_players, league)
     for pid in cleaned_players.players:
         player = cleaned_players.players[pid]
         pos = player.position
@@ -59,21 +312,24 @@ def calculate_vorps(cleaned_players, league):
             player.vorp = 0.0
     return cleaned_players
 
-def calculate_teamshare(cleaned_players, league):
-    stats = calculate_position_stats(cleaned_players, league)
+def calculate_teamshare(cleaned_players, league, stats=None):
+    if stats is None:
+        stats = calculate_position_stats(cleaned_players, league)
     league_positions = league.roster_positions
     median_team_total = 0
     for position in stats:
         num_positions = league_positions.count(position)
         median_team_total += stats[position]['median'] * num_positions
-    print(f"Median team total projection: {median_team_total}")
+    instrument.event("teamshare.median_total", f"Median team total projection: {median_team_total}",
+                     median_team_total=median_team_total)
     for pid in cleaned_players.players:
         player = cleaned_players.players[pid]
         player.teamshare = player.projection / median_team_total if median_team_total > 0 else 0.0
     return cleaned_players
 
-def calculate_stddevs(cleaned_players, league):
-    stats = calculate_position_stats(cleaned_players, league)
+def calculate_stddevs(cleaned_players, league, stats=None):
+    if stats is None:
+        stats = calculate_position_stats(cleaned_players, league)
     for pid in cleaned_players.players:
         player = cleaned_players.players[pid]
         player.stddevs = player.vorp / stats[player.position]['std_dev'] if stats[player.position]['std_dev'] > 0 else 0.0
@@ -7,6 +7,12 @@ def calculate_adjusted_value(raw_value, available_roster_spots, available_money)
 def calculate_value_over_replacement(player_value, replacement_value):
     return player_value - replacement_value
 
+def calculate_surplus_share(surplus, spare_money, total_surplus):
+    # spare dollars (beyond $1 per open slot) shared out in proportion to surplus; works on arrays
+    if total_surplus <= 0:
+        return surplus * 0.0
+    return surplus * (spare_money / total_surplus)
+
 def calculate_positional_standard_deviation(player_values):
     mean_value = sum(player_values) / len(player_values)
     variance = sum((x - mean_value) ** 2 for x in player_values) / len(player_values)
@@ -0,0 +1,190 @@
+class VirtualTreeview:
+    """
+    Windowed rendering for a ttk.Treeview.
+
+    The full row list lives in Python (`rows`); the Treeview only ever holds a fixed pool of
+    items covering the visible rows plus `buffer`, and scrolling rewrites those items from
+    the backing list. Setting new rows (search, refresh) therefore costs the same whether
+    the pool has 200 or 20,000 players: one slice and a window's worth of item() calls.
+
+    - formatter(row) -> tuple of display values, called only for rows in the window
+    - key(row) -> stable identity (player_id) used to keep the selection across re-renders
+    - on_select(event) is called when the user selects a different row; re-rendering the
+      same selected row into another pooled item does not call it again
+    - the scrollbar is driven by the window position, not the Treeview's own yview
+    """
+
+    DEFAULT_VISIBLE = 30
+
+    def __init__(self, tree, scrollbar, formatter, key=None, buffer=10, row_height=20, on_select=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.formatter = formatter
+        self.key = key or (lambda row: row[-1])
+        self.buffer = buffer
+        self.row_height = row_height
+        self.on_select = on_select
+        self.rows = []
+        self.offset = 0
+        self.selected_key = None
+        self._items = []        # pooled Treeview item ids, top to bottom
+        self._item_keys = {}    # item id -> key of the row it currently shows
+        self._item_values = {}  # item id -> values it currently shows
+        self._index = None      # key -> row index, built on demand
+        self._reported_key = None
+        self.last_counts = {}
+
+        scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand=lambda *_args: None)
+        tree.bind("<Configure>", lambda _e: self.render(), add="+")
+        tree.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        tree.bind("<Button-4>", lambda _e: self.scroll(-3), add="+")
+        tree.bind("<Button-5>", lambda _e: self.scroll(3), add="+")
+        tree.bind("<Up>", lambda _e: self.move_selection(-1))
+        tree.bind("<Down>", lambda _e: self.move_selection(1))
+        tree.bind("<Prior>", lambda _e: self.move_selection(-self.visible_count()))
+        tree.bind("<Next>", lambda _e: self.move_selection(self.visible_count()))
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+
+    def visible_count(self):
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # not mapped yet
+            return self.DEFAULT_VISIBLE
+        return max(height // self.row_height, 1)
+
+    def set_rows(self, rows):
+        # swap in a new backing list; keeps the window position where possible
+        self.rows = rows
+        self._index = None
+        self.render()
+
+    def sync(self, rows):
+        """
+        Same contract as row_sync.TreeviewSync.sync: show rows, in order, touching only the
+        pooled items whose values changed. Returns counts of the Treeview calls made.
+        """
+        self.set_rows(rows)
+        return self.last_counts
+
+    def row_index(self, key):
+        if self._index is None:
+            self._index = {self.key(row): i for i, row in enumerate(self.rows)}
+        return self._index.get(key)
+
+    def _clamp(self, offset):
+        return max(0, min(offset, len(self.rows) - self.visible_count()))
+
+    def render(self):
+        self.offset = self._clamp(self.offset)
+        window = self.rows[self.offset:self.offset + self.visible_count() + self.buffer]
+        tree = self.tree
+        counts = {"updated": 0, "inserted": 0, "deleted": 0}
+        while len(self._items) < len(window):
+            self._items.append(tree.insert("", "end"))
+            counts["inserted"] += 1
+        if len(self._items) > len(window):
+            counts["deleted"] = len(self._items) - len(window)
+            tree.delete(*self._items[len(window):])
+            for item in self._items[len(window):]:
+                self._item_keys.pop(item, None)
+                self._item_values.pop(item, None)
+            del self._items[len(window):]
+        selected_item = None
+        for item, row in zip(self._items, window):
+            key = self.key(row)
+            values = tuple(self.formatter(row))
+            # skip the Tk round trip for pooled items that already show these values
+            if self._item_values.get(item) != values:
+                tree.item(item, values=values)
+                self._item_values[item] = values
+                counts["updated"] += 1
+            self._item_keys[item] = key
+            if key == self.selected_key:
+                selected_item = item
+        if selected_item is not None:
+            if tuple(tree.selection()) != (selected_item,):
+                tree.selection_set(selected_item)
+        elif tree.selection():
+            tree.selection_remove(*tree.selection())
+        self._update_scrollbar()
+        self.last_counts = counts
+
+    def refresh_keys(self, keys):
+        """
+        Re-render if any of these row keys is in the window; others are picked up on scroll.
+        """
+        if any(key in keys for key in self._item_keys.values()):
+            self.render()
+            return True
+        return False
+
+    def _update_scrollbar(self):
+        total = len(self.rows)
+        if total == 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        first = self.offset / total
+        last = min((self.offset + self.visible_count()) / total, 1.0)
+        self.scrollbar.set(first, last)
+
+    def scroll_to(self, offset):
+        offset = self._clamp(offset)
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def scroll(self, rows):
+        self.scroll_to(self.offset + rows)
+        return "break"
+
+    def yview(self, *args):
+        # scrollbar command: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.rows)))
+        elif args[0] == "scroll":
+            step = self.visible_count() if args[2] == "pages" else 1
+            self.scroll(int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if not selection:
+            return
+        self.selected_key = self._item_keys.get(selection[0])
+        if self.selected_key != self._reported_key:
+            self._reported_key = self.selected_key
+            if self.on_select is not None:
+                self.on_select(event)
+
+    def select(self, key):
+        """
+        Select the row with this key, scrolling it into view.
+        """
+        index = self.row_index(key)
+        if index is None:
+            return False
+        self.selected_key = key
+        if not self.offset <= index < self.offset + self.visible_count():
+            self.offset = index - self.visible_count() // 2
+        self.render()
+        # the row may have landed in the item that was already selected, which Tk doesn't report
+        self.tree.event_generate("<<TreeviewSelect>>")
+        return True
+
+    def move_selection(self, delta):
+        if not self.rows:
+            return "break"
+        index = self.row_index(self.selected_key) if self.selected_key is not None else None
+        index = 0 if index is None else max(0, min(index + delta, len(self.rows) - 1))
+        key = self.key(self.rows[index])
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + self.visible_count():
+            self.offset = index - self.visible_count() + 1
+        self.select(key)
+        return "break"
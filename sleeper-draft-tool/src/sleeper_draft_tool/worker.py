@@ -0,0 +1,128 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+import instrument
+
+# Row layout shared by the GUI tables, search index and plots:
+# (raw_value, stddevs, teamshare, vorp, projection, name, team, position, player_id)
+ROW_FIELDS = ("raw_value", "stddevs", "teamshare", "vorp", "projection", "name", "team", "position", "player_id")
+# live draft columns, shown after raw value and filled from draft_session.DraftSession.live_values:
+# adjusted value in dollars, and the optimizer's marginal value (projection points my best roster
+# gains or loses with the player at their price)
+LIVE_FIELDS = ("adjusted_value", "marginal")
+LIVE_FORMATS = ("${:.2f}", "{:+.2f}")
+DISPLAY_FIELDS = ROW_FIELDS[:1] + LIVE_FIELDS + ROW_FIELDS[1:]
+
+
+def _number(value, default=0.0):
+    return float(value) if value is not None else default
+
+
+def player_row(player):
+    """
+    One table row for a valued Player, read straight off its fields.
+    """
+    name = " ".join(filter(None, (player.first_name, player.last_name))).strip() or player.search_full_name or player.player_id
+    position = player.position or (player.fantasy_positions[0] if player.fantasy_positions else "") or "UNK"
+    return (_number(player.raw_value, ""), _number(player.stddevs), _number(player.teamshare), _number(player.vorp),
+            _number(player.projection), name, player.team or "", position, player.player_id)
+
+
+def build_rows(players):
+    """
+    Rows for every player, sorted by VORP then projection, descending.
+    """
+    with instrument.span("rows", rows=len(players.players)):
+        rows = [player_row(player) for player in players.players.values()]
+        rows.sort(key=lambda r: (-r[3], -r[4]))
+        return rows
+
+
+def format_row(row):
+    raw_value, stddevs, teamshare, vorp, proj, name, team, pos, pid = row
+    raw_value_display = f"${raw_value:.2f}" if isinstance(raw_value, (int, float)) else str(raw_value)
+    return (raw_value_display, f"{stddevs:.2f}", f"{teamshare:.3f}", f"{vorp:+.2f}", f"{proj:.2f}", name, team, pos, pid)
+
+
+def format_live(values):
+    # blank until a draft session has a value for the player
+    return tuple(fmt.format(value) if value is not None else "" for fmt, value in zip(LIVE_FORMATS, values))
+
+
+def display_row(row, live=None):
+    """
+    Values for the DISPLAY_FIELDS columns: the formatted row with the live columns spliced in.
+    """
+    formatted = format_row(row)
+    return formatted[:1] + format_live(live or (None,) * len(LIVE_FIELDS)) + formatted[1:]
+
+
+class Message(NamedTuple):
+    generation: int
+    kind: str       # "status", "result", "error" or "done"
+    payload: Any = None
+
+
+class Pipeline:
+    """
+    Runs GUI jobs (fetch, score, row building) on a background executor.
+
+    A job is called as job(post, *args) and reports through post(kind, payload); its return
+    value is posted as "result", an exception as "error", and "done" always comes last.
+    Nothing here touches Tk: the main loop calls drain() on a timer and handles the
+    messages itself. Each submit starts a new generation and drain() drops messages from
+    older ones, so a superseded reload can never overwrite a newer one.
+    """
+
+    def __init__(self, max_workers=1):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sleeper-worker")
+        self.queue = queue.Queue()
+        self.generation = 0
+        self.running = 0  # jobs submitted but not done, counted on the draining thread
+
+    def submit(self, job, *args):
+        self.generation += 1
+        self.running += 1
+        generation = self.generation
+
+        def post(kind, payload=None):
+            self.queue.put(Message(generation, kind, payload))
+
+        return self.executor.submit(self._run, job, post, args)
+
+    @staticmethod
+    def _run(job, post, args):
+        try:
+            post("result", job(post, *args))
+        except Exception as e:
+            post("error", e)
+        finally:
+            post("done")
+
+    @property
+    def busy(self):
+        return self.running > 0
+
+    def drain(self, handlers, limit=100):
+        """
+        Handle up to limit queued messages with handlers[kind](payload); returns how many were handled.
+        """
+        handled = 0
+        while handled < limit:
+            try:
+                message = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if message.kind == "done":
+                self.running -= 1
+            if message.generation != self.generation and message.kind != "done":
+                continue  # from a job that a newer submit superseded
+            handler = handlers.get(message.kind)
+            if handler is not None:
+                handler(message.payload)
+            handled += 1
+        return handled
+
+    def shutdown(self, wait=False):
+        self.executor.shutdown(wait=wait, cancel_futures=True)
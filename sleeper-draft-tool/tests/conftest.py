@@ -0,0 +1,6 @@
+import os
+import sys
+
+# the package modules import each other flat (`import models`), as when the app runs from
+# src/sleeper_draft_tool, so the tests need that directory on the path too
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "sleeper_draft_tool"))
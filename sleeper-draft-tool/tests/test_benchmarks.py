@@ -0,0 +1,46 @@
+import copy
+import unittest
+from collections import Counter
+from benchmarks import fixtures, run
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixture = fixtures.synthetic(600, seed=3)
+
+    def test_synthetic_fixture_is_a_legal_auction(self):
+        self.assertEqual(fixtures.synthetic(600, seed=3)["picks"], self.fixture["picks"])
+        picks = self.fixture["picks"]
+        self.assertEqual(len(picks), fixtures.TEAMS * len(fixtures.ROSTER_POSITIONS))
+        self.assertEqual(len({p["player_id"] for p in picks}), len(picks))
+        spent = Counter()
+        for pick in picks:
+            spent[pick["roster_id"]] += int(pick["metadata"]["amount"])
+        self.assertLessEqual(max(spent.values()), fixtures.BUDGET)
+        self.assertEqual(set(fixtures.bodies(self.fixture)), set(fixtures.ROUTES.values()))
+
+    def test_anonymize_drops_names_and_ids(self):
+        recorded = fixtures.anonymize(copy.deepcopy(self.fixture))
+        pid = recorded["picks"][0]["player_id"]
+        self.assertNotEqual(recorded["players"][pid]["first_name"], self.fixture["players"][pid]["first_name"])
+        self.assertIsNone(recorded["picks"][0]["metadata"]["last_name"])
+        self.assertEqual(recorded["league"]["name"], "Benchmark League")
+
+    def test_report_and_compare(self):
+        result = run.run_fixture(self.fixture, repeat=1)
+        self.assertIn("end_to_end", result["stages"])
+        self.assertEqual(result["replay"]["picks"], len(self.fixture["picks"]))
+        self.assertGreaterEqual(result["replay"]["money_left"], 0)
+        self.assertEqual(result["search"]["players"], len(self.fixture["players"]))
+        self.assertGreater(result["search"]["keystrokes"], 0)
+        report = {"results": {"600": result}}
+        self.assertEqual(run.compare(report, report), [])
+        slower = copy.deepcopy(report)
+        slower["results"]["600"]["stages"]["end_to_end"]["seconds"] = result["stages"]["end_to_end"]["seconds"] * 2 + 0.01
+        self.assertTrue(any("end_to_end seconds" in line for line in run.compare(slower, report)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import patch
+from src.sleeper_draft_tool import cache, models
+
+
+class TestPlayersCache(unittest.TestCase):
+
+    def setUp(self):
+        self.league = models.League(league_id="league1", total_rosters=12,
+                                    scoring_settings={"rec": 1.0, "pass_td": 4.0},
+                                    roster_positions=["QB", "RB", "WR", "BN"])
+        self.players = models.AllPlayers(players={
+            "4046": models.Player(player_id="4046", first_name="Patrick", position="QB",
+                                  fantasy_positions=["QB"], projection=350.5, vorp=40.0, raw_value=32.1,
+                                  raw={"position": "QB"}),
+        })
+
+    def test_round_trip(self):
+        key = cache.player_cache_key(self.league, 2025, "regular", 200, 1690000000000)
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(cache.load_players_cache(tmp, key))
+            cache.save_players_cache(tmp, key, self.players)
+            loaded = cache.load_players_cache(tmp, key)
+        player = loaded.get("4046")
+        self.assertEqual(player.projection, 350.5)
+        self.assertEqual(player.raw_value, 32.1)
+        self.assertEqual(player.fantasy_positions, ["QB"])
+        self.assertEqual(player.raw, {})
+
+    def test_key_changes_invalidate(self):
+        key = cache.player_cache_key(self.league, 2025, "regular", 200, 1690000000000)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache.save_players_cache(tmp, key, self.players)
+            newer = cache.player_cache_key(self.league, 2025, "regular", 200, 1690000000001)
+            self.assertIsNone(cache.load_players_cache(tmp, newer))
+            self.league.scoring_settings["rec"] = 0.5
+            rescored = cache.player_cache_key(self.league, 2025, "regular", 200, 1690000000000)
+            self.assertIsNone(cache.load_players_cache(tmp, rescored))
+
+    def test_unusable_files_are_misses(self):
+        key = cache.player_cache_key(self.league, 2025, "regular", 200, 1690000000000)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = cache.save_players_cache(tmp, key, self.players)
+            # a payload from another layout, and a pickle of a class that no longer exists
+            for payload in (["not", "a", "dict"], {"key": key, "columns": None}):
+                with open(path, "wb") as f:
+                    pickle.dump(payload, f)
+                self.assertIsNone(cache.load_players_cache(tmp, key))
+            with open(path, "wb") as f:
+                f.write(b"\x80\x04\x95\x1a\x00\x00\x00\x00\x00\x00\x00\x8c\x07missing\x94\x8c\x05Thing\x94\x93\x94.")
+            self.assertIsNone(cache.load_players_cache(tmp, key))
+            self.assertTrue(os.path.exists(path))
+
+    def test_key_without_stamp_expires_daily(self):
+        with patch.object(cache, "date") as today:
+            today.today.return_value = date(2025, 9, 1)
+            monday = cache.player_cache_key(self.league, 2025, "regular", 200, None)
+            self.assertEqual(monday, cache.player_cache_key(self.league, 2025, "regular", 200, None))
+            today.today.return_value = date(2025, 9, 2)
+            self.assertNotEqual(monday, cache.player_cache_key(self.league, 2025, "regular", 200, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
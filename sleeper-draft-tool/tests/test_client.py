@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from src.sleeper_draft_tool import client, fetchers
+
+
+class StubSleeper(BaseHTTPRequestHandler):
+    """Serves canned JSON by path with ETags; FAIL_ONCE paths answer 503 the first time."""
+    ROUTES = {}
+    FAIL_ONCE = set()
+    DELAY = 0.0
+    hits = {}
+
+    def do_GET(self):
+        StubSleeper.hits[self.path] = StubSleeper.hits.get(self.path, 0) + 1
+        time.sleep(StubSleeper.DELAY)
+        if self.path in StubSleeper.FAIL_ONCE:
+            StubSleeper.FAIL_ONCE.discard(self.path)
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.path not in StubSleeper.ROUTES:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = json.dumps(StubSleeper.ROUTES[self.path]).encode("utf-8")
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        StubSleeper.ROUTES = {
+            "/league/L1": {"league_id": "L1", "total_rosters": 12, "roster_positions": ["QB", "RB"], "scoring_settings": {"rec": 1.0}},
+            "/league/L1/rosters": [{"roster_id": 1, "owner_id": "u1", "players": ["4046"]}],
+            "/league/L1/users": [{"user_id": "u1", "username": "someone"}],
+            "/league/L1/drafts": [{"draft_id": "D1", "league_id": "L1"}],
+            "/projections/nfl/2025?season_type=regular&order_by=pts_std": [{"player_id": "4046", "stats": {"rec": 1.0}}],
+        }
+        StubSleeper.FAIL_ONCE = set()
+        StubSleeper.DELAY = 0.0
+        StubSleeper.hits = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubSleeper)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = client.SleeperClient(timeout=5, retries=2, backoff_factor=0)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestSleeperClient(StubServerTestCase):
+
+    def test_retries_transient_errors(self):
+        StubSleeper.FAIL_ONCE = {"/league/L1"}
+        league = fetchers.fetch_league(self.base, "L1", client=self.client)
+        self.assertEqual(league.league_id, "L1")
+        self.assertEqual(StubSleeper.hits["/league/L1"], 2)
+
+    def test_fetch_many_runs_concurrently(self):
+        StubSleeper.DELAY = 0.3
+        start = time.perf_counter()
+        context = fetchers.fetch_league_context(self.client, self.base, self.base, "L1", "nfl", 2025, "regular")
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 3 * StubSleeper.DELAY)
+        self.assertEqual(context["league"].total_rosters, 12)
+        self.assertIn("1", context["teams"].teams)
+        self.assertIn("u1", context["users"].users)
+        self.assertIn("D1", context["drafts"].drafts)
+        self.assertIn("4046", context["projections"].profiles)
+
+    def test_fetch_many_raises_errors(self):
+        with self.assertRaises(Exception):
+            self.client.fetch_many({"missing": f"{self.base}/league/nope"})
+
+
+class TestResponseCache(StubServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = client.ResponseCache(os.path.join(self.tmp.name, "http"))
+        self.client.close()
+        self.client = client.SleeperClient(timeout=5, retries=0, cache=self.cache)
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp.cleanup()
+
+    def test_fresh_entries_skip_the_network(self):
+        fetchers.fetch_league(self.base, "L1", client=self.client)
+        league = fetchers.fetch_league(self.base, "L1", client=self.client)
+        self.assertEqual(league.total_rosters, 12)
+        self.assertEqual(StubSleeper.hits["/league/L1"], 1)
+        self.assertEqual(self.client.cache_stats["hits"], 1)
+
+    def test_stale_entries_revalidate(self):
+        self.cache.default_ttl = 0
+        self.cache.ttls = []
+        fetchers.fetch_league(self.base, "L1", client=self.client)
+        league = fetchers.fetch_league(self.base, "L1", client=self.client)
+        self.assertEqual(league.league_id, "L1")
+        self.assertEqual(StubSleeper.hits["/league/L1"], 2)
+        self.assertEqual(self.client.cache_stats["revalidated"], 1)
+        # a changed body is picked up on the next revalidation
+        StubSleeper.ROUTES["/league/L1"]["total_rosters"] = 10
+        self.assertEqual(fetchers.fetch_league(self.base, "L1", client=self.client).total_rosters, 10)
+
+    def test_players_download_is_conditional(self):
+        StubSleeper.ROUTES["/players/nfl"] = {"4046": {"first_name": "Patrick", "position": "QB"}}
+        self.cache.ttls = [(re.compile("/players/"), 0)]
+        filename = os.path.join(self.tmp.name, "players.json")
+        players = fetchers.fetch_all_players(self.base, "nfl", filename=filename, client=self.client)
+        self.assertEqual(players.get("4046").first_name, "Patrick")
+        mtime = os.path.getmtime(filename)
+        fetchers.fetch_all_players(self.base, "nfl", filename=filename, client=self.client)
+        self.assertEqual(StubSleeper.hits["/players/nfl"], 2)
+        self.assertEqual(self.client.cache_stats["revalidated"], 1)
+        self.assertEqual(os.path.getmtime(filename), mtime)
+
+    def test_failed_download_leaves_no_temp_file(self):
+        filename = os.path.join(self.tmp.name, "players.json")
+        with open(filename, "w") as f:
+            f.write("{}")
+
+        def broken(chunk_size):
+            yield b'{"4046": '
+            raise ConnectionError("connection reset")
+
+        response = Mock(status_code=200, headers={})
+        response.iter_content.side_effect = broken
+        with patch.object(self.client.session, "get", return_value=response):
+            with self.assertRaises(ConnectionError):
+                self.client.download(f"{self.base}/players/nfl", filename)
+        self.assertEqual([name for name in os.listdir(self.tmp.name) if name.endswith(".tmp")], [])
+        with open(filename) as f:
+            self.assertEqual(f.read(), "{}")
+        response.close.assert_called_once()
+
+    def test_instrument_records_cache_hits_and_bytes(self):
+        recorder = client.instrument.RECORDER
+        recorder.reset()
+        fetchers.fetch_league(self.base, "L1", client=self.client)
+        fetchers.fetch_league(self.base, "L1", client=self.client)
+        spans = [r for r in recorder.records if r["name"] == "http.get"]
+        self.assertEqual([span["cache"] for span in spans], ["misses", "hits"])
+        self.assertGreater(spans[0]["bytes"], 0)
+        self.assertEqual(recorder.counters["http.cache.hits"], 1)
+        self.assertEqual(recorder.summary()["spans"]["parse"]["count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+from src.sleeper_draft_tool import client, draft_session, models, optimizer, utils, worker
+from tests.test_client import StubSleeper, StubServerTestCase
+
+
+class TestDraftSession(unittest.TestCase):
+
+    def setUp(self):
+        self.league = models.League(total_rosters=2, roster_positions=["QB", "RB", "WR", "FLEX", "BN"])
+        projections = {
+            "1": ("QB", 300.0), "2": ("QB", 250.0), "3": ("QB", 200.0),
+            "4": ("RB", 220.0), "5": ("RB", 180.0), "6": ("RB", 150.0), "7": ("RB", 90.0),
+            "8": ("WR", 210.0), "9": ("WR", 160.0), "10": ("WR", 110.0), "11": ("WR", 70.0),
+        }
+        self.players = models.AllPlayers(players={
+            pid: models.Player(player_id=pid, position=pos, projection=proj) for pid, (pos, proj) in projections.items()
+        })
+        utils.calculate_values(self.players, self.league, 100)
+
+    def pick(self, pick_no, player_id, roster_id, amount):
+        return models.DraftPick(player_id=player_id, roster_id=roster_id, pick_no=pick_no,
+                                metadata={"amount": str(amount)})
+
+    def test_catches_up_with_picks_already_made(self):
+        session = draft_session.DraftSession(self.players, self.league, 100, picks=[self.pick(1, "1", "1", 60)])
+        self.assertTrue(session.is_drafted("1"))
+        self.assertEqual(session.state.teams["1"].spent, 60)
+        self.assertEqual(session.adjusted_value("1"), 0.0)
+        self.assertGreater(session.adjusted_value("2"), 1.0)
+
+    def test_picks_report_drafted_and_revalued_players(self):
+        session = draft_session.DraftSession(self.players, self.league, 100)
+        before = {pid: round(session.adjusted_value(pid)) for pid in self.players.players}
+        changed = session.apply_picks([self.pick(1, "1", "1", 90)])
+        self.assertIn("1", changed)
+        for pid in set(self.players.players) - changed:
+            self.assertEqual(round(session.adjusted_value(pid)), before[pid])
+        self.assertTrue(any(round(session.adjusted_value(pid)) != before[pid] for pid in changed - {"1"}))
+        # a replayed pick changes nothing
+        self.assertEqual(session.apply_picks([self.pick(1, "1", "1", 90)]), set())
+
+    def test_live_values_fill_the_display_row(self):
+        session = draft_session.DraftSession(self.players, self.league, 100)
+        row = next(row for row in worker.build_rows(self.players) if row[8] == "2")
+        display = worker.display_row(row, session.live_values("2"))
+        self.assertEqual(len(display), len(worker.DISPLAY_FIELDS))
+        self.assertEqual(display[worker.DISPLAY_FIELDS.index("adjusted_value")], f"${session.adjusted_value('2'):.2f}")
+        self.assertEqual(display[worker.DISPLAY_FIELDS.index("player_id")], "2")
+        self.assertEqual(worker.display_row(row)[1], "")
+
+    def test_marginal_values_follow_the_picks(self):
+        # budgets above the $100 the values were scored at, so my best roster has no tied substitutes
+        session = draft_session.DraftSession(self.players, self.league, 200, my_team="1")
+        best = max(session.marginals, key=session.marginals.get)
+        marginal = session.marginal_value(best)
+        self.assertGreater(marginal, 0)
+        self.assertIn(best, session.optimizer.solve().player_ids)
+        row = next(row for row in worker.build_rows(self.players) if row[8] == best)
+        display = worker.display_row(row, session.live_values(best))
+        self.assertEqual(display[worker.DISPLAY_FIELDS.index("marginal")], f"{marginal:+.2f}")
+        # the other team takes my most valuable player: the marginals are redone and reported
+        changed = session.apply_picks([self.pick(1, best, "2", 50)])
+        self.assertIn(best, changed)
+        self.assertIsNone(session.marginal_value(best))
+        fresh = optimizer.RosterOptimizer(self.players, session.state, "1", subscribe=False).marginal_values()
+        self.assertEqual(session.marginals, fresh)
+        self.assertTrue(any(pid in changed for pid in fresh))
+
+    def test_roster_for_username(self):
+        users = models.AllUsers.from_sleeper_json([{"user_id": "u2", "username": "Someone"}])
+        teams = models.AllTeams.from_sleeper_json([{"roster_id": 1, "owner_id": "u1"}, {"roster_id": 2, "owner_id": "u2"}])
+        self.assertEqual(draft_session.roster_for("someone", users, teams), "2")
+        self.assertIsNone(draft_session.roster_for("nobody", users, teams))
+        self.assertIsNone(draft_session.roster_for(None, users, teams))
+        self.assertIsNone(draft_session.DraftSession(self.players, self.league, 100).marginal_value("1"))
+
+
+class TestDraftSessionPolling(StubServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.TemporaryDirectory()
+        # the GUI's shared client: draft responses are revalidated on every request
+        self.client.close()
+        self.client = client.SleeperClient(timeout=5, retries=0, cache=client.ResponseCache(os.path.join(self.tmp.name, "http")))
+        league = models.League(total_rosters=2, roster_positions=["QB", "RB"])
+        players = models.AllPlayers(players={pid: models.Player(player_id=pid, position=pos, projection=proj)
+                                             for pid, pos, proj in (("1", "QB", 300.0), ("2", "QB", 200.0),
+                                                                    ("3", "RB", 150.0), ("4", "RB", 100.0))})
+        utils.calculate_values(players, league, 100)
+        self.session = draft_session.DraftSession(players, league, 100)
+        StubSleeper.ROUTES["/draft/D1"] = {"draft_id": "D1", "status": "drafting", "last_picked": 1}
+        StubSleeper.ROUTES["/draft/D1/picks"] = [{"player_id": "1", "roster_id": 1, "pick_no": 1, "metadata": {"amount": "60"}}]
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp.cleanup()
+
+    def test_polls_through_the_shared_client(self):
+        self.assertEqual(self.session.poll(), [])  # not watching yet
+        watcher = self.session.watch(self.base, "D1", self.client)
+        self.assertIs(watcher.client, self.client)
+        picks = self.session.poll()
+        self.assertIn("1", self.session.apply_picks(picks))
+        self.assertTrue(self.session.is_drafted("1"))
+        # the next poll asks again: an unchanged draft answers 304 and the picks aren't refetched
+        self.assertEqual(self.session.poll(), [])
+        self.assertEqual(StubSleeper.hits["/draft/D1"], 2)
+        self.assertEqual(self.client.cache_stats["revalidated"], 1)
+        self.assertEqual(StubSleeper.hits["/draft/D1/picks"], 1)
+        # a new pick shows up on the very next poll
+        StubSleeper.ROUTES["/draft/D1"]["last_picked"] = 2
+        StubSleeper.ROUTES["/draft/D1/picks"].append({"player_id": "3", "roster_id": 2, "pick_no": 2, "metadata": {"amount": "30"}})
+        self.assertEqual([pick.player_id for pick in self.session.poll()], ["3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
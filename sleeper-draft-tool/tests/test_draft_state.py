@@ -24,5 +24,68 @@ class TestDraftState(unittest.TestCase):
         self.draft_state.remove_player('Player B')
         self.assertNotIn('Player B', self.draft_state.drafted_players)
 
+class TestIndexedDraftState(unittest.TestCase):
+
+    def setUp(self):
+        from src.sleeper_draft_tool import models
+        self.models = models
+        league = models.League(total_rosters=2, roster_positions=["QB", "RB", "WR", "FLEX", "BN", "IR"])
+        self.players = [
+            models.Player(player_id="1", position="QB"),
+            models.Player(player_id="2", position="RB"),
+            models.Player(player_id="3", position="RB"),
+            models.Player(player_id="4", position="WR"),
+        ]
+        self.state = DraftState.from_league(league, 200, players=self.players)
+
+    def pick(self, pick_no, player_id, roster_id, amount):
+        return self.models.DraftPick(player_id=player_id, roster_id=roster_id, pick_no=pick_no,
+                                     metadata={"amount": str(amount)})
+
+    def test_initial_budgets_and_slots(self):
+        self.assertEqual(self.state.money_left, 400)
+        self.assertEqual(self.state.open_slot_count, 10)
+        self.assertEqual(self.state.max_bid("1"), 196)
+        self.assertEqual(len(self.state.available_by_position("RB")), 2)
+
+    def test_picks_fill_own_slot_then_flex(self):
+        slots = self.state.apply_picks([self.pick(1, "2", "1", 60), self.pick(2, "3", "1", 30)])
+        self.assertEqual(slots, ["RB", "FLEX"])
+        team = self.state.teams["1"]
+        self.assertEqual(team.spent, 90)
+        self.assertEqual(self.state.get_team_budget("1"), 110)
+        self.assertEqual(team.max_bid, 108)
+        self.assertEqual(self.state.money_left, 310)
+        self.assertEqual(self.state.open_slots["FLEX"], 1)
+        self.assertFalse(self.state.is_available("2"))
+        self.assertEqual(self.state.available_by_position("RB"), [])
+        self.assertEqual([p.player_id for p in self.state.drafted_players], ["2", "3"])
+
+    def test_replayed_picks_are_ignored(self):
+        picks = [self.pick(1, "1", "2", 10)]
+        self.state.apply_picks(picks)
+        self.state.apply_picks(picks)
+        self.assertEqual(self.state.teams["2"].spent, 10)
+        self.assertEqual(len(self.state.drafted_players), 1)
+
+    def test_drafting_a_player_twice_charges_once(self):
+        self.assertEqual(self.state.draft_player(self.players[1], "1", 40), "RB")
+        self.assertIsNone(self.state.draft_player(self.players[1], "1", 40))
+        # the feed can repeat a player under a different (or missing) pick_no
+        self.state.apply_picks([self.pick(None, "2", "2", 40), self.pick(7, "2", "1", 40)])
+        for team, spent in (("1", 40), ("2", 0)):
+            self.assertEqual(self.state.teams[team].spent, spent)
+        self.assertEqual(self.state.money_left, 360)
+        self.assertEqual(self.state.teams["1"].open_count, 4)
+        self.assertEqual(self.state.open_slot_count, 9)
+        self.assertEqual(len(self.state.drafted_players), 1)
+
+    def test_unknown_picked_player_is_still_charged(self):
+        pick = self.models.DraftPick(player_id="99", roster_id="2", pick_no=1, metadata={"amount": "5", "position": "WR"})
+        self.assertEqual(self.state.apply_pick(pick), "WR")
+        self.assertEqual(self.state.teams["2"].spent, 5)
+        self.assertFalse(self.state.is_available("99"))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
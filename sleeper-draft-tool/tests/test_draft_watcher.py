@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import patch, Mock
+from src.sleeper_draft_tool import draft_watcher, models
+
+
+def pick(pick_no, player_id, roster_id, amount):
+    return {"pick_no": pick_no, "player_id": player_id, "roster_id": roster_id,
+            "picked_by": f"u{roster_id}", "draft_id": "D1", "metadata": {"amount": str(amount)}}
+
+
+class TestDraftWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.draft = Mock(last_picked=None, last_message_time=None, status="drafting")
+        self.payload = []
+        response = Mock(status_code=200)
+        response.json.side_effect = lambda: list(self.payload)
+        self.client = Mock()
+        self.client.get.return_value = response
+        self.watcher = draft_watcher.DraftWatcher("http://api", "D1", sleeper_client=self.client)
+        self.received = []
+        self.watcher.subscribe(lambda new_picks, draft: self.received.append([p.pick_no for p in new_picks]))
+
+    def test_merge_skips_known_picks(self):
+        picks = models.AllDraftPicks()
+        self.assertEqual(len(picks.merge([pick(1, "4046", 1, 50)])), 1)
+        new = picks.merge([pick(1, "4046", 1, 50), pick(2, "6794", 2, 40)])
+        self.assertEqual([p.pick_no for p in new], [2])
+        self.assertEqual(picks.last_pick_no(), 2)
+        self.assertEqual(len(picks), 2)
+
+    def test_picks_fetched_only_when_markers_change(self):
+        with patch.object(draft_watcher.fetchers, "fetch_draft_info", return_value=self.draft):
+            self.payload = [pick(1, "4046", 1, 50)]
+            self.draft.last_picked = 1
+            self.assertEqual([p.pick_no for p in self.watcher.poll()], [1])
+            # nothing changed: no picks request at all
+            self.assertEqual(self.watcher.poll(), [])
+            self.assertEqual(self.client.get.call_count, 1)
+
+            self.payload = [pick(1, "4046", 1, 50), pick(2, "6794", 2, 40)]
+            self.draft.last_picked = 2
+            self.watcher.poll()
+        self.assertEqual(self.received, [[1], [2]])
+        self.assertEqual(self.client.get.call_count, 2)
+
+    def test_stale_picks_are_fetched_again(self):
+        with patch.object(draft_watcher.fetchers, "fetch_draft_info", return_value=self.draft):
+            self.payload = [pick(1, "4046", 1, 50)]
+            self.draft.last_picked = 1
+            self.watcher.poll()
+            # the draft reports pick 2 but the picks response doesn't have it yet
+            self.draft.last_picked = 2
+            self.assertEqual(self.watcher.poll(), [])
+            self.payload = [pick(1, "4046", 1, 50), pick(2, "6794", 2, 40)]
+            self.assertEqual([p.pick_no for p in self.watcher.poll()], [2])
+            # caught up: the marker sticks again
+            self.assertEqual(self.watcher.poll(), [])
+        self.assertEqual(self.client.get.call_count, 3)
+        self.assertEqual(self.received, [[1], [2]])
+
+    def test_pick_times_wait_for_the_pick(self):
+        with patch.object(draft_watcher.fetchers, "fetch_draft_info", return_value=self.draft):
+            self.draft.last_picked = 1700000000000
+            self.assertEqual(self.watcher.poll(), [])
+            self.payload = [pick(1, "4046", 1, 50)]
+            self.assertEqual([p.pick_no for p in self.watcher.poll()], [1])
+            self.assertEqual(self.watcher.poll(), [])
+            # a chat message moves the marker but no pick is expected
+            self.draft.last_message_time = 1700000005000
+            self.assertEqual(self.watcher.poll(), [])
+            self.assertEqual(self.watcher.poll(), [])
+        self.assertEqual(self.client.get.call_count, 3)
+
+    def test_deltas_reach_draft_state(self):
+        state = Mock()
+        self.watcher.draft_state = state
+        with patch.object(draft_watcher.fetchers, "fetch_draft_info", return_value=self.draft):
+            self.payload = [pick(1, "4046", 1, 50)]
+            self.draft.last_message_time = 1000
+            self.watcher.poll()
+        applied = state.apply_picks.call_args[0][0]
+        self.assertEqual([p.player_id for p in applied], ["4046"])
+
+
+if __name__ == '__main__':
+    unittest.main()
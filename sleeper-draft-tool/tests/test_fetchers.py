@@ -68,6 +68,26 @@ class TestFetchers(unittest.TestCase):
         self.assertIn("6462", projections)
         self.assertEqual(projections["6462"]["pts_ppr"], 150.0)
 
+    def test_fetch_all_players_streaming_predicate(self):
+        import json, os, tempfile
+        data = {
+            "4046": {"first_name": "Patrick", "last_name": "Mahomes", "position": "QB", "active": True},
+            "9999": {"first_name": "Long", "last_name": "Snapper", "position": "LS", "active": True},
+            "1234": {"first_name": "Retired", "last_name": "Back", "position": "RB", "active": False},
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "players.json")
+            with open(filename, "w") as f:
+                json.dump(data, f, indent=4)
+            # tiny chunks force entries to straddle chunk boundaries
+            self.assertEqual(dict(fetchers.iter_player_json(filename, chunk_size=7)), data)
+
+            predicate = lambda pid, d: d.get("position") in ("QB", "RB") and d.get("active")
+            result = fetchers.fetch_all_players("http://api", "nfl", filename=filename, predicate=predicate, keep_raw=False)
+            self.assertEqual(list(result.players), ["4046"])
+            self.assertEqual(result.get("4046").last_name, "Mahomes")
+            self.assertEqual(result.raw, {})
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,136 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.sleeper_draft_tool import history, models, utils
+from tests.test_client import StubSleeper, StubServerTestCase
+
+PROJECTIONS = "?season_type=regular&order_by=pts_std"
+
+
+def projection(player_id, position, pts):
+    return {"player_id": player_id, "player": {"position": position}, "stats": {"pts": pts}}
+
+
+def pick(player_id, amount, roster_id, position):
+    return {"player_id": player_id, "picked_by": f"u{roster_id}", "roster_id": roster_id, "pick_no": 1,
+            "metadata": {"amount": str(amount), "position": position}}
+
+
+class TestHistoryBuild(StubServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        league = {"total_rosters": 2, "roster_positions": ["QB", "RB"], "scoring_settings": {"pts": 1.0}}
+        StubSleeper.ROUTES = {
+            "/league/L25": dict(league, league_id="L25", season="2025", previous_league_id="L24"),
+            "/league/L24": dict(league, league_id="L24", season="2024", previous_league_id=None),
+            "/league/L25/drafts": [{"draft_id": "D25", "type": "auction", "status": "complete", "season": "2025",
+                                    "settings": {"budget": 100, "teams": 2}}],
+            "/league/L24/drafts": [{"draft_id": "D24", "type": "auction", "status": "complete", "season": "2024",
+                                    "settings": {"budget": 200}},
+                                   {"draft_id": "S24", "type": "snake", "status": "complete", "season": "2024"}],
+            "/draft/D25/picks": [pick("q1", 60, 1, "QB"), pick("r1", 30, 2, "RB"), pick("dst", 1, 1, "DEF")],
+            "/draft/D24/picks": [pick("q1", 90, 2, "QB"), pick("r1", 70, 1, "RB")],
+            "/projections/nfl/2025" + PROJECTIONS: [projection("q1", "QB", 300.0), projection("q2", "QB", 200.0),
+                                                    projection("r1", "RB", 150.0), projection("r2", "RB", 100.0)],
+            "/projections/nfl/2024" + PROJECTIONS: [projection("q1", "QB", 250.0), projection("r1", "RB", 250.0)],
+        }
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmp.cleanup()
+
+    def test_follows_previous_leagues_and_joins_values(self):
+        path = os.path.join(self.tmp.name, "history.npz")
+        dataset = history.build_history(self.client, self.base, self.base, "L25", path)
+        self.assertEqual(dataset.seasons, [2024, 2025])
+        self.assertEqual(dataset.draft_ids, {"D24", "D25"})  # the snake draft is skipped
+        self.assertEqual(len(dataset), 5)
+        row = np.flatnonzero((dataset["season"] == 2025) & (dataset["player_id"] == "q1"))[0]
+        self.assertEqual(dataset["price"][row], 60)
+        self.assertEqual(dataset["budget"][row], 100)
+        self.assertEqual(dataset["projection"][row], 300.0)
+        # the same valuation the live tool runs, under that season's league and budget
+        league = models.League(total_rosters=2, roster_positions=["QB", "RB"])
+        players = models.AllPlayers(players={pid: models.Player(player_id=pid, position=pos, projection=proj)
+                                             for pid, pos, proj in (("q1", "QB", 300.0), ("q2", "QB", 200.0),
+                                                                    ("r1", "RB", 150.0), ("r2", "RB", 100.0))})
+        utils.calculate_values(players, league, 100)
+        self.assertAlmostEqual(dataset["value"][row], players.get("q1").raw_value)
+        # a pick the projections didn't cover keeps its price and position, with no value
+        dst = np.flatnonzero(dataset["player_id"] == "dst")[0]
+        self.assertEqual(dataset["position"][dst], "DEF")
+        self.assertTrue(np.isnan(dataset["value"][dst]))
+
+        loaded = history.HistoryDataset.load(path)
+        for name in history.SCHEMA:
+            np.testing.assert_array_equal(loaded[name], dataset[name])
+
+    def test_rebuild_only_fetches_new_drafts(self):
+        path = os.path.join(self.tmp.name, "history.npz")
+        history.build_history(self.client, self.base, self.base, "L25", path)
+        self.assertEqual(StubSleeper.hits["/draft/D24/picks"], 1)
+        dataset = history.build_history(self.client, self.base, self.base, "L25", path)
+        self.assertEqual(len(dataset), 5)
+        self.assertEqual(StubSleeper.hits["/draft/D24/picks"], 1)
+        history.build_history(self.client, self.base, self.base, "L25", path, refresh=True)
+        self.assertEqual(StubSleeper.hits["/draft/D24/picks"], 2)
+
+    def test_max_seasons(self):
+        dataset = history.fetch_history(self.client, self.base, self.base, "L25", max_seasons=1)
+        self.assertEqual(dataset.seasons, [2025])
+
+    @unittest.skipIf(history.pyarrow is None, "pyarrow is not installed")
+    def test_parquet_round_trip(self):
+        path = os.path.join(self.tmp.name, "history.parquet")
+        dataset = history.build_history(self.client, self.base, self.base, "L25", path)
+        loaded = history.HistoryDataset.load(path)
+        for name in history.SCHEMA:
+            np.testing.assert_array_equal(loaded[name], dataset[name])
+
+
+class TestPriceModel(unittest.TestCase):
+
+    def dataset(self, rng):
+        n = 400
+        value = rng.uniform(2, 80, n)
+        position = np.where(np.arange(n) % 2, "QB", "RB")
+        # RBs go for 30% over value, QBs for value; prices are whole dollars
+        price = np.round(value * np.where(position == "RB", 1.3, 1.0) * np.exp(rng.normal(0, 0.05, n)))
+        columns = {name: np.zeros(n, dtype=dtype) for name, dtype in history.SCHEMA.items()}
+        columns.update(value=value, position=position, price=price.astype(np.int32),
+                       budget=np.full(n, 200, dtype=np.int32), season=np.full(n, 2024, dtype=np.int32))
+        return history.HistoryDataset(columns)
+
+    def test_fit_recovers_position_premiums(self):
+        model = history.PriceModel.fit(self.dataset(np.random.default_rng(0)))
+        self.assertEqual(model.samples, 400)
+        predicted = model.predict([40.0, 40.0], ["RB", "QB"], budget=200)
+        self.assertAlmostEqual(predicted[0] / 40.0, 1.3, delta=0.05)
+        self.assertAlmostEqual(predicted[1] / 40.0, 1.0, delta=0.05)
+        self.assertLess(model.sigma, 0.15)
+        # unknown positions use the pooled fit; worthless players go for the minimum
+        self.assertEqual(model.predict([0.0], ["K"])[0], 1.0)
+
+    def test_defaults_predict_value(self):
+        model = history.PriceModel()
+        np.testing.assert_allclose(model.predict([10.0, 50.0, 500.0], budget=200), [10.0, 50.0, 200.0])
+        self.assertEqual(history.PriceModel.fit(history.HistoryDataset.empty()), model)
+
+    def test_predict_table(self):
+        model = history.PriceModel.fit(self.dataset(np.random.default_rng(1)))
+        league = models.League(total_rosters=2, roster_positions=["QB", "RB"])
+        players = models.AllPlayers(players={pid: models.Player(player_id=pid, position=pos, projection=proj)
+                                             for pid, pos, proj in (("q1", "QB", 300.0), ("q2", "QB", 200.0),
+                                                                    ("r1", "RB", 300.0), ("r2", "RB", 100.0))})
+        table = utils.calculate_values(players, league, 200).to_table()
+        prices = model.predict_table(table, budget=200)
+        q1, r1 = table.row("q1"), table.row("r1")
+        self.assertEqual(table.raw_value[q1], table.raw_value[r1])
+        self.assertGreater(prices[r1], prices[q1])
+
+
+if __name__ == "__main__":
+    unittest.main()
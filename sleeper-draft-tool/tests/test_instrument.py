@@ -0,0 +1,97 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from src.sleeper_draft_tool import instrument, models, utils
+
+
+class TestRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.recorder = instrument.Recorder()
+
+    def test_nested_spans_record_parent_and_fields(self):
+        with self.recorder.span("pipeline"):
+            with self.recorder.span("clean", rows=10) as span:
+                span.set(removed=3)
+                span.add("bytes", 100)
+                span.add("bytes", 50)
+                self.assertIs(self.recorder.current(), span)
+        self.assertIsNone(self.recorder.current())
+        clean, pipeline = self.recorder.records
+        self.assertEqual(clean["parent"], "pipeline")
+        self.assertEqual((clean["rows"], clean["removed"], clean["bytes"]), (10, 3, 150))
+        self.assertNotIn("parent", pipeline)
+        self.assertGreaterEqual(pipeline["seconds"], clean["seconds"])
+
+    def test_errors_are_recorded_and_raised(self):
+        with self.assertRaises(KeyError):
+            with self.recorder.span("parse"):
+                raise KeyError("x")
+        self.assertEqual(self.recorder.records[0]["error"], "KeyError")
+        self.assertEqual(self.recorder.summary()["spans"]["parse"]["count"], 1)
+
+    def test_summary_rows_and_counters(self):
+        for rows in (5, 7):
+            with self.recorder.span("values", rows=rows, cached=False):
+                pass
+        self.recorder.count("http.cache.hits")
+        self.recorder.count("http.bytes", 2048)
+        summary = self.recorder.summary()
+        self.assertEqual(summary["counters"], {"http.cache.hits": 1, "http.bytes": 2048})
+        self.assertNotIn("cached", summary["spans"]["values"])
+        (name, calls, last_ms, total_ms, rows, nbytes), = instrument.summary_rows(summary)
+        self.assertEqual((name, calls, rows, nbytes), ("values", 2, 12, ""))
+        self.assertGreaterEqual(total_ms, last_ms)
+
+    def test_events_only_print_with_echo(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.recorder.event("players.updated", "quiet")
+            self.recorder.echo = True
+            self.recorder.event("players.updated", "loud")
+        self.assertEqual(out.getvalue(), "loud\n")
+        self.assertEqual([r["message"] for r in self.recorder.records], ["quiet", "loud"])
+
+    def test_export_jsonl_round_trip(self):
+        with self.recorder.span("score", rows=3):
+            pass
+        self.recorder.event("clean.done", removed=1)
+        self.recorder.count("players_cache.misses")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "instrument.jsonl")
+            self.assertEqual(self.recorder.export_jsonl(path), 2)
+            with open(path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual([line["type"] for line in lines], ["span", "event", "counters"])
+        self.assertEqual(lines[0]["rows"], 3)
+        self.assertEqual(lines[2]["players_cache.misses"], 1)
+
+    def test_records_are_bounded(self):
+        recorder = instrument.Recorder(maxlen=3)
+        for _ in range(10):
+            with recorder.span("draft.poll"):
+                pass
+        self.assertEqual(len(recorder.records), 3)
+        self.assertEqual(recorder.summary()["spans"]["draft.poll"]["count"], 10)
+
+    def test_clean_player_data_records_a_span(self):
+        # utils records to the recorder of the module it imported
+        recorder = utils.instrument.RECORDER
+        recorder.reset()
+        league = models.League(total_rosters=2, roster_positions=["QB", "RB"])
+        players = models.AllPlayers(players={
+            "1": models.Player(player_id="1", position="QB", projection=300.0),
+            "2": models.Player(player_id="2", position="K", projection=120.0),
+            "3": models.Player(player_id="3", position="RB", projection=0),
+        })
+        utils.clean_player_data(players, league)
+        span, = [r for r in recorder.records if r["name"] == "clean"]
+        self.assertEqual((span["rows"], span["removed"]), (3, 2))
+        self.assertEqual(recorder.records[-1]["remaining"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+import requests
+from src.sleeper_draft_tool import jsoncodec
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = jsoncodec.BACKEND
+        self.data = {"4046": {"first_name": "Patrick", "team": "KC", "age": 29, "news": None,
+                              "fantasy_positions": ["QB"], "bye": 10.5, "name": "Zoë"}}
+
+    def tearDown(self):
+        jsoncodec.set_backend(self.backend)
+
+    def test_every_backend_round_trips_compactly(self):
+        for name in jsoncodec.available_backends():
+            with self.subTest(backend=name):
+                jsoncodec.set_backend(name)
+                encoded = jsoncodec.dumps(self.data)
+                self.assertIsInstance(encoded, bytes)
+                self.assertNotIn(b"\n", encoded)
+                self.assertNotIn(b": ", encoded)
+                self.assertEqual(jsoncodec.loads(encoded), self.data)
+                self.assertEqual(jsoncodec.loads(encoded.decode("utf-8")), self.data)
+                self.assertEqual(jsoncodec.dumps({1: 2}), b'{"1":2}')
+                with self.assertRaises(ValueError):
+                    jsoncodec.loads(b"{not json")
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(ValueError):
+            jsoncodec.set_backend("simplejson")
+        self.assertEqual(jsoncodec.BACKEND, self.backend)
+
+    def test_file_and_response_helpers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "players.json")
+            jsoncodec.dump(self.data, filename)
+            self.assertEqual(jsoncodec.load(filename), self.data)
+            self.assertEqual(os.listdir(tmp), ["players.json"])
+        response = requests.Response()
+        response.status_code = 200
+        response._content = jsoncodec.dumps(self.data)
+        self.assertEqual(jsoncodec.response_json(response), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
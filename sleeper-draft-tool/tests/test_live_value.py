@@ -0,0 +1,89 @@
+import random
+import unittest
+from unittest.mock import patch
+from src.sleeper_draft_tool import live_value, models
+from src.sleeper_draft_tool.draft_state import DraftState
+from src.sleeper_draft_tool.live_value import LiveValueEngine
+
+
+class TestLiveValueEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.league = models.League(total_rosters=2, roster_positions=["QB", "RB", "WR", "FLEX", "BN"])
+        projections = {
+            "1": ("QB", 300.0), "2": ("QB", 250.0), "3": ("QB", 200.0),
+            "4": ("RB", 220.0), "5": ("RB", 180.0), "6": ("RB", 150.0), "7": ("RB", 90.0),
+            "8": ("WR", 210.0), "9": ("WR", 160.0), "10": ("WR", 110.0), "11": ("WR", 70.0),
+        }
+        self.all_players = models.AllPlayers(players={
+            pid: models.Player(player_id=pid, position=pos, projection=proj)
+            for pid, (pos, proj) in projections.items()
+        })
+        self.state = DraftState.from_league(self.league, 100, players=self.all_players)
+        self.engine = LiveValueEngine(self.all_players.to_table(), self.league, self.state)
+
+    def pick(self, pick_no, player_id, roster_id, amount):
+        return models.DraftPick(player_id=player_id, roster_id=roster_id, pick_no=pick_no,
+                                metadata={"amount": str(amount)})
+
+    def test_initial_values_share_spare_money(self):
+        values = {pid: self.engine.value_of(pid) for pid in self.all_players.players}
+        # 2 QB slots -> replacement is the 3rd QB; surplus players split $200 - 10 open slots
+        self.assertEqual(values["3"], 1.0)
+        self.assertGreater(values["1"], values["2"])
+        starters_total = sum(v - 1 for v in values.values())
+        self.assertAlmostEqual(starters_total, 190.0)
+
+    def test_pick_reports_only_changed_rows(self):
+        seen = []
+        self.engine.subscribe(seen.append)
+        before = {pid: round(self.engine.value_of(pid)) for pid in self.all_players.players}
+        self.state.apply_pick(self.pick(1, "1", "1", 90))
+        self.assertEqual(len(seen), 1)
+        changes = seen[0]
+        self.assertEqual(changes["1"], 0.0)
+        for pid, value in changes.items():
+            self.assertNotEqual(round(value), before[pid])
+        for pid in set(before) - set(changes):
+            self.assertEqual(round(self.engine.value_of(pid)), before[pid])
+        # overpaying for the top QB leaves less for everyone else
+        self.assertLess(self.engine.value_of("8"), before["8"])
+
+    def test_filled_position_loses_surplus(self):
+        self.state.apply_picks([self.pick(1, "1", "1", 40), self.pick(2, "2", "2", 40)])
+        self.assertEqual(self.engine.value_of("3"), 1.0)
+
+    def test_picks_update_incrementally_for_large_pool(self):
+        rng = random.Random(7)
+        positions = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "FLEX", "K", "DEF"] + ["BN"] * 6
+        league = models.League(total_rosters=12, roster_positions=positions)
+        players = models.AllPlayers(players={
+            str(i): models.Player(player_id=str(i), position=rng.choice(["QB", "RB", "WR", "TE", "K", "DEF"]),
+                                  projection=rng.uniform(0, 350))
+            for i in range(1500)
+        })
+        state = DraftState.from_league(league, 200, players=players)
+        # the position stats are built once; each pick only removes the drafted projection
+        with patch.object(live_value.utils.PositionStats, "from_table", wraps=live_value.utils.PositionStats.from_table) as built:
+            engine = LiveValueEngine(players.to_table(), league, state)
+            removed = []
+            remove = engine.stats.remove
+            engine.stats.remove = lambda position, projection: removed.append(position) or remove(position, projection)
+            order = sorted(players.players.values(), key=lambda p: -p.projection)
+            reported = []
+            engine.subscribe(reported.append)
+            picks = order[:len(positions) * 12]
+            for pick_no, player in enumerate(picks, start=1):
+                state.apply_pick(self.pick(pick_no, player.player_id, str(pick_no % 12 + 1), 1))
+                # replaying the pick is free: no stats work, nothing reported
+                state.apply_pick(self.pick(pick_no, player.player_id, str(pick_no % 12 + 1), 1))
+        self.assertEqual(built.call_count, 1)
+        self.assertEqual(len(removed), len(picks))
+        self.assertLessEqual(len(reported), len(picks))
+        # only rows whose whole-dollar value moved are reported, never the whole pool
+        self.assertTrue(all(len(changes) < len(players.players) for changes in reported))
+        self.assertEqual(engine.value_of(order[0].player_id), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
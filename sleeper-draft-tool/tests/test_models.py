@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from src.sleeper_draft_tool import models, fetchers
+
+
+def player_json(i):
+    return {
+        "first_name": f"First{i}", "last_name": f"Last{i}", "position": ["QB", "RB", "WR", "TE"][i % 4],
+        "fantasy_positions": [["QB", "RB", "WR", "TE"][i % 4]], "team": ["KC", "SF", "DAL"][i % 3],
+        "status": "Active", "college": "State", "height": "72", "weight": "210", "age": 25,
+        "search_full_name": f"first{i}last{i}", "metadata": {"channel_id": str(i) * 4, "rookie_year": "2020"},
+        "news_updated": 1700000000000 + i, "gsis_id": f"00-00{i:05d}", "competitions": [], "opta_id": None,
+    }
+
+
+class TestSecondaryIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.players = models.AllPlayers(players={
+            "1": models.Player(player_id="1", position="RB", team="KC", fantasy_positions=["RB"]),
+            "2": models.Player(player_id="2", position="WR", team="kc", fantasy_positions=["WR", "rb"]),
+            "3": models.Player(player_id="3", position="TE", team="SF", fantasy_positions=["TE"]),
+            "4": models.Player(player_id="4", position=None, team=None),
+        })
+
+    def ids(self, items, attr="player_id"):
+        return [getattr(item, attr) for item in items]
+
+    def test_player_lookups_match_linear_scan(self):
+        self.assertEqual(self.ids(self.players.by_position("rb")), ["1", "2"])
+        self.assertEqual(self.ids(self.players.by_team("KC")), ["1", "2"])
+        self.assertEqual(self.ids(self.players.by_team(None)), ["4"])
+        self.assertEqual(self.players.by_position("K"), [])
+
+    def test_remove_player_and_direct_edits_keep_indexes_consistent(self):
+        self.players.by_position("RB")
+        self.players.remove_player("1")
+        self.assertEqual(self.ids(self.players.by_position("RB")), ["2"])
+        self.players.players["5"] = models.Player(player_id="5", position="RB")
+        self.assertEqual(self.ids(self.players.by_position("RB")), ["2", "5"])
+        self.players.players["2"].team = "SF"
+        self.players.invalidate_indexes()
+        self.assertEqual(self.ids(self.players.by_team("SF")), ["2", "3"])
+
+    def test_replacing_a_player_keeps_lookups_current(self):
+        self.assertEqual(self.ids(self.players.by_team("KC")), ["1", "2"])
+        # same size, same player_id: only the mutation counter tells the index apart
+        self.players.add_player(models.Player(player_id="1", position="QB", team="SF"))
+        self.assertEqual(self.ids(self.players.by_team("KC")), ["2"])
+        self.assertEqual(self.ids(self.players.by_team("SF")), ["1", "3"])
+        self.assertEqual(self.ids(self.players.by_position("RB")), ["2"])
+        self.assertEqual(self.ids(self.players.by_position("QB")), ["1"])
+        self.players.add_player(models.Player(player_id="6", position="QB"))
+        self.players.remove_player("1")
+        self.assertEqual(self.ids(self.players.by_position("QB")), ["6"])
+        self.assertEqual(len(self.players.search_name("6")), 1)
+
+    def test_team_lookups(self):
+        teams = models.AllTeams.from_sleeper_json([
+            {"roster_id": 1, "owner_id": "u1", "league_id": "L", "players": ["10", "11"], "starters": ["10"], "reserve": []},
+            {"roster_id": 2, "owner_id": "u2", "league_id": "L", "players": ["12"], "starters": [], "reserve": ["13"]},
+        ])
+        self.assertEqual(self.ids(teams.by_owner("u2"), "roster_id"), [2])
+        self.assertEqual(len(teams.by_league("L")), 2)
+        self.assertEqual(self.ids(teams.by_player("13"), "roster_id"), [2])
+        self.assertEqual(self.ids(teams.by_player(10), "roster_id"), [1])
+
+    def test_pick_lookups_follow_merge(self):
+        picks = models.AllDraftPicks.from_sleeper_list([
+            {"player_id": "10", "roster_id": 1, "round": 1, "pick_no": 1},
+            {"player_id": "11", "roster_id": 2, "round": 1, "pick_no": 2},
+        ])
+        self.assertEqual(self.ids(picks.by_round(1)), ["10", "11"])
+        picks.merge([{"player_id": "12", "roster_id": 1, "round": 2, "pick_no": 3}])
+        self.assertEqual(self.ids(picks.by_roster("1")), ["10", "12"])
+        self.assertEqual(self.ids(picks.by_round(2)), ["12"])
+        self.assertEqual(self.ids(picks.by_player(11), "pick_no"), [2])
+
+    def test_draft_lookup(self):
+        drafts = models.AllDrafts.from_sleeper_json([{"draft_id": "d1", "league_id": "L"}, {"draft_id": "d2", "league_id": "M"}])
+        self.assertEqual(self.ids(drafts.by_league("M"), "draft_id"), ["d2"])
+
+
+class TestCompactModels(unittest.TestCase):
+
+    def test_slotted_and_interned(self):
+        a = models.Player.from_sleeper_json("1", {"team": "".join(["K", "C"]), "position": "QB"})
+        b = models.Player.from_sleeper_json("2", {"team": "".join(["K", "C"]), "position": "QB"})
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertIs(a.team, b.team)
+        self.assertEqual(a.raw, {})
+
+    def test_raw_dropped_by_default_and_loaded_on_demand(self):
+        data = {str(i): player_json(i) for i in range(3)}
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "players.json")
+            with open(filename, "w") as f:
+                json.dump(data, f)
+            players = fetchers.fetch_all_players("http://api", "nfl", filename=filename, max_age=None)
+            self.assertEqual(players.raw, {})
+            self.assertEqual(players.get("2").raw, {})
+            self.assertEqual(players.get_raw("2")["gsis_id"], "00-0000002")
+            self.assertIsNone(players.get_raw("99"))
+            kept = fetchers.fetch_all_players("http://api", "nfl", filename=filename, keep_raw=True, max_age=None)
+            self.assertIs(kept.raw["1"], kept.get("1").raw)
+
+    def test_compact_load_uses_far_less_memory(self):
+        data = {str(i): player_json(i) for i in range(3000)}
+
+        def measure(keep_raw):
+            tracemalloc.start()
+            players = models.AllPlayers.from_sleeper_json(json.loads(json.dumps(data)), keep_raw=keep_raw)
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            self.assertEqual(len(players), 3000)
+            return size
+
+        # the parsed source JSON is only retained when asked for
+        self.assertLess(measure(False) * 2, measure(True))
+
+
+if __name__ == "__main__":
+    unittest.main()
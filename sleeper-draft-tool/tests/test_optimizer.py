@@ -0,0 +1,123 @@
+import itertools
+import unittest
+from src.sleeper_draft_tool import models, optimizer
+from src.sleeper_draft_tool.draft_state import DraftState, SLOT_ELIGIBILITY
+
+
+def brute_force(players, slots, budget, force=None):
+    # best total projection over every way to fill all slots within budget, paying raw_value
+    def fits(player, slot):
+        positions = set(player.fantasy_positions or ()) | {player.position}
+        return bool(SLOT_ELIGIBILITY.get(slot, {slot}) & positions)
+    best = None
+    for combo in itertools.combinations(players, len(slots)):
+        if force is not None and force not in combo:
+            continue
+        if sum(int(p.raw_value) for p in combo) > budget:
+            continue
+        if any(all(fits(p, s) for p, s in zip(order, slots)) for order in itertools.permutations(combo)):
+            total = sum(p.projection for p in combo)
+            best = total if best is None else max(best, total)
+    return best
+
+
+class TestRosterOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.league = models.League(total_rosters=2, roster_positions=["QB", "RB", "WR", "FLEX", "BN"])
+        spec = [
+            ("q1", "QB", 300, 40), ("q2", "QB", 260, 18), ("q3", "QB", 200, 3),
+            ("r1", "RB", 250, 45), ("r2", "RB", 210, 25), ("r3", "RB", 150, 8), ("r4", "RB", 120, 2),
+            ("w1", "WR", 240, 42), ("w2", "WR", 200, 20), ("w3", "WR", 160, 9), ("w4", "WR", 110, 1),
+            ("t1", "TE", 180, 15), ("t2", "TE", 90, 1),
+        ]
+        self.players = models.AllPlayers(players={
+            pid: models.Player(player_id=pid, position=pos, fantasy_positions=[pos], projection=float(proj), raw_value=float(cost))
+            for pid, pos, proj, cost in spec
+        })
+        # a WR who is also RB-eligible
+        self.players.get("w3").fantasy_positions = ["WR", "RB"]
+        self.state = DraftState.from_league(self.league, 100, players=self.players)
+
+    def starters(self):
+        return ["QB", "RB", "WR", "FLEX"]
+
+    def test_matches_brute_force(self):
+        opt = optimizer.RosterOptimizer(self.players, self.state, "1")
+        solution = opt.solve()
+        # one bench slot is held back at $1
+        self.assertEqual(solution.budget, 99)
+        pool = list(self.players.players.values())
+        self.assertAlmostEqual(solution.projection, brute_force(pool, self.starters(), 99))
+        self.assertLessEqual(solution.cost, 99)
+        self.assertEqual(sorted(solution.slots), sorted(self.starters()))
+        self.assertEqual(len(solution.player_ids), 4)
+
+    def test_marginal_values_match_brute_force(self):
+        opt = optimizer.RosterOptimizer(self.players, self.state, "1")
+        best = opt.solve().projection
+        marginals = opt.marginal_values()
+        pool = list(self.players.players.values())
+        for pid in ("q1", "r1", "w3", "t1", "q3"):
+            player = self.players.get(pid)
+            with_player = brute_force(pool, self.starters(), 99, force=player)
+            without = brute_force([p for p in pool if p is not player], self.starters(), 99)
+            with self.subTest(player=pid):
+                self.assertAlmostEqual(marginals[pid], with_player - without)
+        for pid in opt.solve().player_ids:
+            self.assertGreaterEqual(marginals[pid], 0)
+        self.assertTrue(all(value <= 1e-9 for pid, value in marginals.items() if pid not in opt.solve().player_ids))
+        self.assertAlmostEqual(best, opt.solve().projection)
+
+    def test_warm_start_after_picks(self):
+        opt = optimizer.RosterOptimizer(self.players, self.state, "1")
+        first = opt.solve()
+        outsider = next(pid for pid in ("q3", "r4", "w4", "t2") if pid not in first.player_ids)
+        self.state.draft_player(self.players.get(outsider), "2", 1)
+        self.assertIs(opt.solve(), first)
+        self.assertNotIn(outsider, opt.marginal_values())
+        # another team takes one of ours: re-solved without them
+        taken = first.player_ids[0]
+        self.state.draft_player(self.players.get(taken), "2", 30)
+        second = opt.solve()
+        self.assertNotIn(taken, second.player_ids)
+        pool = [p for p in self.players.players.values() if self.state.is_available(p.player_id)]
+        self.assertAlmostEqual(second.projection, brute_force(pool, self.starters(), 99))
+        # our own pick: fewer slots, less money
+        mine = second.player_ids[0]
+        self.state.draft_player(self.players.get(mine), "1", int(self.players.get(mine).raw_value))
+        third = opt.solve()
+        remaining = self.state.teams["1"].remaining - 1
+        self.assertEqual(third.budget, remaining)
+        pool = [p for p in self.players.players.values() if self.state.is_available(p.player_id)]
+        open_starters = [s for s, n in self.state.get_open_slots("1").items() for _ in range(n) if s != "BN"]
+        self.assertAlmostEqual(third.projection, brute_force(pool, open_starters, remaining))
+
+    def test_sole_affordable_player_leaves_the_slot_open(self):
+        # q1 is the only QB the budget allows: without him the QB slot stays open, as solve
+        # leaves slots open that nobody can fill
+        league = models.League(total_rosters=2, roster_positions=["QB", "RB", "TE"])
+        players = models.AllPlayers(players={
+            pid: models.Player(player_id=pid, position=pos, fantasy_positions=[pos], projection=float(proj), raw_value=float(cost))
+            for pid, pos, proj, cost in (("q1", "QB", 300, 10), ("q2", "QB", 320, 40),
+                                         ("r1", "RB", 200, 12), ("r2", "RB", 150, 4), ("t1", "TE", 90, 5))
+        })
+        state = DraftState.from_league(league, 30, players=players)
+        opt = optimizer.RosterOptimizer(players, state, "1")
+        self.assertEqual(sorted(opt.solve().player_ids), ["q1", "r1", "t1"])
+        marginals = opt.marginal_values()
+        # without q1 the best is r1 + t1 with the QB slot open
+        self.assertAlmostEqual(marginals["q1"], 300.0)
+        # t1 is the only TE: his slot stays open without him, and the money goes to nobody better
+        self.assertAlmostEqual(marginals["t1"], 90.0)
+        self.assertTrue(all(value < float("inf") for value in marginals.values()))
+
+    def test_unaffordable_roster(self):
+        state = DraftState.from_league(self.league, 5, players=self.players)
+        opt = optimizer.RosterOptimizer(self.players, state, "1", prices={pid: 10 for pid in self.players.players})
+        self.assertIsNone(opt.solve())
+        self.assertEqual(opt.marginal_values(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from src.sleeper_draft_tool import plots
+
+
+class CountingCanvas(FigureCanvasAgg):
+    """Agg canvas that counts full draws and blits, like FigureCanvasTkAgg would do them."""
+
+    def __init__(self, figure):
+        super().__init__(figure)
+        self.draws = 0
+        self.blits = 0
+
+    def draw(self):
+        self.draws += 1
+        super().draw()
+
+    def draw_idle(self, *args, **kwargs):
+        self.draw()
+
+    def blit(self, bbox=None):
+        self.blits += 1
+
+
+class TestPositionPlot(unittest.TestCase):
+
+    def setUp(self):
+        self.figure = Figure(figsize=(3, 1.8), dpi=50)
+        self.canvas = CountingCanvas(self.figure)
+        self.projections = np.array([250.0, 220.0, 210.0, 180.0, 160.0, 150.0, 120.0, 90.0, np.nan])
+        self.stats = {"mean": 200.0, "median": 195.0, "std_dev": 30.0}
+
+    def test_kde_integrates_to_one(self):
+        x, y = plots.kde_curve(self.projections[:-1])
+        self.assertAlmostEqual(y.sum() * (x[1] - x[0]), 1.0, places=2)
+        self.assertLess(x[0], 90.0)
+        self.assertGreater(x[-1], 250.0)
+
+    def test_updates_reuse_the_same_artists(self):
+        plot = plots.PositionPlot(self.figure, self.canvas)
+        artists = (plot.curve, plot.fill, plot.mean_line, plot.highlight_line)
+        lines = len(plot.ax.lines)
+        self.assertTrue(plot.update(self.stats, self.projections))
+        self.assertTrue(plot.update(self.stats, self.projections[:4]))
+        self.assertEqual((plot.curve, plot.fill, plot.mean_line, plot.highlight_line), artists)
+        self.assertEqual(len(plot.ax.lines), lines)
+        self.assertEqual(len(self.figure.axes), 1)
+        self.assertEqual(plot.mean_line.get_xdata()[0], 200.0)
+        self.assertLessEqual(plot.ax.get_xlim()[0], 210.0)
+
+    def test_highlight_blits_instead_of_redrawing(self):
+        plot = plots.PositionPlot(self.figure, self.canvas)
+        plot.update(self.stats, self.projections)
+        draws = self.canvas.draws
+        for value in (100.0, 150.0, 200.0, 240.0):
+            plot.highlight(value)
+        self.assertEqual(self.canvas.draws, draws)
+        self.assertEqual(self.canvas.blits, 4)
+        self.assertEqual(plot.highlight_line.get_xdata()[0], 240.0)
+        self.assertAlmostEqual(plot.highlight_marker.get_ydata()[0], plot.density_at(240.0))
+
+    def test_histogram_and_normal_fallback(self):
+        plot = plots.PositionPlot(self.figure, self.canvas, mode="hist")
+        plot.update(self.stats, self.projections)
+        self.assertTrue(plot.bars.get_visible())
+        self.assertFalse(plot.curve.get_visible())
+        self.assertGreater(plot.density_at(200.0), 0)
+        self.assertIsNone(plot.density_at(1000.0))
+        # too few projections: normal curve from the position stats
+        plot.update(self.stats, [])
+        self.assertTrue(plot.curve.get_visible())
+        self.assertAlmostEqual(plot.density_at(200.0), 1 / (30.0 * np.sqrt(2 * np.pi)), places=4)
+        self.assertFalse(plot.update(None, []))
+        self.assertTrue(plot.empty_text.get_visible())
+        with self.assertRaises(ValueError):
+            plots.PositionPlot(Figure(), self.canvas, mode="violin")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import random
+import unittest
+from src.sleeper_draft_tool.row_sync import TreeviewSync
+
+
+class FakeFlatTree:
+    # a flat ttk.Treeview: attached children in order, detached items kept aside
+    def __init__(self):
+        self.children = []
+        self.values = {}
+        self.selected = ()
+        self.scroll = 0.0
+        self.calls = 0
+        self._next = 0
+
+    def insert(self, parent, index, values=()):
+        self.calls += 1
+        self._next += 1
+        item = f"I{self._next}"
+        self.values[item] = values
+        self.children.insert(len(self.children) if index == "end" else index, item)
+        return item
+
+    def index(self, item):
+        return self.children.index(item)
+
+    def move(self, item, parent, index):
+        self.calls += 1
+        if item in self.children:
+            self.children.remove(item)
+        self.children.insert(index, item)
+
+    def detach(self, *items):
+        self.calls += 1
+        for item in items:
+            self.children.remove(item)
+
+    def item(self, item, values=None):
+        self.calls += 1
+        self.values[item] = values
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, items):
+        self.selected = tuple(items)
+
+    def yview(self):
+        return (self.scroll, 1.0)
+
+    def yview_moveto(self, fraction):
+        self.scroll = fraction
+
+    def shown(self):
+        return [self.values[item] for item in self.children]
+
+
+def fmt(row):
+    return (f"{row[0]:.1f}", row[1])
+
+
+class TestTreeviewSync(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = FakeFlatTree()
+        self.sync = TreeviewSync(self.tree, fmt)
+        self.rows = [(float(300 - i), str(i)) for i in range(300)]
+        self.sync.sync(self.rows)
+
+    def test_initial_sync_inserts_in_order(self):
+        self.assertEqual(self.tree.shown(), [fmt(row) for row in self.rows])
+        self.assertEqual(self.sync.last_counts["inserted"], 300)
+
+    def test_value_change_touches_only_changed_rows(self):
+        self.tree.calls = 0
+        rows = list(self.rows)
+        rows[10] = (295.5, "10")
+        counts = self.sync.sync(rows)
+        self.assertEqual(counts, {"updated": 1, "inserted": 0, "moved": 0, "detached": 0})
+        self.assertEqual(self.tree.calls, 1)
+        self.assertEqual(self.tree.shown()[10], ("295.5", "10"))
+
+    def test_drafted_rows_detach_and_come_back(self):
+        self.tree.selected = (self.sync.item_for("50"),)
+        self.tree.scroll = 0.25
+        drafted = {"3", "7"}
+        counts = self.sync.sync([row for row in self.rows if row[1] not in drafted])
+        self.assertEqual(counts["detached"], 2)
+        self.assertEqual(counts["moved"], 0)
+        self.assertEqual(len(self.tree.children), 298)
+        self.assertEqual(self.tree.selected, (self.sync.item_for("50"),))
+        self.assertEqual(self.tree.scroll, 0.25)
+        item = self.sync.item_for("3")
+        self.sync.sync(self.rows)
+        self.assertEqual(self.sync.item_for("3"), item)
+        self.assertEqual(self.tree.shown(), [fmt(row) for row in self.rows])
+
+    def test_reordering_matches_new_order(self):
+        rng = random.Random(3)
+        for _ in range(20):
+            rows = [row for row in self.rows if rng.random() > 0.2]
+            head = rows[:40]
+            rng.shuffle(head)
+            rows = head + rows[40:] + [(0.5, f"new{rng.randint(0, 5)}")]
+            self.sync.sync(rows)
+            self.assertEqual(self.tree.shown(), [fmt(row) for row in rows])
+
+    def test_single_move_moves_one_row(self):
+        rows = list(self.rows)
+        rows.insert(0, rows.pop(120))
+        counts = self.sync.sync(rows)
+        self.assertEqual(counts["moved"], 1)
+        self.assertEqual(self.tree.shown()[0], fmt(self.rows[120]))
+
+
+if __name__ == "__main__":
+    unittest.main()
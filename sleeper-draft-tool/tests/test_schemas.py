@@ -0,0 +1,126 @@
+import json
+import os
+import tempfile
+import unittest
+from src.sleeper_draft_tool import models, schemas, fetchers, utils
+
+PLAYERS = {
+    "4046": {"player_id": "4046", "first_name": "Patrick", "last_name": "Mahomes", "position": "QB", "team": "KC",
+             "fantasy_positions": ["QB"], "number": 15, "age": 29, "depth_chart_position": "QB", "espn_id": 3139477,
+             "height": "74", "weight": "225", "status": "Active", "metadata": {"rookie_year": "2017"}},
+    "6794": {"player_id": "6794", "first_name": "Justin", "last_name": "Jefferson", "position": "WR", "team": "MIN",
+             "fantasy_positions": ["WR"], "age": None, "active": False},
+}
+DRAFT = {"draft_id": "D1", "league_id": "L1", "status": "drafting", "season": 2025, "settings": {"rounds": 15},
+         "draft_order": {"u1": 1, "u2": 2}, "slot_to_roster_id": {"1": 3, "2": 7}, "created": 1700000000000}
+PICKS = [
+    {"player_id": "4046", "picked_by": "u1", "roster_id": 3, "round": 1, "draft_slot": 1, "pick_no": 1,
+     "metadata": {"amount": "52"}, "is_keeper": None, "draft_id": "D1"},
+    {"player_id": 6794, "picked_by": "", "roster_id": "7", "round": 1, "draft_slot": 2, "pick_no": 2, "draft_id": "D1"},
+]
+LEAGUE = {"league_id": 1220874215918407680, "total_rosters": 12, "season": "2025", "roster_positions": ["QB", "WR"],
+          "scoring_settings": {"rec": 1, "pass_td": 4.0}, "previous_league_id": "99"}
+TEAMS = [{"roster_id": 3, "owner_id": "u1", "league_id": "L1", "players": ["4046", 6794], "starters": ["4046"],
+          "reserve": None, "settings": {"wins": 0}}]
+USERS = [{"user_id": "u1", "username": "someone", "display_name": "Someone", "avatar": None}]
+
+
+def encode(obj):
+    return json.dumps(obj).encode("utf-8")
+
+
+def same_fields(a, b):
+    # compare model objects field by field, ignoring .raw (not kept on the typed path)
+    return all(getattr(a, f) == getattr(b, f) for f in a.__slots__ if f != "raw")
+
+
+@unittest.skipUnless(schemas.AVAILABLE, "msgspec not installed")
+class TestSchemaDecoding(unittest.TestCase):
+
+    def test_matches_tolerant_parsers(self):
+        players = schemas.decode_players(encode(PLAYERS))
+        tolerant = models.AllPlayers.from_sleeper_json(PLAYERS)
+        for pid in PLAYERS:
+            self.assertTrue(same_fields(players.get(pid), tolerant.get(pid)), pid)
+        self.assertTrue(same_fields(schemas.decode_draft(encode(DRAFT)), models.Draft.from_sleeper_json(DRAFT)))
+        self.assertTrue(same_fields(schemas.decode_league(encode(LEAGUE)), models.League.from_sleeper_json(LEAGUE)))
+        for typed, loose in zip(schemas.decode_picks(encode(PICKS)), models.AllDraftPicks.from_sleeper_list(PICKS)):
+            self.assertTrue(same_fields(typed, loose))
+        self.assertTrue(same_fields(schemas.decode_teams(encode(TEAMS)).get("3"), models.AllTeams.from_sleeper_json(TEAMS).get("3")))
+        self.assertTrue(same_fields(schemas.decode_users(encode(USERS)).get("u1"), models.AllUsers.from_sleeper_json(USERS).get("u1")))
+        # parsed payloads (client.fetch_many) validate the same way
+        self.assertEqual(schemas.decode_draft(DRAFT).slot_to_roster_id, {1: 3, 2: 7})
+        self.assertEqual(schemas.decode_league(None).league_id, None)
+
+    def test_integer_ids_decode_as_strings(self):
+        draft = dict(DRAFT, draft_id=111, league_id=222, last_message_id=333)
+        picks = [dict(PICKS[0], draft_id=111, picked_by=444)]
+        teams = [dict(TEAMS[0], owner_id=444, league_id=222)]
+        league = dict(LEAGUE, previous_league_id=555)
+        typed_draft = schemas.decode_draft(encode(draft))
+        self.assertTrue(same_fields(typed_draft, models.Draft.from_sleeper_json(draft)))
+        self.assertEqual((typed_draft.draft_id, typed_draft.league_id, typed_draft.last_message_id), ("111", "222", "333"))
+        self.assertIn("111", schemas.decode_drafts(encode([draft])).drafts)
+        typed_pick, = schemas.decode_picks(encode(picks))
+        self.assertTrue(same_fields(typed_pick, models.DraftPick.from_sleeper_json(picks[0])))
+        self.assertEqual((typed_pick.draft_id, typed_pick.picked_by), ("111", "444"))
+        typed_teams = schemas.decode_teams(encode(teams))
+        self.assertTrue(same_fields(typed_teams.get("3"), models.AllTeams.from_sleeper_json(teams).get("3")))
+        self.assertEqual(len(typed_teams.by_owner("444")), 1)
+        self.assertEqual(len(typed_teams.by_league("222")), 1)
+        typed_league = schemas.decode_league(encode(league))
+        self.assertTrue(same_fields(typed_league, models.League.from_sleeper_json(league)))
+        self.assertEqual(typed_league.previous_league_id, "555")
+
+    def test_malformed_fields_raise(self):
+        bad = dict(PLAYERS, **{"1": {"position": "RB", "age": "twenty"}})
+        with self.assertRaises(ValueError) as ctx:
+            schemas.decode_players(encode(bad))
+        self.assertIn("age", str(ctx.exception))
+        with self.assertRaises(ValueError):
+            schemas.decode_picks(encode([{"pick_no": "first"}]))
+        with self.assertRaises(ValueError):
+            schemas.decode_league(b'{"scoring_settings": {"rec": "one"}')
+
+    def test_merge_takes_decoded_picks(self):
+        picks = models.AllDraftPicks.from_sleeper_list(PICKS[:1])
+        added = picks.merge(schemas.decode_picks(encode(PICKS)))
+        self.assertEqual([p.pick_no for p in added], [2])
+        self.assertEqual(picks.by_roster("7")[0].player_id, "6794")
+
+    def test_fetch_all_players_uses_schema_with_predicate(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "players.json")
+            with open(filename, "wb") as f:
+                f.write(encode(PLAYERS))
+            league = models.League(roster_positions=["QB", "WR"])
+            players = fetchers.fetch_all_players("http://api", "nfl", filename=filename, max_age=None,
+                                                 predicate=utils.relevant_player_predicate(league))
+            self.assertEqual(list(players.players), ["4046"])
+            self.assertEqual(players.get_raw("4046")["metadata"], {"rookie_year": "2017"})
+            tolerant = models.AllPlayers.from_sleeper_json(PLAYERS)
+            self.assertTrue(same_fields(players.get("4046"), tolerant.get("4046")))
+
+    def test_streamed_items_are_validated(self):
+        items = list(PLAYERS.items()) + [("1", {"position": "RB", "age": "twenty"})]
+        self.assertEqual(len(schemas.decode_player_items(items[:2])), 2)
+        with self.assertRaises(ValueError):
+            schemas.decode_player_items(iter(items))
+
+
+class TestSchemaFallback(unittest.TestCase):
+
+    def test_disabled_uses_tolerant_parser(self):
+        # fetchers imports the module by its flat name
+        enabled = fetchers.schemas.ENABLED
+        fetchers.schemas.ENABLED = False
+        try:
+            self.assertFalse(fetchers.schemas.enabled())
+            league = fetchers._build(LEAGUE, models.League.from_sleeper_json, schemas.decode_league)
+            self.assertEqual(league.raw["previous_league_id"], "99")
+        finally:
+            fetchers.schemas.ENABLED = enabled
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from src.sleeper_draft_tool import models, scoring
+
+
+class TestStatMatrix(unittest.TestCase):
+
+    def setUp(self):
+        # the flat list-of-objects shape returned by the projections endpoint
+        self.projections = models.AllStats.from_sleeper_json([
+            {"player_id": "4046", "stats": {"pass_yd": 4500.0, "pass_td": 35.0, "rush_yd": 350.0}},
+            {"player_id": "6794", "stats": {"rec": 110.0, "rec_yd": 1400.0, "rec_td": 10.0}},
+        ])
+        self.ppr = {"pass_yd": 0.04, "pass_td": 4.0, "rush_yd": 0.1, "rec": 1.0, "rec_yd": 0.1, "rec_td": 6.0}
+        self.std = dict(self.ppr, rec=0.0, pass_td=6.0)
+
+    def test_points_single_league(self):
+        matrix = scoring.StatMatrix.from_all_stats(self.projections)
+        points = matrix.points_by_player(self.ppr)
+        self.assertAlmostEqual(points["4046"], 4500 * 0.04 + 35 * 4 + 350 * 0.1)
+        self.assertAlmostEqual(points["6794"], 110 + 1400 * 0.1 + 10 * 6)
+
+    def test_unscored_stats_ignored(self):
+        matrix = scoring.StatMatrix.from_all_stats(self.projections)
+        points = matrix.points_by_player({"rec": 1.0, "fum_lost": -2.0})
+        self.assertEqual(points, {"4046": 0.0, "6794": 110.0})
+
+    def test_points_many_matches_single(self):
+        matrix = scoring.StatMatrix.from_all_stats(self.projections)
+        many = matrix.points_many([self.ppr, self.std])
+        self.assertEqual(many.shape, (2, 2))
+        for col, settings in enumerate((self.ppr, self.std)):
+            for row, value in enumerate(matrix.points(settings)):
+                self.assertAlmostEqual(many[row, col], value)
+
+
+class TestProjectionFastPath(unittest.TestCase):
+
+    def setUp(self):
+        self.data = [
+            {"player_id": "1", "stats": {"pts": 10.0, "rec": 3, "flag": True, "note": None}, "last_modified": 5},
+            {"player_id": 2, "stats": {"rec": 4.5, "rush_yd": 20}, "updated_at": 9},
+            {"player_id": "3", "stats": {}},
+        ]
+
+    def test_columns_match_tolerant_parse(self):
+        fast = models.AllStats.from_sleeper_json(self.data)
+        self.assertIsNotNone(fast.columns)
+        self.assertEqual(fast.last_modified, 9)
+        self.assertEqual(fast.columns.stat_keys, ["pts", "rec", "rush_yd"])
+        self.assertIs(fast.get("2").raw, self.data[1])
+        # a repeated player id falls back to the tolerant parser, which builds no columns
+        slow = models.AllStats.from_sleeper_json(self.data + [{"player_id": "3", "stats": {"pts": 1.0}}])
+        self.assertIsNone(slow.columns)
+        a = scoring.StatMatrix.from_all_stats(fast)
+        b = scoring.StatMatrix.from_all_stats(models.AllStats.from_sleeper_json(self.data[:2] + [self.data[2]] * 2))
+        settings = {"pts": 1.0, "rec": 2.0, "rush_yd": 0.1, "flag": 100.0}
+        self.assertEqual(a.points_by_player(settings), b.points_by_player(settings))
+        self.assertEqual(a.points_by_player(settings), {"1": 16.0, "2": 11.0, "3": 0.0})
+
+    def test_odd_shapes_fall_back(self):
+        for bad in ([{"stats": {"pts": 1}}], [{"player_id": "1", "stats": [1, 2]}], ["1"]):
+            self.assertIsNone(models.AllStats.from_projection_list(bad))
+
+
+if __name__ == '__main__':
+    unittest.main()
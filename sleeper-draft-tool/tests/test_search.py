@@ -0,0 +1,83 @@
+import random
+import string
+import unittest
+from src.sleeper_draft_tool import models
+from src.sleeper_draft_tool.search import NameIndex, normalize
+
+
+def make_player(pid, first, last, team):
+    return models.Player(player_id=pid, first_name=first, last_name=last, team=team,
+                         search_full_name=normalize(first + last).replace(" ", ""))
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.players = models.AllPlayers(players={
+            p.player_id: p for p in [
+                make_player("4046", "Patrick", "Mahomes", "KC"),
+                make_player("4034", "Christian", "McCaffrey", "SF"),
+                make_player("8150", "D'Andre", "Swift", "CHI"),
+                make_player("6794", "Justin", "Jefferson", "MIN"),
+                make_player("9509", "Bijan", "Robinson", "ATL"),
+            ]
+        })
+
+    def ids(self, players):
+        return [p.player_id for p in players]
+
+    def test_normalize(self):
+        self.assertEqual(normalize("  D'Andre  Swift-Jr. "), "dandre swift jr")
+        self.assertEqual(normalize("Zoë"), "zoe")
+
+    def test_substring_name_team_and_id(self):
+        self.assertEqual(self.ids(self.players.search_name("mah")), ["4046"])
+        self.assertEqual(self.ids(self.players.search_name("Patrick M")), ["4046"])
+        self.assertEqual(self.ids(self.players.search_name("d'andre")), ["8150"])
+        self.assertEqual(self.ids(self.players.search_name("son")), ["6794", "9509"])
+        self.assertEqual(self.ids(self.players.search_name("chi")), ["8150"])
+        self.assertEqual(self.ids(self.players.search_name("6794")), ["6794"])
+        self.assertEqual(len(self.players.search_name("")), 5)
+
+    def test_incremental_narrowing_and_removal(self):
+        index = NameIndex(self.players)
+        self.assertEqual(len(index.search("j")), 2)
+        self.assertEqual(self.ids(index.search("je")), ["6794"])
+        self.assertEqual(self.ids(index.search("jeff")), ["6794"])
+        # a new query that doesn't extend the last one starts over
+        self.assertEqual(self.ids(index.search("mcc")), ["4034"])
+        self.players.search_name("mcc")
+        self.players.remove_player("4034")
+        self.assertEqual(self.players.search_name("mcc"), [])
+
+    def test_fuzzy_matches_typos(self):
+        self.assertEqual(self.players.search_name("mahomse"), [])
+        self.assertEqual(self.ids(self.players.search_name("mahomse", fuzzy=True)), ["4046"])
+        self.assertEqual(self.ids(self.players.search_name("jefferson", fuzzy=True)), ["6794"])
+
+    def test_full_dump_queries_only_check_candidates(self):
+        # wall time per keystroke is tracked by benchmarks.run; here the work itself is bounded
+        rng = random.Random(11)
+
+        def word():
+            return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9))).title()
+
+        players = [make_player(str(i), word(), word(), rng.choice(["KC", "SF", "DAL", None])) for i in range(11000)]
+        index = NameIndex(players)
+        target = players[5000]
+        query = ""
+        matched = len(players)
+        for ch in f"{target.first_name} {target.last_name}":
+            query += ch
+            results = index.search(query, fuzzy=True)
+            # typing on only re-checks the last matches; with three characters the trigram
+            # postings cut the candidates to a sliver of the dump
+            self.assertLessEqual(index.last_checked, matched)
+            if len(query) >= 3:
+                self.assertLessEqual(index.last_checked, len(players) // 100)
+            matched = len(index.search_ids(query))
+        self.assertIn(target, results)
+        self.assertEqual(index.last_checked, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+from src.sleeper_draft_tool import models, simulate, utils
+from src.sleeper_draft_tool.draft_state import DraftState
+
+
+class TestAuctionSimulation(unittest.TestCase):
+
+    def setUp(self):
+        self.league = models.League(total_rosters=3, roster_positions=["QB", "RB", "WR", "FLEX", "BN"])
+        projections = {
+            "q1": ("QB", 320.0), "q2": ("QB", 280.0), "q3": ("QB", 240.0), "q4": ("QB", 200.0), "q5": ("QB", 150.0),
+            "r1": ("RB", 260.0), "r2": ("RB", 220.0), "r3": ("RB", 180.0), "r4": ("RB", 140.0), "r5": ("RB", 100.0), "r6": ("RB", 70.0),
+            "w1": ("WR", 250.0), "w2": ("WR", 210.0), "w3": ("WR", 170.0), "w4": ("WR", 130.0), "w5": ("WR", 90.0),
+            "w6": ("WR", 60.0), "w7": ("WR", 40.0),            "k1": ("K", 150.0),
+        }
+        self.players = models.AllPlayers(players={
+            pid: models.Player(player_id=pid, position=pos, projection=proj) for pid, (pos, proj) in projections.items()
+        })
+        utils.calculate_values(self.players, self.league, 100)
+        self.state = DraftState.from_league(self.league, 100, players=self.players)
+        self.table = self.players.to_table()
+
+    def test_rosters_fill_within_budget(self):
+        result = simulate.simulate_auction(self.state, self.table, n_sims=500, seed=7)
+        self.assertEqual(result.n_sims, 500)
+        # 3 teams x 5 slots are filled in every simulation, from a pool of 19
+        self.assertAlmostEqual(result.p_drafted.sum(), 15.0)
+        self.assertTrue(all(spent <= 100 for spent in result.expected_spent.values()))
+        top = result.player("q1")
+        self.assertEqual(top["p_drafted"], 1.0)
+        self.assertAlmostEqual(sum(top["teams"].values()), 1.0)
+        self.assertGreater(top["expected_price"], result.player("w5")["expected_price"])
+        self.assertLess(result.player("w7")["p_drafted"], 1.0)
+        self.assertEqual(result.team_probabilities.shape, (19, 3))
+
+    def test_seeded_runs_repeat(self):
+        first = simulate.simulate_auction(self.state, self.table, n_sims=200, seed=3)
+        second = simulate.simulate_auction(self.state, self.table, n_sims=200, seed=3)
+        np.testing.assert_array_equal(first.win_counts, second.win_counts)
+        np.testing.assert_array_equal(first.price_sums, second.price_sums)
+
+    def test_starts_from_current_state(self):
+        self.state.draft_player(self.players.get("q1"), "1", 60)
+        self.state.draft_player(self.players.get("r1"), "1", 36)
+        result = simulate.simulate_auction(self.state, self.table, n_sims=300, seed=1)
+        self.assertIsNone(result.row("q1"))
+        # team 1 has $4 for its last three slots, so it can never bid more than $2
+        self.assertLessEqual(result.expected_spent["1"], 4.0)
+        self.assertLessEqual(result.spent_sums[0] / 300, 4.0)
+        self.assertAlmostEqual(result.p_drafted.sum(), 13.0)
+        # and it has no QB slot left; the bench can still take one
+        self.assertLess(result.player("q2")["teams"].get("1", 0.0), 0.5)
+
+    def test_processes_split_the_simulations(self):
+        result = simulate.simulate_auction(self.state, self.table, n_sims=300, seed=5, processes=2)
+        self.assertEqual(result.n_sims, 300)
+        self.assertAlmostEqual(result.p_drafted.sum(), 15.0)
+
+    def test_bid_model_fit(self):
+        values = {str(i): 20.0 for i in range(40)}
+        picks = [models.DraftPick(player_id=str(i), roster_id="1" if i % 2 else "2",
+                                  metadata={"amount": str(30 if i % 2 else 15)}) for i in range(40)]
+        model = simulate.BidModel.fit(picks, values)
+        self.assertAlmostEqual(model.default_bias, (np.log(1.5) + np.log(0.75)) / 2)
+        self.assertGreater(model.bias["1"], model.default_bias)
+        self.assertLess(model.bias["2"], model.default_bias)
+        np.testing.assert_allclose(model.team_bias(["1", "3"]), [model.bias["1"], model.default_bias])
+        self.assertEqual(simulate.BidModel.fit([], values).sigma, simulate.BidModel().sigma)
+
+
+if __name__ == "__main__":
+    unittest.main()
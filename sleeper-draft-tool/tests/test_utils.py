@@ -0,0 +1,86 @@
+import copy
+import io
+import contextlib
+import unittest
+from src.sleeper_draft_tool import models, utils
+
+
+class TestValuation(unittest.TestCase):
+
+    def setUp(self):
+        self.league = models.League(total_rosters=2, roster_positions=["QB", "RB", "RB", "WR", "BN"])
+        projections = {
+            "1": ("QB", 300.0), "2": ("QB", 250.0), "3": ("QB", 200.0), "4": ("QB", 120.0),
+            "5": ("RB", 220.0), "6": ("RB", 180.0), "7": ("RB", 150.0), "8": ("RB", 90.0),
+            "9": ("RB", 60.0), "10": ("RB", 40.0), "11": ("WR", 210.0), "12": ("WR", 110.0),
+        }
+        self.players = {
+            pid: models.Player(player_id=pid, position=pos, projection=proj)
+            for pid, (pos, proj) in projections.items()
+        }
+
+    def test_table_round_trip(self):
+        all_players = models.AllPlayers(players=copy.deepcopy(self.players))
+        table = all_players.to_table()
+        self.assertEqual(table.positions, ["QB", "RB", "WR"])
+        self.assertEqual(len(table), 12)
+        self.assertTrue(table.position_mask("RB")[table.row("7")])
+        table.raw_value[table.row("7")] = 12.5
+        all_players.apply_table(table)
+        self.assertEqual(all_players.get("7").raw_value, 12.5)
+
+    def test_calculate_values_matches_per_player_chain(self):
+        legacy = models.AllPlayers(players=copy.deepcopy(self.players))
+        with contextlib.redirect_stdout(io.StringIO()):
+            utils.calculate_vorps(legacy, self.league)
+            utils.calculate_teamshare(legacy, self.league)
+            utils.calculate_stddevs(legacy, self.league)
+        utils.calculate_raw_value(legacy, self.league, 200)
+
+        vectorized = utils.calculate_values(models.AllPlayers(players=copy.deepcopy(self.players)), self.league, 200)
+        for pid, expected in legacy.players.items():
+            actual = vectorized.get(pid)
+            for col in ("vorp", "teamshare", "stddevs", "raw_value"):
+                self.assertAlmostEqual(getattr(actual, col), getattr(expected, col), msg=f"{pid} {col}")
+
+    def test_position_stats_follow_removals(self):
+        all_players = utils.calculate_values(models.AllPlayers(players=copy.deepcopy(self.players)), self.league, 200)
+        stats = all_players.position_stats
+        # RB window is 2 slots * 2 rosters + 1 buffer = top 5
+        self.assertEqual(stats["RB"]["median"], 150.0)
+        all_players.remove_player("5")
+        self.assertEqual(stats["RB"]["median"], 90.0)
+        fresh = utils.calculate_position_stats(all_players, self.league)
+        for pos in fresh:
+            for key in ("mean", "median", "std_dev"):
+                self.assertAlmostEqual(stats[pos][key], fresh[pos][key])
+
+    def test_position_stats_add_and_remove_match_a_rebuild(self):
+        league = models.League(total_rosters=2, roster_positions=["RB", "BN"])
+        pool = [90.0, 60.0, 150.0, 90.0, 220.0, 40.0, 150.0, 180.0]
+        def rebuild():
+            players = {str(i): models.Player(player_id=str(i), position="RB", projection=p) for i, p in enumerate(pool)}
+            return utils.PositionStats.from_players(models.AllPlayers(players=players), league)
+
+        stats = rebuild()
+        # ties at the window edge, a value the position never had, and emptying it out
+        for op, proj in [("remove", 150.0), ("add", 150.0), ("add", 175.5), ("remove", 90.0),
+                         ("remove", 220.0), ("add", 5.0), ("remove", 60.0)]:
+            getattr(stats, op)("RB", proj)
+            if op == "add":
+                pool.append(proj)
+            else:
+                pool.remove(proj)
+            fresh = rebuild()
+            self.assertEqual(stats.count("RB"), len(pool))
+            self.assertEqual(stats.nth_best("RB", 2), sorted(pool)[-2])
+            for key in ("mean", "median", "std_dev"):
+                self.assertAlmostEqual(stats["RB"][key], fresh["RB"][key], msg=f"{op} {proj} {key}")
+        self.assertFalse(stats.remove("RB", 999.0))
+        for proj in list(pool):
+            stats.remove("RB", proj)
+        self.assertNotIn("RB", stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
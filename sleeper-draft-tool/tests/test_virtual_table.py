@@ -0,0 +1,138 @@
+import unittest
+from src.sleeper_draft_tool.virtual_table import VirtualTreeview
+
+
+class FakeTree:
+    # just enough of ttk.Treeview for VirtualTreeview, without a display
+    def __init__(self, height=100):
+        self.height = height
+        self.items = {}
+        self.order = []
+        self.selected = ()
+        self.bindings = {}
+        self.generated = []
+        self.item_calls = 0
+        self._next = 0
+
+    def configure(self, **kwargs):
+        pass
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def winfo_height(self):
+        return self.height
+
+    def insert(self, parent, index, values=()):
+        self._next += 1
+        item = f"I{self._next}"
+        self.items[item] = values
+        self.order.append(item)
+        return item
+
+    def item(self, item, values=None):
+        self.item_calls += 1
+        self.items[item] = values
+
+    def delete(self, *items):
+        for item in items:
+            del self.items[item]
+            self.order.remove(item)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, item):
+        self.selected = (item,)
+
+    def selection_remove(self, *items):
+        self.selected = ()
+
+    def event_generate(self, sequence):
+        self.generated.append(sequence)
+        self.bindings[sequence](None)
+
+
+class FakeScrollbar:
+    def __init__(self):
+        self.position = None
+
+    def configure(self, **kwargs):
+        pass
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+class TestVirtualTreeview(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = FakeTree(height=100)  # 5 rows of 20px
+        self.scrollbar = FakeScrollbar()
+        self.selected = []
+        self.table = VirtualTreeview(self.tree, self.scrollbar, lambda row: (f"${row[0]}", row[1]),
+                                     buffer=2, on_select=self.selected.append)
+        self.rows = [(i, str(i)) for i in range(1000)]
+
+    def values(self):
+        return [self.tree.items[item] for item in self.tree.order]
+
+    def test_only_window_is_materialized(self):
+        self.table.set_rows(self.rows)
+        self.assertEqual(len(self.tree.items), 7)
+        self.assertEqual(self.values()[0], ("$0", "0"))
+        self.assertEqual(self.scrollbar.position, (0.0, 0.005))
+        self.table.yview("moveto", "0.5")
+        self.assertEqual(self.values()[0], ("$500", "500"))
+        self.assertEqual(len(self.tree.items), 7)
+
+    def test_set_rows_cost_is_flat(self):
+        self.table.set_rows(self.rows * 20)
+        self.assertEqual(self.tree.item_calls, 7)
+        self.table.set_rows(self.rows[:3])
+        self.assertEqual(len(self.tree.items), 3)
+        self.assertEqual(self.values(), [("$0", "0"), ("$1", "1"), ("$2", "2")])
+
+    def test_unchanged_window_skips_item_calls(self):
+        self.table.set_rows(self.rows)
+        self.tree.item_calls = 0
+        rows = list(self.rows)
+        rows[1] = (999, "1")
+        rows[500] = (998, "500")
+        self.table.set_rows(rows)
+        self.assertEqual(self.tree.item_calls, 1)
+        self.assertFalse(self.table.refresh_keys({"500"}))
+
+    def test_sync_after_a_pick_rewrites_only_shifted_items(self):
+        self.table.set_rows(self.rows)
+        self.assertEqual(self.table.sync(self.rows), {"updated": 0, "inserted": 0, "deleted": 0})
+        # row 4 is drafted and row 900 (off screen) revalued: rows 5-7 move up one item
+        rows = [row for row in self.rows if row[1] != "4"]
+        rows[899] = (1.5, "900")
+        self.assertEqual(self.table.sync(rows), {"updated": 3, "inserted": 0, "deleted": 0})
+        self.assertEqual(self.values()[4], ("$5", "5"))
+
+    def test_selection_follows_row_across_scrolls(self):
+        self.table.set_rows(self.rows)
+        self.table.move_selection(3)
+        self.assertEqual(self.table.selected_key, "0")
+        self.table.move_selection(6)
+        self.assertEqual(self.table.selected_key, "6")
+        # scrolled so row 6 is the last visible row
+        self.assertEqual(self.table.offset, 2)
+        self.assertEqual(self.tree.items[self.tree.selected[0]], ("$6", "6"))
+        self.table.scroll(100)
+        self.assertEqual(self.tree.selected, ())
+        self.table.scroll_to(0)
+        self.assertEqual(self.tree.items[self.tree.selected[0]], ("$6", "6"))
+        self.assertEqual(len(self.selected), 2)
+
+    def test_filtered_rows_keep_selection(self):
+        self.table.set_rows(self.rows)
+        self.table.select("4")
+        self.table.set_rows([row for row in self.rows if "4" in row[1]])
+        self.assertEqual(self.tree.items[self.tree.selected[0]], ("$4", "4"))
+
+
+if __name__ == "__main__":
+    unittest.main()
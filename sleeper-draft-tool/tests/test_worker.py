@@ -0,0 +1,89 @@
+import threading
+import unittest
+from src.sleeper_draft_tool import models, worker
+
+
+def drain_until_done(pipeline, handlers, timeout=5.0):
+    done = threading.Event()
+    handlers = dict(handlers, done=lambda _: done.set() if not pipeline.busy else None)
+    for _ in range(int(timeout / 0.01)):
+        pipeline.drain(handlers)
+        if done.is_set():
+            return True
+        done.wait(0.01)
+    return False
+
+
+class TestRows(unittest.TestCase):
+
+    def test_rows_sorted_and_formatted(self):
+        players = models.AllPlayers(players={
+            "1": models.Player(player_id="1", first_name="Josh", last_name="Allen", team="BUF", position="QB",
+                               projection=380.0, vorp=40.0, teamshare=0.2, stddevs=1.5, raw_value=40.0),
+            "2": models.Player(player_id="2", search_full_name="bijanrobinson", position="RB",
+                               projection=300.0, vorp=80.0, teamshare=0.15, stddevs=2.0, raw_value=30.5),
+            "3": models.Player(player_id="3", fantasy_positions=["WR"], projection=120.0),
+        })
+        rows = worker.build_rows(players)
+        self.assertEqual([row[8] for row in rows], ["2", "1", "3"])
+        self.assertEqual(rows[1][5:8], ("Josh Allen", "BUF", "QB"))
+        self.assertEqual(rows[0][5], "bijanrobinson")
+        self.assertEqual(rows[2][:5], ("", 0.0, 0.0, 0.0, 120.0))
+        self.assertEqual(rows[2][7], "WR")
+        self.assertEqual(worker.format_row(rows[0]),
+                         ("$30.50", "2.00", "0.150", "+80.00", "300.00", "bijanrobinson", "", "RB", "2"))
+        self.assertEqual(worker.format_row(rows[2])[0], "")
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = worker.Pipeline()
+
+    def tearDown(self):
+        self.pipeline.shutdown(wait=True)
+
+    def test_messages_arrive_in_order_on_the_draining_thread(self):
+        seen = []
+
+        def job(post, n):
+            post("status", "working")
+            return n * 2
+
+        self.pipeline.submit(job, 21)
+        self.assertTrue(drain_until_done(self.pipeline, {
+            "status": lambda text: seen.append(("status", text, threading.current_thread())),
+            "result": lambda value: seen.append(("result", value, threading.current_thread())),
+        }))
+        self.assertEqual([entry[:2] for entry in seen], [("status", "working"), ("result", 42)])
+        self.assertTrue(all(entry[2] is threading.current_thread() for entry in seen))
+        self.assertFalse(self.pipeline.busy)
+
+    def test_errors_are_posted(self):
+        errors = []
+
+        def job(post):
+            raise RuntimeError("boom")
+
+        self.pipeline.submit(job)
+        self.assertTrue(drain_until_done(self.pipeline, {"error": errors.append}))
+        self.assertEqual(str(errors[0]), "boom")
+
+    def test_superseded_jobs_are_dropped(self):
+        release = threading.Event()
+        results = []
+
+        def slow(post):
+            release.wait(5)
+            return "old"
+
+        self.pipeline.submit(slow)
+        self.pipeline.submit(lambda post: "new")
+        self.assertTrue(self.pipeline.busy)
+        release.set()
+        self.assertTrue(drain_until_done(self.pipeline, {"result": results.append}))
+        self.assertEqual(results, ["new"])
+
+
+if __name__ == "__main__":
+    unittest.main()